@@ -0,0 +1,31 @@
+"""Add trigram search indexes on todos
+
+Revision ID: 7c1d9e3a4b52
+Revises: 2fe49588d1c2
+Create Date: 2026-10-18 09:12:40.218311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1d9e3a4b52'
+down_revision: Union[str, Sequence[str], None] = '2fe49588d1c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_todos_title_trgm', 'todos', [sa.text('lower(title) gin_trgm_ops')], unique=False, postgresql_using='gin')
+    op.create_index('ix_todos_description_trgm', 'todos', [sa.text('lower(description) gin_trgm_ops')], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todos_description_trgm', table_name='todos')
+    op.drop_index('ix_todos_title_trgm', table_name='todos')
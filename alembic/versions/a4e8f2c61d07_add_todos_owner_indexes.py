@@ -0,0 +1,30 @@
+"""Add owner indexes on todos
+
+Revision ID: a4e8f2c61d07
+Revises: 7c1d9e3a4b52
+Create Date: 2026-10-18 09:47:03.554102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e8f2c61d07'
+down_revision: Union[str, Sequence[str], None] = '7c1d9e3a4b52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_todos_owner_deadline', 'todos', ['owner_id', 'deadline', 'id'], unique=False)
+    op.create_index('ix_todos_owner_completed', 'todos', ['owner_id', 'is_completed'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todos_owner_completed', table_name='todos')
+    op.drop_index('ix_todos_owner_deadline', table_name='todos')
@@ -0,0 +1,28 @@
+"""Mark tombstones left by the archiver
+
+Revision ID: a7c3e5f91b24
+Revises: d5f1a7c9e362
+Create Date: 2026-10-18 22:05:41.208317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5f91b24'
+down_revision: Union[str, Sequence[str], None] = 'd5f1a7c9e362'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('todo_tombstones', sa.Column('is_archived', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('todo_tombstones', 'is_archived')
@@ -0,0 +1,46 @@
+"""Add the todos archive table
+
+Revision ID: b8d2f6e1a934
+Revises: f61b3d8a2c47
+Create Date: 2026-10-18 19:21:47.630518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2f6e1a934'
+down_revision: Union[str, Sequence[str], None] = 'f61b3d8a2c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('todos_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('title', sa.String(length=50), nullable=False),
+    sa.Column('deadline', sa.Date(), nullable=False),
+    sa.Column('description', sa.String(length=100), nullable=False),
+    sa.Column('priority', postgresql.ENUM('very_high', 'high', 'medium', 'low', name='todopriority', create_type=False), nullable=False),
+    sa.Column('is_completed', sa.Boolean(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_todos_archive_owner_deadline', 'todos_archive', ['owner_id', 'deadline', 'id'], unique=False)
+    op.create_index('ix_todos_completed_deadline', 'todos', ['deadline', 'id'], unique=False, postgresql_where=sa.text('is_completed'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todos_completed_deadline', table_name='todos')
+    op.drop_index('ix_todos_archive_owner_deadline', table_name='todos_archive')
+    op.drop_table('todos_archive')
@@ -0,0 +1,28 @@
+"""Add the todo change feed sequence
+
+Revision ID: c3b7d5e9f214
+Revises: a4e8f2c61d07
+Create Date: 2026-10-18 14:12:40.318264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3b7d5e9f214'
+down_revision: Union[str, Sequence[str], None] = 'a4e8f2c61d07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence('todo_change_seq')))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.schema.DropSequence(sa.Sequence('todo_change_seq')))
@@ -0,0 +1,46 @@
+"""Order todo delta sync by writing transaction id
+
+Revision ID: d5f1a7c9e362
+Revises: b8d2f6e1a934
+Create Date: 2026-10-18 21:12:08.415392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f1a7c9e362'
+down_revision: Union[str, Sequence[str], None] = 'b8d2f6e1a934'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CURRENT_XID = sa.text('CAST(CAST(pg_current_xact_id() AS TEXT) AS BIGINT)')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('todos', sa.Column('change_xid', sa.BigInteger(), server_default=CURRENT_XID, nullable=False))
+    op.add_column('todo_tombstones', sa.Column('change_xid', sa.BigInteger(), server_default=CURRENT_XID, nullable=False))
+    op.add_column('todos_archive', sa.Column('change_xid', sa.BigInteger(), server_default=sa.text('0'), nullable=False))
+    op.alter_column('todos_archive', 'change_xid', server_default=None)
+    op.drop_index('ix_todos_owner_updated', table_name='todos')
+    op.create_index('ix_todos_owner_change', 'todos', ['owner_id', 'change_xid', 'id'], unique=False)
+    op.drop_index('ix_todo_tombstones_owner_deleted', table_name='todo_tombstones')
+    op.create_index('ix_todo_tombstones_owner_change', 'todo_tombstones', ['owner_id', 'change_xid', 'id'], unique=False)
+    op.create_index('ix_todo_tombstones_deleted', 'todo_tombstones', ['deleted_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todo_tombstones_deleted', table_name='todo_tombstones')
+    op.drop_index('ix_todo_tombstones_owner_change', table_name='todo_tombstones')
+    op.create_index('ix_todo_tombstones_owner_deleted', 'todo_tombstones', ['owner_id', 'deleted_at', 'id'], unique=False)
+    op.drop_index('ix_todos_owner_change', table_name='todos')
+    op.create_index('ix_todos_owner_updated', 'todos', ['owner_id', 'updated_at', 'id'], unique=False)
+    op.drop_column('todos_archive', 'change_xid')
+    op.drop_column('todo_tombstones', 'change_xid')
+    op.drop_column('todos', 'change_xid')
@@ -0,0 +1,38 @@
+"""Add the todo delta sync index and tombstones table
+
+Revision ID: e2a9c4f7b318
+Revises: c3b7d5e9f214
+Create Date: 2026-10-18 16:05:21.774930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a9c4f7b318'
+down_revision: Union[str, Sequence[str], None] = 'c3b7d5e9f214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_todos_owner_updated', 'todos', ['owner_id', 'updated_at', 'id'], unique=False)
+    op.create_table('todo_tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('todo_id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_todo_tombstones_owner_deleted', 'todo_tombstones', ['owner_id', 'deleted_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todo_tombstones_owner_deleted', table_name='todo_tombstones')
+    op.drop_table('todo_tombstones')
+    op.drop_index('ix_todos_owner_updated', table_name='todos')
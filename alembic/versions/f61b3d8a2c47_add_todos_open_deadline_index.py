@@ -0,0 +1,28 @@
+"""Add a partial deadline index for open todos
+
+Revision ID: f61b3d8a2c47
+Revises: e2a9c4f7b318
+Create Date: 2026-10-18 17:38:56.102447
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f61b3d8a2c47'
+down_revision: Union[str, Sequence[str], None] = 'e2a9c4f7b318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_todos_open_deadline', 'todos', ['deadline', 'id'], unique=False, postgresql_where=sa.text('NOT is_completed'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todos_open_deadline', table_name='todos')
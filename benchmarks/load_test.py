@@ -0,0 +1,308 @@
+"""Mixed-workload load test for the API, run in-process over ASGI.
+
+Boots src.main.app behind httpx.ASGITransport, seeds --users users with
+--todos-per-user todos each, then runs --concurrency workers that pick
+operations by weight until --requests requests have been sent. Prints
+p50/p95/p99 latency and requests per second, per operation and overall,
+as JSON so runs can be diffed.
+
+By default the app's own engine is used (a migrated PostgreSQL database).
+The seeded users and their todos are deleted at the end. Pass a SQLite URL
+to run without PostgreSQL; only the sync stack works there.
+
+    python -m benchmarks.load_test --users 200 --todos-per-user 50 --requests 5000
+    python -m benchmarks.load_test --database-url sqlite:////tmp/load.db --concurrency 4
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from datetime import date, timedelta
+
+import httpx
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from db.config import settings
+from db.database import Base, get_db, sync_engine
+from src.main import app
+from src.core.response_cache import response_cache
+from src.core.security import bcrypt_context, login_rate_limiter
+from src.models.todo_model import Todos, TodoPriority
+from src.models.user_model import Users, UserRole
+from src.services.token_services import create_access_token
+
+
+PASSWORD = "load-test-password"
+
+PRIORITIES = list(TodoPriority)
+
+SEARCH_TERMS = ("report", "call", "review", "plan", "fix", "buy")
+
+WORDS = ("report", "call", "review", "plan", "fix", "buy", "email", "draft", "check", "book")
+
+# operation name -> (default weight, callable(context, client) -> response)
+OPERATIONS = {}
+
+
+def operation(name: str, weight: int):
+    def register(func):
+        OPERATIONS[name] = (weight, func)
+        return func
+
+    return register
+
+
+@operation("login", 1)
+async def login(context, client):
+    user = random.choice(context["users"])
+
+    return await client.post("/auth/token", data={"username": user["username"], "password": PASSWORD})
+
+
+@operation("list_own_todos", 10)
+async def list_own_todos(context, client):
+    user = random.choice(context["users"])
+
+    return await client.get(f"/todos/users/{user['id']}/todos", headers=user["headers"])
+
+
+@operation("create_todo", 3)
+async def create_todo(context, client):
+    user = random.choice(context["users"])
+    body = {
+        "title": f"load {uuid.uuid4().hex[:20]}",
+        "deadline": str(date.today() + timedelta(days=random.randint(0, 365))),
+        "description": random.choice(WORDS),
+        "priority": random.choice(PRIORITIES).value,
+        "is_completed": False,
+    }
+
+    return await client.post("/todos", json=body, headers=user["headers"])
+
+
+@operation("admin_search", 3)
+async def admin_search(context, client):
+    return await client.get("/users/todos/search", params={"title": random.choice(SEARCH_TERMS)}, headers=context["admin"])
+
+
+@operation("admin_list_todos", 2)
+async def admin_list_todos(context, client):
+    return await client.get("/users/todos", headers=context["admin"])
+
+
+@operation("admin_list_users", 1)
+async def admin_list_users(context, client):
+    return await client.get("/users/users", headers=context["admin"])
+
+
+def user_headers(username: str, user_id: int, role: UserRole) -> dict:
+    token = create_access_token(username, user_id, role, timedelta(hours=2))
+
+    return {"Authorization": f"Bearer {token}"}
+
+
+def seed(session_factory, prefix: str, users: int, todos_per_user: int, bcrypt_rounds: int) -> dict:
+    password_hash = bcrypt_context.copy(bcrypt__rounds=bcrypt_rounds).hash(PASSWORD)
+
+    with session_factory() as db:
+        user_rows = [
+            {
+                "username": f"{prefix}{index:06d}",
+                "first_name": "Load",
+                "last_name": "Test",
+                "date_of_birth": date(1990, 1, 1),
+                "email_address": f"{prefix}{index}@example.com",
+                "password_hash": password_hash,
+                "role": UserRole.admin if index == 0 else UserRole.user,
+                "is_active": True,
+            }
+            for index in range(users + 1)
+        ]
+        db.execute(insert(Users), user_rows)
+
+        seeded = db.execute(
+            select(Users.id, Users.username, Users.role).filter(Users.username.startswith(prefix)).order_by(Users.id)
+        ).all()
+
+        todo_rows = []
+
+        for row in seeded:
+            for index in range(todos_per_user):
+                todo_rows.append({
+                    "title": f"{random.choice(WORDS)} {row.id}-{index}",
+                    "deadline": date.today() + timedelta(days=index % 365),
+                    "description": " ".join(random.sample(WORDS, 3)),
+                    "priority": random.choice(PRIORITIES),
+                    "is_completed": index % 4 == 0,
+                    "owner_id": row.id,
+                })
+
+            if len(todo_rows) >= 10_000:
+                db.execute(insert(Todos), todo_rows)
+                todo_rows = []
+
+        if todo_rows:
+            db.execute(insert(Todos), todo_rows)
+
+        db.commit()
+
+    admin, *regular = seeded
+
+    return {
+        "admin": user_headers(admin.username, admin.id, admin.role),
+        "users": [
+            {"id": row.id, "username": row.username, "headers": user_headers(row.username, row.id, row.role)}
+            for row in regular
+        ],
+        "user_ids": [row.id for row in seeded],
+    }
+
+
+def cleanup(session_factory, user_ids: list[int]):
+    with session_factory() as db:
+        db.execute(delete(Todos).filter(Todos.owner_id.in_(user_ids)))
+        db.execute(delete(Users).filter(Users.id.in_(user_ids)))
+        db.commit()
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+
+    return sorted_values[index]
+
+
+def summarize(samples: list[tuple[float, int]], elapsed: float) -> dict:
+    latencies = sorted(latency for latency, _ in samples)
+
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for _, status in samples if status >= 500),
+        "status_codes": {str(code): sum(1 for _, s in samples if s == code) for code in sorted({s for _, s in samples})},
+        "rps": len(samples) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+    }
+
+
+async def run(context, weights: dict, total_requests: int, concurrency: int) -> dict:
+    names = [name for name, weight in weights.items() if weight > 0]
+    name_weights = [weights[name] for name in names]
+    samples = {name: [] for name in names}
+    remaining = total_requests
+
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+        async def worker():
+            nonlocal remaining
+
+            while remaining > 0:
+                remaining -= 1
+                name = random.choices(names, name_weights)[0]
+
+                started = time.perf_counter()
+                response = await OPERATIONS[name][1](context, client)
+                samples[name].append(((time.perf_counter() - started) * 1000, response.status_code))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    every = [sample for values in samples.values() for sample in values]
+
+    return {
+        "elapsed_s": elapsed,
+        "overall": summarize(every, elapsed),
+        "operations": {name: summarize(values, elapsed) for name, values in samples.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None, help="defaults to the app's configured database")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--todos-per-user", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--bcrypt-rounds", type=int, default=settings.BCRYPT_ROUNDS)
+    parser.add_argument("--no-response-cache", action="store_true")
+    parser.add_argument(
+        "--login-rate-limit", action="store_true",
+        help="keep the login rate limiter on; all simulated clients share one IP"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--weight", action="append", default=[], metavar="NAME=N",
+        help=f"override an operation weight; operations: {', '.join(OPERATIONS)}"
+    )
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+
+    weights = {name: weight for name, (weight, _) in OPERATIONS.items()}
+
+    for override in args.weight:
+        name, _, value = override.partition("=")
+
+        if name not in weights:
+            parser.error(f"unknown operation {name!r}")
+
+        weights[name] = int(value)
+
+    if args.database_url:
+        if settings.DB_ASYNC:
+            parser.error("--database-url only overrides the sync stack; unset DB_ASYNC")
+
+        sqlite = args.database_url.startswith("sqlite")
+        engine = create_engine(args.database_url, connect_args={"check_same_thread": False, "timeout": 30} if sqlite else {})
+        Base.metadata.create_all(engine)
+    else:
+        engine = sync_engine
+
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    def override_get_db():
+        with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    if args.no_response_cache:
+        response_cache.enabled = False
+
+    login_rate_limiter.enabled = args.login_rate_limit
+
+    prefix = f"lt{uuid.uuid4().hex[:6]}_"
+    context = seed(session_factory, prefix, args.users, args.todos_per_user, args.bcrypt_rounds)
+
+    try:
+        result = asyncio.run(run(context, weights, args.requests, args.concurrency))
+    finally:
+        cleanup(session_factory, context["user_ids"])
+        app.dependency_overrides.pop(get_db, None)
+
+    print(json.dumps({
+        "config": {
+            "database": engine.url.render_as_string(hide_password=True),
+            "users": args.users,
+            "todos_per_user": args.todos_per_user,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "bcrypt_rounds": args.bcrypt_rounds,
+            "response_cache": not args.no_response_cache,
+            "login_rate_limit": args.login_rate_limit,
+            "weights": weights,
+        },
+        **result,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Search latency against table size for TodoRepository.search_todo.
+
+Grows the todos table step by step inside one transaction, measures the
+substring search at every size and rolls everything back at the end, so
+it can run against a migrated development database without leaving data
+behind.
+
+    python -m benchmarks.search_benchmark --sizes 10000 100000 1000000
+"""
+import argparse
+import json
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from db.database import sync_engine
+from src.repositories.todos_repository import TodoRepository, search_todo_query
+from src.schemas.todos_schemas import TodoSearch
+from tests.seed import SEED_USERS, SEED_TODOS, explain
+
+
+SEARCHES = (
+    TodoSearch(title="a1b2"),
+    TodoSearch(title="ffe"),
+    TodoSearch(description="c0de"),
+    TodoSearch(title="9", is_completed=False),
+)
+
+
+def measure(db: Session, search: TodoSearch, repeat: int) -> dict:
+    timings = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        TodoRepository.search_todo(db, search, limit=50)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    plan = explain(db, search_todo_query(search).limit(51))
+
+    return {
+        "search": search.model_dump(exclude_none=True),
+        "median_ms": statistics.median(timings),
+        "max_ms": max(timings),
+        "uses_trigram_index": any("_trgm" in line for line in plan),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    results = []
+
+    with sync_engine.connect() as connection:
+        transaction = connection.begin()
+        db = Session(bind=connection)
+
+        try:
+            user_ids = connection.execute(text(SEED_USERS), {"users": args.users}).scalars().all()
+            loaded = 0
+
+            for size in sorted(args.sizes):
+                connection.execute(
+                    text(SEED_TODOS),
+                    {"first_user": min(user_ids), "users": args.users, "start": loaded + 1, "stop": size}
+                )
+                connection.execute(text("ANALYZE todos"))
+                loaded = size
+
+                results.append({
+                    "rows": size,
+                    "searches": [measure(db, search, args.repeat) for search in SEARCHES],
+                })
+
+        finally:
+            db.close()
+            transaction.rollback()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
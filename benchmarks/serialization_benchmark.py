@@ -0,0 +1,120 @@
+"""List serialization cost: ORM entities + response_model vs the fast JSON path.
+
+For each list size, loads one user's todos two ways and times the load and
+the encoding separately:
+
+- orm: whole Todos entities validated through Page[TodoResponse] and
+  encoded by JSONResponse, which is what FastAPI does with a response_model;
+- fast: a TODO_RESPONSE_COLUMNS projection turned into plain dicts and
+  encoded by ORJSONResponse, which is what FAST_JSON_RESPONSES enables.
+
+The seeded rows are rolled back at the end.
+
+    python -m benchmarks.serialization_benchmark --sizes 1000 10000
+"""
+import argparse
+import json
+import statistics
+import time
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from db.database import sync_engine
+from src.models.todo_model import Todos
+from src.repositories.todos_repository import TODO_ORDER_BY_DEADLINE, TODO_RESPONSE_COLUMNS
+from src.schemas.pagination_schemas import Page
+from src.schemas.todos_schemas import TodoResponse
+from tests.seed import SEED_USERS, SEED_TODOS
+
+
+PAGE_ADAPTER = TypeAdapter(Page[TodoResponse])
+
+
+def orm_path(db: Session, user_id: int, size: int):
+    query = select(Todos).filter(Todos.owner_id == user_id).order_by(*TODO_ORDER_BY_DEADLINE).limit(size)
+    items = db.execute(query).scalars().all()
+
+    def encode():
+        page = PAGE_ADAPTER.validate_python({"items": items, "next_cursor": None}, from_attributes=True)
+
+        return JSONResponse(PAGE_ADAPTER.dump_python(page, mode="json")).body
+
+    return encode
+
+
+def fast_path(db: Session, user_id: int, size: int):
+    query = select(*TODO_RESPONSE_COLUMNS).filter(Todos.owner_id == user_id).order_by(*TODO_ORDER_BY_DEADLINE).limit(size)
+    items = [row._asdict() for row in db.execute(query)]
+
+    def encode():
+        return ORJSONResponse({"items": items, "next_cursor": None}).body
+
+    return encode
+
+
+def measure(db: Session, path, user_id: int, size: int, repeat: int) -> dict:
+    load_ms, encode_ms = [], []
+
+    for _ in range(repeat):
+        db.expunge_all()
+
+        started = time.perf_counter()
+        encode = path(db, user_id, size)
+        loaded = time.perf_counter()
+        body = encode()
+        finished = time.perf_counter()
+
+        load_ms.append((loaded - started) * 1000)
+        encode_ms.append((finished - loaded) * 1000)
+
+    return {
+        "load_median_ms": statistics.median(load_ms),
+        "encode_median_ms": statistics.median(encode_ms),
+        "total_median_ms": statistics.median(a + b for a, b in zip(load_ms, encode_ms)),
+        "bytes": len(body),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    results = []
+
+    with sync_engine.connect() as connection:
+        transaction = connection.begin()
+        db = Session(bind=connection)
+
+        try:
+            user_id = connection.execute(text(SEED_USERS), {"users": 1}).scalar_one()
+            connection.execute(
+                text(SEED_TODOS),
+                {"first_user": user_id, "users": 1, "start": 1, "stop": max(args.sizes)}
+            )
+            connection.execute(text("ANALYZE todos"))
+
+            for size in sorted(args.sizes):
+                orm = measure(db, orm_path, user_id, size, args.repeat)
+                fast = measure(db, fast_path, user_id, size, args.repeat)
+
+                results.append({
+                    "rows": size,
+                    "orm": orm,
+                    "fast": fast,
+                    "speedup": orm["total_median_ms"] / fast["total_median_ms"],
+                })
+
+        finally:
+            db.close()
+            transaction.rollback()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Optional
 
 class Settings(BaseSettings):
     DB_HOST: str
@@ -7,13 +9,92 @@ class Settings(BaseSettings):
     DB_PSSW: str
     DB_NAME: str
 
+    DB_ASYNC: bool = False
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_PRE_PING: bool = True
+
+    SQL_INSTRUMENTATION: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+
+    METRICS_ENABLED: bool = True
+
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
+    JWT_CACHE_SIZE: int = 10000
+
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_KEYS: int = 100000
+    # A bucket below one token or with no refill would lock its key out for
+    # good (and divide by zero computing Retry-After). Use
+    # LOGIN_RATE_LIMIT_ENABLED to turn limiting off.
+    LOGIN_IP_BURST: int = Field(20, ge=1)
+    LOGIN_IP_PER_MINUTE: float = Field(60, gt=0)
+    LOGIN_USERNAME_BURST: int = Field(5, ge=1)
+    LOGIN_USERNAME_PER_MINUTE: float = Field(5, gt=0)
+    # Reverse proxies in front of the app that append to LOGIN_FORWARDED_HEADER;
+    # 0 keys the IP bucket on the connecting address.
+    LOGIN_TRUSTED_PROXY_HOPS: int = 0
+    LOGIN_FORWARDED_HEADER: str = "X-Forwarded-For"
+
+    # Number of worker processes serving the app (the uvicorn/gunicorn setting).
+    WEB_CONCURRENCY: int = 1
+
+    # Not safe for multi-worker deployments that need read-your-writes across
+    # workers: with RESPONSE_CACHE_BACKEND=postgres another worker may serve a
+    # stale entry until the write's NOTIFY reaches it (see the README).
+    RESPONSE_CACHE_ENABLED: bool = False
+    RESPONSE_CACHE_BACKEND: str = "local"
+    RESPONSE_CACHE_SIZE: int = 10000
+    RESPONSE_CACHE_TTL: Optional[float] = 300
+
+    FAST_JSON_RESPONSES: bool = False
+
+    CHANGE_FEED_ENABLED: bool = True
+    CHANGE_FEED_BRIDGE: bool = False
+    CHANGE_FEED_BUFFER: int = 10000
+    CHANGE_FEED_QUEUE: int = 1000
+    CHANGE_FEED_HEARTBEAT: float = 15
+    CHANGE_FEED_AUTH_TIMEOUT: float = 10
+
+    # Delta sync watermarks older than this get 410 and a full resync; the
+    # pruner keeps tombstones a day longer.
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30
+    TOMBSTONE_PRUNE_ENABLED: bool = True
+    TOMBSTONE_PRUNE_BATCH_SIZE: int = 1000
+    TOMBSTONE_PRUNE_INTERVAL: float = 3600
+
+    REMINDERS_ENABLED: bool = False
+    REMINDER_SINK: str = "log"
+    REMINDER_SINK_PATH: str = "reminders.jsonl"
+    REMINDER_LEAD_DAYS: int = 1
+    REMINDER_HEAP_SIZE: int = 1000
+    REMINDER_BATCH_SIZE: int = 100
+    REMINDER_INTERVAL: float = 60
+    REMINDER_REFRESH_INTERVAL: float = 900
+
+    ARCHIVE_ENABLED: bool = False
+    ARCHIVE_AFTER_DAYS: int = 90
+    ARCHIVE_BATCH_SIZE: int = 1000
+    ARCHIVE_BATCH_PAUSE: float = 0.1
+    ARCHIVE_INTERVAL: float = 3600
+
+    BCRYPT_ROUNDS: int = 12
+    HASH_WORKERS: Optional[int] = None
+    HASH_QUEUE_LIMIT: int = 64
+    HASH_BENCHMARK_ON_STARTUP: bool = True
 
     @property
     def DATABASE_URL_psycopg(self):
         return f"postgresql+psycopg://{self.DB_USER}:{self.DB_PSSW}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def DATABASE_URL_asyncpg(self):
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PSSW}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
     model_config = SettingsConfigDict(env_file=".env")
 
 settings = Settings()
\ No newline at end of file
@@ -1,17 +1,46 @@
 from fastapi import Depends
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
 
 from typing import Annotated
 
 from db.config import settings
+from db.pool import InstrumentedQueuePool, InstrumentedAsyncQueuePool
+from db.query_stats import instrument_engine
 
 
-sync_engine = create_engine(url=settings.DATABASE_URL_psycopg)
+pool_options = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
+sync_engine = create_engine(url=settings.DATABASE_URL_psycopg, poolclass=InstrumentedQueuePool, **pool_options)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
 
+# The asyncpg engine and its pool only exist in async mode. The sync engine is
+# always built: background jobs and the LISTEN connections use it.
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC:
+    async_engine = create_async_engine(url=settings.DATABASE_URL_asyncpg, poolclass=InstrumentedAsyncQueuePool, **pool_options)
+
+    # Objects returned from async routes are serialized after commit, where a lazy
+    # reload of expired attributes is not possible.
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+if settings.SQL_INSTRUMENTATION:
+    instrument_engine(sync_engine, settings.SLOW_QUERY_THRESHOLD_MS / 1000)
+
+    if async_engine is not None:
+        instrument_engine(async_engine.sync_engine, settings.SLOW_QUERY_THRESHOLD_MS / 1000)
+
 
 class Base(DeclarativeBase):
     pass
@@ -20,5 +49,12 @@ def get_db():
     with SessionLocal() as db:
         yield db
 
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
     
-db_dependency = Annotated[Session, Depends(get_db)]
\ No newline at end of file
+db_dependency = Annotated[Session, Depends(get_db)]
+
+async_db_dependency = Annotated[AsyncSession, Depends(get_async_db)]
\ No newline at end of file
@@ -0,0 +1,82 @@
+import time
+from threading import Lock
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+
+CHECKOUT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = Lock()
+
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.buckets = [0] * len(CHECKOUT_BUCKETS)
+
+
+    def timed_checkout(self, checkout):
+        started = time.perf_counter()
+
+        try:
+            connection = checkout()
+        except PoolTimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            raise
+
+        self.observe(time.perf_counter() - started)
+
+        return connection
+
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+            for index, bound in enumerate(CHECKOUT_BUCKETS):
+                if seconds <= bound:
+                    self.buckets[index] += 1
+                    break
+
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            cumulative, histogram = 0, {}
+
+            for bound, count in zip(CHECKOUT_BUCKETS, self.buckets):
+                cumulative += count
+                histogram["+Inf" if bound == float("inf") else str(bound)] = cumulative
+
+            return {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "checkout_latency_histogram": histogram,
+            }
+
+
+# The metrics live on the class so they survive Pool.recreate() on dispose.
+class InstrumentedQueuePool(QueuePool):
+    metrics = PoolMetrics()
+
+    def _do_get(self):
+        return self.metrics.timed_checkout(super()._do_get)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+    def _do_get(self):
+        return self.metrics.timed_checkout(super()._do_get)
\ No newline at end of file
@@ -0,0 +1,106 @@
+import logging
+import time
+from contextvars import ContextVar
+from threading import Lock
+
+from sqlalchemy import event
+
+
+logger = logging.getLogger(__name__)
+
+
+class RequestQueryStats:
+    def __init__(self):
+        self.statements = 0
+        self.seconds_total = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement = None
+
+
+    def record(self, statement: str, seconds: float):
+        self.statements += 1
+        self.seconds_total += seconds
+
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+
+    def server_timing(self) -> str:
+        return (
+            f'db;desc="{self.statements} queries";dur={self.seconds_total * 1000:.2f}, '
+            f'db-slowest;dur={self.slowest_seconds * 1000:.2f}'
+        )
+
+
+class RouteQueryStats:
+    def __init__(self):
+        self._lock = Lock()
+        self._routes = {}
+
+
+    def observe(self, route: str, stats: RequestQueryStats):
+        with self._lock:
+            entry = self._routes.setdefault(route, {
+                "requests": 0,
+                "statements_total": 0,
+                "statements_max": 0,
+                "db_seconds_total": 0.0,
+                "slowest_seconds": 0.0,
+                "slowest_statement": None,
+            })
+
+            entry["requests"] += 1
+            entry["statements_total"] += stats.statements
+            entry["statements_max"] = max(entry["statements_max"], stats.statements)
+            entry["db_seconds_total"] += stats.seconds_total
+
+            if stats.slowest_seconds > entry["slowest_seconds"]:
+                entry["slowest_seconds"] = stats.slowest_seconds
+                entry["slowest_statement"] = stats.slowest_statement
+
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                route: dict(
+                    entry,
+                    statements_avg=entry["statements_total"] / entry["requests"],
+                    db_seconds_avg=entry["db_seconds_total"] / entry["requests"],
+                )
+                for route, entry in self._routes.items()
+            }
+
+
+    def clear(self):
+        with self._lock:
+            self._routes.clear()
+
+
+# The middleware puts a fresh RequestQueryStats here for every request. Sync
+# endpoints run in the threadpool with a copy of the context, which still
+# points at the same object, so statements from either stack are counted.
+current_query_stats: ContextVar[RequestQueryStats | None] = ContextVar("current_query_stats", default=None)
+
+route_query_stats = RouteQueryStats()
+
+
+# The start time lives on the statement's execution context, so a statement
+# that raises (and never reaches after_cursor_execute) leaves nothing behind.
+def instrument_engine(engine, slow_query_seconds: float):
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - context._query_started
+
+        stats = current_query_stats.get()
+
+        if stats is not None:
+            stats.record(statement, seconds)
+
+        if seconds >= slow_query_seconds:
+            logger.warning("Slow query (%.1f ms): %s", seconds * 1000, statement)
\ No newline at end of file
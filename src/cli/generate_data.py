@@ -0,0 +1,214 @@
+"""Generate synthetic users and todos straight into the database.
+
+Users get consecutive ids after the current maximum. Each user gets a
+Pareto-distributed number of todos (mean --todos-per-user, heavy tail
+controlled by --skew), with realistic deadlines, priorities and text.
+Worker processes generate disjoint id ranges and load them with COPY, so
+the run scales with --workers. Titles carry the owner id and a sequence
+number, which keeps uix_title_deadline satisfied without lookups.
+
+Meant for an otherwise idle development database: the users id sequence is
+moved past the generated ids at the end.
+
+    python -m src.cli.generate_data --users 1000000 --todos-per-user 20 --workers 8
+"""
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import func, select, text
+
+from db.config import settings
+from db.database import SessionLocal, sync_engine
+from src.core.security import bcrypt_context
+from src.models.todo_model import Todos, TodoPriority
+from src.models.user_model import Users, UserRole
+
+import src.models
+
+
+USER_COLUMNS = (
+    "id", "username", "first_name", "last_name", "date_of_birth",
+    "email_address", "password_hash", "role", "is_active",
+)
+
+TODO_COLUMNS = ("title", "deadline", "description", "priority", "is_completed", "owner_id")
+
+FIRST_NAMES = (
+    "Olivia", "Liam", "Emma", "Noah", "Amelia", "Oliver", "Sophia", "Elijah", "Mia", "Lucas",
+    "Ava", "Mateo", "Isla", "Leo", "Aria", "Ethan", "Nora", "Omar", "Yuki", "Priya",
+)
+
+LAST_NAMES = (
+    "Smith", "Garcia", "Kim", "Nguyen", "Muller", "Rossi", "Silva", "Khan", "Ivanova", "Cohen",
+    "Brown", "Tanaka", "Okafor", "Novak", "Larsen", "Dubois", "Haddad", "Santos", "Patel", "Moreau",
+)
+
+VERBS = ("Call", "Email", "Review", "Plan", "Fix", "Buy", "Draft", "Book", "Clean", "Prepare", "Pay", "Update")
+
+OBJECTS = (
+    "quarterly report", "dentist", "groceries", "team meeting", "flight", "car service",
+    "tax return", "birthday gift", "budget", "garden", "presentation", "insurance",
+)
+
+DETAILS = (
+    "before the deadline", "with the team", "ask for a quote", "check last year's notes",
+    "bring documents", "compare options", "confirm by phone", "split into smaller steps",
+)
+
+# Roughly how people file their todos: mostly low or medium.
+PRIORITY_WEIGHTS = (
+    (TodoPriority.low, 35),
+    (TodoPriority.medium, 35),
+    (TodoPriority.high, 20),
+    (TodoPriority.very_high, 10),
+)
+
+
+def todos_for_user(rng: random.Random, mean: float, skew: float, cap: int) -> int:
+    scale = mean * (skew - 1) / skew
+
+    return min(int(scale * rng.paretovariate(skew)), cap)
+
+
+def user_row(rng: random.Random, user_id: int, tag: str, password_hash: str, admin_ratio: float) -> tuple:
+    username = f"g{tag}_{user_id}"
+
+    return (
+        user_id,
+        username,
+        rng.choice(FIRST_NAMES),
+        rng.choice(LAST_NAMES),
+        date(1950, 1, 1) + timedelta(days=rng.randrange(365 * 58)),
+        f"{username}@example.com",
+        password_hash,
+        (UserRole.admin if rng.random() < admin_ratio else UserRole.user).name,
+        rng.random() > 0.02,
+    )
+
+
+def todo_row(rng: random.Random, owner_id: int, sequence: int, today: date, priorities, weights) -> tuple:
+    deadline = today + timedelta(days=int(rng.triangular(-90, 365, 14)))
+    overdue = deadline < today
+
+    return (
+        f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} #{owner_id}.{sequence}",
+        deadline,
+        rng.choice(DETAILS),
+        rng.choices(priorities, weights)[0].name,
+        rng.random() < (0.8 if overdue else 0.15),
+    )
+
+
+def _init_worker():
+    # Connections inherited from the parent must not be shared with it.
+    sync_engine.dispose(close=False)
+
+
+def generate_chunk(job: dict) -> tuple[int, int]:
+    rng = random.Random(job["seed"])
+    today = date.today()
+    priorities = [priority for priority, _ in PRIORITY_WEIGHTS]
+    weights = [weight for _, weight in PRIORITY_WEIGHTS]
+    user_ids = range(job["first_id"], job["last_id"] + 1)
+    todos_written = 0
+
+    connection = sync_engine.raw_connection()
+
+    try:
+        driver_connection = connection.driver_connection
+
+        with driver_connection.cursor() as cursor:
+            cursor.execute("SET synchronous_commit = off")
+
+            with cursor.copy(f"COPY {Users.__tablename__} ({', '.join(USER_COLUMNS)}) FROM STDIN") as copy:
+                for user_id in user_ids:
+                    copy.write_row(user_row(rng, user_id, job["tag"], job["password_hash"], job["admin_ratio"]))
+
+            with cursor.copy(f"COPY {Todos.__tablename__} ({', '.join(TODO_COLUMNS)}) FROM STDIN") as copy:
+                for user_id in user_ids:
+                    for sequence in range(todos_for_user(rng, job["todos_per_user"], job["skew"], job["max_todos"])):
+                        copy.write_row(todo_row(rng, user_id, sequence, today, priorities, weights) + (user_id,))
+                        todos_written += 1
+
+        connection.commit()
+    finally:
+        connection.close()
+
+    return len(user_ids), todos_written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, required=True)
+    parser.add_argument("--todos-per-user", type=float, default=20, help="mean of the per-user distribution")
+    parser.add_argument("--skew", type=float, default=1.8, help="Pareto shape; lower is more skewed, must be > 1")
+    parser.add_argument("--max-todos", type=int, default=5000, help="cap for a single user")
+    parser.add_argument("--admin-ratio", type=float, default=0.001)
+    parser.add_argument("--password", default="password123", help="shared by all generated users")
+    parser.add_argument("--bcrypt-rounds", type=int, default=settings.BCRYPT_ROUNDS)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="users per worker job")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.skew <= 1:
+        parser.error("--skew must be greater than 1")
+
+    with SessionLocal() as db:
+        first_id = (db.execute(select(func.max(Users.id))).scalar() or 0) + 1
+
+    password_hash = bcrypt_context.copy(bcrypt__rounds=args.bcrypt_rounds).hash(args.password)
+    tag = uuid.uuid4().hex[:4]
+    last_id = first_id + args.users - 1
+
+    jobs = [
+        {
+            "seed": args.seed * 1_000_003 + start,
+            "first_id": start,
+            "last_id": min(start + args.chunk_size - 1, last_id),
+            "tag": tag,
+            "password_hash": password_hash,
+            "admin_ratio": args.admin_ratio,
+            "todos_per_user": args.todos_per_user,
+            "skew": args.skew,
+            "max_todos": args.max_todos,
+        }
+        for start in range(first_id, last_id + 1, args.chunk_size)
+    ]
+
+    started = time.perf_counter()
+    users = todos = 0
+
+    with multiprocessing.Pool(args.workers, initializer=_init_worker) as pool:
+        for chunk_users, chunk_todos in pool.imap_unordered(generate_chunk, jobs):
+            users += chunk_users
+            todos += chunk_todos
+
+    with SessionLocal() as db:
+        db.execute(
+            text("SELECT setval(pg_get_serial_sequence('users', 'id'), (SELECT max(id) FROM users))")
+        )
+        db.commit()
+
+    seconds = time.perf_counter() - started
+
+    json.dump({
+        "users": users,
+        "todos": todos,
+        "first_user_id": first_id,
+        "last_user_id": last_id,
+        "username_prefix": f"g{tag}_",
+        "seconds": seconds,
+        "rows_per_second": (users + todos) / seconds if seconds else 0.0,
+    }, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
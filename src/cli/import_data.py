@@ -0,0 +1,45 @@
+"""Bulk-load todos or users from a CSV or NDJSON file.
+
+    python -m src.cli.import_data todos todos.csv
+    python -m src.cli.import_data users users.ndjson
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from db.database import SessionLocal
+from src.core.security import bcrypt_context
+from src.services.import_services import ImportService
+
+import src.models
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("kind", choices=("todos", "users"))
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", dest="import_format", choices=("csv", "ndjson"))
+    parser.add_argument("--hash-workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    import_format = args.import_format or ("csv" if args.path.suffix.lower() == ".csv" else "ndjson")
+
+    with SessionLocal() as db, args.path.open(encoding="utf-8", newline="") as stream:
+        if args.kind == "todos":
+            report = ImportService.import_todos(db, stream, import_format)
+        else:
+            with ThreadPoolExecutor(max_workers=args.hash_workers) as executor:
+                def hash_passwords(passwords):
+                    return list(executor.map(bcrypt_context.hash, passwords))
+
+                report = ImportService.import_users(db, stream, import_format, hash_passwords)
+
+    json.dump(report, sys.stdout, indent=2, default=str)
+    print()
+
+
+if __name__ == "__main__":
+    main()
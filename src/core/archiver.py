@@ -0,0 +1,95 @@
+import logging
+import threading
+from datetime import date, timedelta
+
+from db.config import settings
+from src.core.change_feed import record_change
+from src.core.response_cache import response_cache, todos_namespace
+from src.repositories.todos_repository import TodoRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+# Moves completed todos whose deadline is more than `archive_after_days` old
+# into todos_archive. Each batch is its own short transaction, with a pause
+# in between, so row locks are held briefly and normal traffic interleaves.
+# Sync clients and feed subscribers are told with an "archived" tombstone and
+# change event, written in the same transaction as the move, so they can drop
+# the todo from live lists without treating it as deleted.
+class TodoArchiver:
+    def __init__(self, session_factory, archive_after_days: int, batch_size: int, batch_pause: float, interval: float):
+        self.session_factory = session_factory
+        self.archive_after_days = archive_after_days
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+        self.interval = interval
+
+        self.archived = 0
+
+        self._stop = threading.Event()
+        self._thread = None
+
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="todo-archiver", daemon=True)
+        self._thread.start()
+
+
+    def stop(self):
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+    def run_once(self, today: date | None = None) -> int:
+        cutoff = (today or date.today()) - timedelta(days=self.archive_after_days)
+        archived = 0
+
+        while not self._stop.is_set():
+            with self.session_factory() as db:
+                batch = TodoRepository.archive_completed_todos(db, cutoff, self.batch_size)
+
+                for todo in batch:
+                    record_change(db, "archived", todo.owner_id, todo.id)
+
+                db.commit()
+
+            if batch:
+                owner_ids = {todo.owner_id for todo in batch}
+                response_cache.invalidate(*(todos_namespace(owner_id) for owner_id in owner_ids), todos_namespace())
+
+            archived += len(batch)
+
+            if len(batch) < self.batch_size:
+                break
+
+            self._stop.wait(self.batch_pause)
+
+        self.archived += archived
+
+        return archived
+
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                archived = self.run_once()
+
+                if archived:
+                    logger.info("Archived %s todos", archived)
+            except Exception:
+                logger.exception("Todo archiving failed")
+
+            self._stop.wait(self.interval)
+
+
+def create_todo_archiver(session_factory) -> TodoArchiver:
+    return TodoArchiver(
+        session_factory,
+        archive_after_days=settings.ARCHIVE_AFTER_DAYS,
+        batch_size=settings.ARCHIVE_BATCH_SIZE,
+        batch_pause=settings.ARCHIVE_BATCH_PAUSE,
+        interval=settings.ARCHIVE_INTERVAL,
+    )
\ No newline at end of file
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict, deque
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from db.config import settings
+from src.schemas.todos_schemas import TodoResponse
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "todo_changes"
+
+PENDING_KEY = "pending_todo_changes"
+
+# Sent instead of events when the requested position is no longer buffered or
+# the subscriber fell behind; the client has to reload its list.
+RESET = {"op": "reset"}
+
+NOTIFY = text(
+    "SELECT pg_notify(:channel, jsonb_set(CAST(:event AS jsonb), '{seq}', to_jsonb(nextval('todo_change_seq')))::text)"
+)
+
+
+class Subscription:
+    def __init__(self, broker, owner_id: int, loop, queue_size: int):
+        self.broker = broker
+        self.owner_id = owner_id
+
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=queue_size)
+
+
+    # Called with the broker lock held, from any thread.
+    def push(self, change: dict):
+        self._loop.call_soon_threadsafe(self._put, change)
+
+
+    def _put(self, change: dict):
+        if self._queue.full():
+            while not self._queue.empty():
+                self._queue.get_nowait()
+
+            change = RESET
+
+        self._queue.put_nowait(change)
+
+
+    async def get(self, timeout: float) -> dict | None:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+# Fans committed todo changes out to the subscribers of their owner. Events
+# carry a sequence number and the last buffer_size events are kept, so a
+# reconnecting client can pass the last seq it saw and get what it missed.
+class ChangeBroker:
+    def __init__(self, buffer_size: int, queue_size: int):
+        self.queue_size = queue_size
+
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._buffer = deque(maxlen=buffer_size)
+        self._subscribers = defaultdict(set)
+        self._listeners = []
+
+
+    # Listeners see every owner's changes (and RESET) synchronously, with the
+    # broker lock held; they must not block.
+    def add_listener(self, listener):
+        with self._lock:
+            self._listeners.append(listener)
+
+
+    def remove_listener(self, listener):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+
+    def publish(self, changes: list[dict]):
+        with self._lock:
+            for change in changes:
+                # Bridged events already carry a seq from the database sequence.
+                if change.get("seq") is None:
+                    change["seq"] = self._seq + 1
+
+                self._seq = change["seq"]
+                self._buffer.append(change)
+
+                for subscription in self._subscribers.get(change["owner_id"], ()):
+                    subscription.push(change)
+
+                for listener in self._listeners:
+                    listener(change)
+
+
+    def reset_all(self):
+        with self._lock:
+            self._buffer.clear()
+
+            for subscriptions in self._subscribers.values():
+                for subscription in subscriptions:
+                    subscription.push(RESET)
+
+            for listener in self._listeners:
+                listener(RESET)
+
+
+    def subscribe(self, owner_id: int, last_seq: int | None = None) -> Subscription:
+        subscription = Subscription(self, owner_id, asyncio.get_running_loop(), self.queue_size)
+
+        with self._lock:
+            if last_seq is not None:
+                for change in self._missed(owner_id, last_seq):
+                    subscription._put(change)
+
+            self._subscribers[owner_id].add(subscription)
+
+        return subscription
+
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscriptions = self._subscribers.get(subscription.owner_id)
+
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+
+                if not subscriptions:
+                    del self._subscribers[subscription.owner_id]
+
+
+    # Replays by buffer position rather than by comparing seq values: with the
+    # LISTEN/NOTIFY bridge seqs are taken before commit, so commit order (the
+    # order every worker receives them in) can differ slightly from seq order.
+    def _missed(self, owner_id: int, last_seq: int) -> list[dict]:
+        if last_seq == self._seq:
+            return []
+
+        for position, change in enumerate(self._buffer):
+            if change["seq"] == last_seq:
+                return [
+                    missed for missed in list(self._buffer)[position + 1:]
+                    if missed["owner_id"] == owner_id
+                ]
+
+        return [RESET]
+
+
+# Multi-worker deployments: every worker LISTENs on CHANNEL and feeds its own
+# broker, and writers NOTIFY from inside their transaction, so an event reaches
+# all workers exactly when (and only if) it commits.
+class PostgresChangeBridge:
+    def __init__(self, broker: ChangeBroker, conninfo: str):
+        self.broker = broker
+        self.conninfo = conninfo
+
+        self._stop = threading.Event()
+        self._thread = None
+
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="change-feed-listener", daemon=True)
+        self._thread.start()
+
+
+    def stop(self):
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+    def _run(self):
+        import psycopg
+
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self.conninfo, autocommit=True) as connection:
+                    connection.execute(f"LISTEN {CHANNEL}")
+
+                    while not self._stop.is_set():
+                        for notify in connection.notifies(timeout=1.0):
+                            self.broker.publish([json.loads(notify.payload)])
+
+            except Exception:
+                logger.exception("Change feed listener failed, reconnecting")
+
+                # Anything sent while disconnected is lost; make clients reload.
+                self.broker.reset_all()
+                self._stop.wait(1.0)
+
+
+change_broker = ChangeBroker(settings.CHANGE_FEED_BUFFER, settings.CHANGE_FEED_QUEUE)
+
+
+# The deadline scheduler listens on the broker too, so changes are recorded
+# whenever either of them is on.
+def record_change(db, op: str, owner_id: int, todo_id: int, todo=None):
+    if not (settings.CHANGE_FEED_ENABLED or settings.REMINDERS_ENABLED):
+        return
+
+    if todo is not None:
+        todo = TodoResponse.model_validate(todo).model_dump(mode="json")
+
+    db.info.setdefault(PENDING_KEY, []).append(
+        {"seq": None, "op": op, "owner_id": owner_id, "todo_id": todo_id, "todo": todo}
+    )
+
+
+# Changes are recorded on the session and only leave it when the transaction
+# commits. AsyncSession runs these hooks on its underlying Session.
+@event.listens_for(Session, "before_commit")
+def _notify_changes(session):
+    if not settings.CHANGE_FEED_BRIDGE:
+        return
+
+    for change in session.info.get(PENDING_KEY, ()):
+        session.execute(NOTIFY, {"channel": CHANNEL, "event": json.dumps(change)})
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changes(session):
+    changes = session.info.pop(PENDING_KEY, None)
+
+    if changes and not settings.CHANGE_FEED_BRIDGE:
+        change_broker.publish(changes)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changes(session, previous_transaction):
+    session.info.pop(PENDING_KEY, None)
\ No newline at end of file
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import os
+import secrets
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Lock
+
+from fastapi import HTTPException, status
+
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_503 = "Password hashing is overloaded, retry later"
+
+
+# bcrypt releases the GIL while hashing, so a dedicated thread pool gives real
+# parallelism while keeping the CPU-heavy work off the request threadpool.
+class PasswordHasher:
+    def __init__(self, crypt_context, workers: int | None = None, queue_limit: int = 64):
+        self.crypt_context = crypt_context
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_limit = queue_limit
+
+        self.rejected = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        self._lock = Lock()
+        self._pending = 0
+
+        # Verifying against a throwaway hash costs the same as a real verify,
+        # so unknown usernames cannot be told apart by response time. It is
+        # started on the pool right away so no request ever computes it inline.
+        self._dummy_hash = self._executor.submit(crypt_context.hash, secrets.token_hex(16))
+
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self._pending - self.workers, 0)
+
+
+    @property
+    def in_flight(self) -> int:
+        return self._pending
+
+
+    def _submit(self, func, *args):
+        with self._lock:
+            if self._pending >= self.workers + self.queue_limit:
+                self.rejected += 1
+
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=MESSAGE_503,
+                    headers={"Retry-After": "1"}
+                )
+
+            self._pending += 1
+
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(self._release)
+
+        return future
+
+
+    def _release(self, _future):
+        with self._lock:
+            self._pending -= 1
+
+
+    def hash(self, secret: str) -> str:
+        return self._submit(self.crypt_context.hash, secret).result()
+
+
+    def verify(self, secret: str, hashed: str) -> bool:
+        return self._submit(self.crypt_context.verify, secret, hashed).result()
+
+
+    # Hashes a batch with at most `max_in_flight` of its jobs on the pool at a
+    # time (half the workers by default), so the batch runs in parallel but
+    # logins still find a free worker.
+    def hash_many(self, passwords: list[str], max_in_flight: int | None = None) -> list[str]:
+        max_in_flight = max_in_flight or max(self.workers // 2, 1)
+        hashes = []
+        in_flight = deque()
+
+        for password in passwords:
+            if len(in_flight) >= max_in_flight:
+                hashes.append(in_flight.popleft().result())
+
+            in_flight.append(self._submit(self.crypt_context.hash, password))
+
+        hashes.extend(future.result() for future in in_flight)
+
+        return hashes
+
+
+    async def ahash(self, secret: str) -> str:
+        return await asyncio.wrap_future(self._submit(self.crypt_context.hash, secret))
+
+
+    async def averify(self, secret: str, hashed: str) -> bool:
+        return await asyncio.wrap_future(self._submit(self.crypt_context.verify, secret, hashed))
+
+
+    def dummy_verify(self, secret: str) -> bool:
+        self.verify(secret, self._dummy_hash.result())
+
+        return False
+
+
+    async def adummy_verify(self, secret: str) -> bool:
+        await self.averify(secret, await asyncio.wrap_future(self._dummy_hash))
+
+        return False
+
+
+    def benchmark(self, rounds_per_worker: int = 2) -> dict:
+        samples = self.workers * rounds_per_worker
+
+        started = time.perf_counter()
+        wait([self._executor.submit(self.crypt_context.hash, "benchmark-password") for _ in range(samples)])
+        elapsed = time.perf_counter() - started
+
+        cores = min(self.workers, os.cpu_count() or 1)
+        result = {
+            "workers": self.workers,
+            "hashes_per_second": samples / elapsed,
+            "hashes_per_second_per_core": samples / elapsed / cores,
+        }
+
+        logger.info(
+            "bcrypt benchmark: %.1f hashes/s total, %.1f hashes/s per core (%d workers)",
+            result["hashes_per_second"], result["hashes_per_second_per_core"], self.workers
+        )
+
+        return result
+
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
@@ -0,0 +1,120 @@
+from threading import Lock
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else str(bound)
+
+
+def format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+
+    pairs = []
+
+    for name, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{escaped}"')
+
+    return "{" + ",".join(pairs) + "}"
+
+
+# Builds the Prometheus text exposition format. samples are (suffix, labels,
+# value) tuples, the suffix being "" or e.g. "_bucket" / "_sum" / "_count".
+class MetricsWriter:
+    def __init__(self):
+        self.lines = []
+
+
+    def add(self, name: str, kind: str, help_text: str, samples):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+        for suffix, labels, value in samples:
+            self.lines.append(f"{name}{suffix}{format_labels(labels)} {float(value)!r}")
+
+
+    def histogram(self, name: str, help_text: str, series):
+        samples = []
+
+        for labels, cumulative, total, count in series:
+            for bound, value in cumulative:
+                samples.append(("_bucket", dict(labels, le=format_bound(bound)), value))
+
+            samples.append(("_sum", labels, total))
+            samples.append(("_count", labels, count))
+
+        self.add(name, "histogram", help_text, samples)
+
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+class RequestMetrics:
+    def __init__(self):
+        self._lock = Lock()
+
+        self._requests = {}
+        self._in_flight = {}
+        self._latency = {}
+
+
+    def start(self, method: str, route: str):
+        with self._lock:
+            key = (method, route)
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+
+    def finish(self, method: str, route: str, status_code: int, seconds: float):
+        with self._lock:
+            key = (method, route)
+            self._in_flight[key] -= 1
+
+            request_key = (method, route, status_code)
+            self._requests[request_key] = self._requests.get(request_key, 0) + 1
+
+            entry = self._latency.setdefault(key, [[0] * len(LATENCY_BUCKETS), 0.0, 0])
+            entry[1] += seconds
+            entry[2] += 1
+
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    entry[0][index] += 1
+                    break
+
+
+    def collect(self, writer: MetricsWriter):
+        with self._lock:
+            requests = sorted(self._requests.items())
+            in_flight = sorted(self._in_flight.items())
+            latency = sorted((key, [list(entry[0]), entry[1], entry[2]]) for key, entry in self._latency.items())
+
+        writer.add(
+            "http_requests_total", "counter", "HTTP requests by route and status code.",
+            [("", {"method": m, "route": r, "status": s}, count) for (m, r, s), count in requests]
+        )
+        writer.add(
+            "http_requests_in_flight", "gauge", "HTTP requests currently being served.",
+            [("", {"method": m, "route": r}, count) for (m, r), count in in_flight]
+        )
+
+        series = []
+
+        for (method, route), (buckets, total, count) in latency:
+            cumulative, running = [], 0
+
+            for bound, value in zip(LATENCY_BUCKETS, buckets):
+                running += value
+                cumulative.append((bound, running))
+
+            series.append(({"method": method, "route": route}, cumulative, total, count))
+
+        writer.histogram("http_request_duration_seconds", "HTTP request latency by route.", series)
+
+
+request_metrics = RequestMetrics()
\ No newline at end of file
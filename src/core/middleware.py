@@ -0,0 +1,88 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Match
+
+from db.query_stats import RequestQueryStats, current_query_stats, route_query_stats
+from src.core.metrics import request_metrics
+
+
+# Counts the SQL statements a request runs, reports them in a Server-Timing
+# header and adds them to the per-route aggregates. Statements run after the
+# headers are sent (streaming bodies, dependency teardown) only reach the
+# aggregates.
+class QueryStatsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = current_query_stats.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+
+            route = scope.get("route")
+
+            if route is not None:
+                route_query_stats.observe(f"{scope['method']} {route.path}", stats)
+
+
+# Resolves the route template up front (the router only records it once the
+# endpoint runs) so in-flight requests can be labelled by route, not raw path.
+def route_label(scope) -> str:
+    partial = None
+
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+
+        if match is Match.FULL:
+            return route.path
+
+        if match is Match.PARTIAL and partial is None:
+            partial = route.path
+
+    return partial or "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method, route = scope["method"], route_label(scope)
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        request_metrics.start(method, route)
+        started = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            request_metrics.finish(method, route, status_code, time.perf_counter() - started)
\ No newline at end of file
@@ -0,0 +1,131 @@
+import math
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from fastapi import HTTPException, Request, status
+
+
+MESSAGE_429 = "Too many login attempts, retry later"
+
+
+# Token-bucket storage used by LoginRateLimiter. consume() takes one token and
+# returns 0, or the seconds until a token is available; peek() answers the same
+# without taking one. A shared implementation (e.g. a Redis script) only needs
+# them to be atomic across workers.
+class RateLimitBackend:
+    def consume(self, key: str, capacity: float, refill_per_second: float) -> float:
+        raise NotImplementedError
+
+    def peek(self, key: str, capacity: float, refill_per_second: float) -> float:
+        raise NotImplementedError
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+
+        self._buckets = OrderedDict()
+        self._lock = Lock()
+
+
+    def _tokens(self, key: str, capacity: float, refill_per_second: float, now: float) -> float:
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+
+        return min(capacity, tokens + (now - updated_at) * refill_per_second)
+
+
+    def peek(self, key: str, capacity: float, refill_per_second: float) -> float:
+        with self._lock:
+            tokens = self._tokens(key, capacity, refill_per_second, time.monotonic())
+
+        return 0.0 if tokens >= 1 else (1 - tokens) / refill_per_second
+
+
+    def consume(self, key: str, capacity: float, refill_per_second: float) -> float:
+        now = time.monotonic()
+
+        with self._lock:
+            tokens = self._tokens(key, capacity, refill_per_second, now)
+
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0.0
+            else:
+                retry_after = (1 - tokens) / refill_per_second
+
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+
+            # The least recently used buckets are the ones most likely to be
+            # full again, so dropping them loses little.
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+
+            return retry_after
+
+
+class LoginRateLimiter:
+    def __init__(self, backend: RateLimitBackend, ip_burst: int, ip_per_minute: float,
+                 username_burst: int, username_per_minute: float, enabled: bool = True,
+                 trusted_proxy_hops: int = 0, forwarded_header: str = "X-Forwarded-For"):
+        self.backend = backend
+        self.enabled = enabled
+
+        self.trusted_proxy_hops = trusted_proxy_hops
+        self.forwarded_header = forwarded_header
+
+        self.ip_limit = (ip_burst, ip_per_minute / 60)
+        self.username_limit = (username_burst, username_per_minute / 60)
+
+        self.rejected = 0
+
+
+    # Behind trusted_proxy_hops reverse proxies, each appending the address it
+    # received the request from, the client is the entry that many places from
+    # the right of the forwarded header; anything left of it is client-supplied.
+    def client_ip(self, request: Request) -> str | None:
+        peer = request.client.host if request.client else None
+
+        if not self.trusted_proxy_hops:
+            return peer
+
+        forwarded = [
+            address.strip()
+            for header in request.headers.getlist(self.forwarded_header)
+            for address in header.split(",")
+            if address.strip()
+        ]
+
+        if len(forwarded) < self.trusted_proxy_hops:
+            return peer
+
+        return forwarded[-self.trusted_proxy_hops]
+
+
+    # Runs before the user lookup and bcrypt, so a flood of attempts costs a
+    # dictionary update each. Every attempt is charged to the IP, but the
+    # username bucket is only peeked here and charged by record_failure(), so
+    # nobody can lock an account out without also failing its password.
+    def check(self, username: str, client_ip: str | None):
+        if not self.enabled:
+            return
+
+        retry_after = self.backend.consume(f"login:ip:{client_ip}", *self.ip_limit)
+
+        if not retry_after:
+            retry_after = self.backend.peek(f"login:user:{username.lower()}", *self.username_limit)
+
+        if retry_after:
+            self.rejected += 1
+
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=MESSAGE_429,
+                headers={"Retry-After": str(math.ceil(retry_after))}
+            )
+
+
+    def record_failure(self, username: str):
+        if self.enabled:
+            self.backend.consume(f"login:user:{username.lower()}", *self.username_limit)
\ No newline at end of file
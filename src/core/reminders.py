@@ -0,0 +1,319 @@
+import heapq
+import json
+import logging
+import threading
+import time
+from datetime import date, timedelta
+
+from db.config import settings
+from src.core.change_feed import RESET, change_broker
+from src.repositories.todos_repository import TodoRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReminderSink:
+    def send(self, reminders: list[dict]):
+        raise NotImplementedError
+
+
+class LogReminderSink(ReminderSink):
+    def send(self, reminders: list[dict]):
+        for reminder in reminders:
+            logger.info(
+                "Todo %s of user %s is due on %s",
+                reminder["todo_id"], reminder["owner_id"], reminder["deadline"]
+            )
+
+
+# One JSON document per line; meant for local runs and tests.
+class FileReminderSink(ReminderSink):
+    def __init__(self, path: str):
+        self.path = path
+
+        self._lock = threading.Lock()
+
+
+    def send(self, reminders: list[dict]):
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            for reminder in reminders:
+                file.write(json.dumps(reminder) + "\n")
+
+
+def build_reminder_sink(kind: str, path: str) -> ReminderSink:
+    if kind == "log":
+        return LogReminderSink()
+
+    if kind == "file":
+        return FileReminderSink(path)
+
+    raise ValueError(f"Unknown reminder sink: {kind}")
+
+
+def _key(deadline, todo_id: int) -> tuple:
+    if isinstance(deadline, str):
+        deadline = date.fromisoformat(deadline)
+
+    return deadline, todo_id
+
+
+# Keeps the next `capacity` open todos by (deadline, id) in a min-heap, so a
+# tick only looks at the top of the heap instead of scanning the table. The
+# heap is refilled with a keyset range read on ix_todos_open_deadline and kept
+# current between refills from committed change feed events.
+#
+# Entries are deleted lazily: `_queued` holds the live key per todo and heap
+# keys that no longer match it are skipped when popped.
+#
+# Run it in a single process; every running scheduler sends its own reminders.
+class DeadlineScheduler:
+    def __init__(self, session_factory, sink: ReminderSink, capacity: int, lead_days: int,
+                 batch_size: int, interval: float, refresh_interval: float):
+        self.session_factory = session_factory
+        self.sink = sink
+        self.capacity = capacity
+        self.lead_days = lead_days
+        self.batch_size = batch_size
+        self.interval = interval
+        self.refresh_interval = refresh_interval
+
+        self.sent = 0
+
+        self._lock = threading.Lock()
+        self._heap = []
+        self._queued = {}
+        # Last key loaded from the database; None when the heap holds every
+        # remaining open todo.
+        self._horizon = None
+        self._needs_refill = True
+        self._refilled_at = 0.0
+        # Ids changed while a refill query was in flight, and ids whose change
+        # event had no row; both are re-read before the next dispatch.
+        self._touched = None
+        self._lookups = set()
+        # todo id -> deadline already reminded about, so edits do not repeat it.
+        self._reminded = {}
+
+        self._stop = threading.Event()
+        self._thread = None
+
+
+    def start(self):
+        change_broker.add_listener(self.on_change)
+
+        self._thread = threading.Thread(target=self._run, name="deadline-scheduler", daemon=True)
+        self._thread.start()
+
+
+    def stop(self):
+        change_broker.remove_listener(self.on_change)
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+    def on_change(self, change: dict):
+        with self._lock:
+            if change is RESET:
+                self._needs_refill = True
+                return
+
+            todo_id = change["todo_id"]
+            self._queued.pop(todo_id, None)
+
+            if self._touched is not None:
+                self._touched.add(todo_id)
+
+            if change["op"] in ("deleted", "archived"):
+                self._reminded.pop(todo_id, None)
+            elif change["todo"] is None:
+                self._lookups.add(todo_id)
+            elif not change["todo"]["is_completed"]:
+                todo = change["todo"]
+                self._offer(_key(todo["deadline"], todo_id), todo["owner_id"], todo["title"], date.today())
+
+
+    def run_once(self, today: date | None = None) -> int:
+        today = today or date.today()
+
+        self._reload_lookups(today)
+        sent = self._dispatch(today)
+
+        if self._should_refill():
+            self._refill(today)
+            sent += self._dispatch(today)
+
+        return sent
+
+
+    # Called with the lock held.
+    def _offer(self, key: tuple, owner_id: int, title: str, today: date):
+        deadline, todo_id = key
+
+        if deadline < today or self._reminded.get(todo_id) == deadline:
+            return
+
+        # Beyond the loaded range; a later refill reads it from the index.
+        if self._horizon is not None and key > self._horizon:
+            return
+
+        self._queued[todo_id] = (key, owner_id, title)
+        heapq.heappush(self._heap, key)
+
+
+    def _should_refill(self) -> bool:
+        with self._lock:
+            if self._needs_refill or time.monotonic() - self._refilled_at >= self.refresh_interval:
+                return True
+
+            return self._horizon is not None and len(self._queued) < self.capacity // 2
+
+
+    # Always reads from today, so todos moved to an earlier deadline are not
+    # missed; rows already reminded about are skipped page by page until the
+    # heap's capacity is filled or the index runs out.
+    def _refill(self, today: date):
+        with self._lock:
+            self._touched = set()
+            reminded = {
+                todo_id: deadline for todo_id, deadline in self._reminded.items() if deadline >= today
+            }
+
+        rows = []
+        horizon = None
+
+        try:
+            with self.session_factory() as db:
+                while len(rows) < self.capacity:
+                    page = TodoRepository.get_open_todos_due(db, today, horizon, self.capacity)
+                    rows += [row for row in page if reminded.get(row.id) != row.deadline]
+                    horizon = _key(page[-1].deadline, page[-1].id) if len(page) == self.capacity else None
+
+                    if horizon is None:
+                        break
+        except Exception:
+            with self._lock:
+                self._touched = None
+
+            raise
+
+        if len(rows) > self.capacity:
+            rows = rows[:self.capacity]
+            horizon = _key(rows[-1].deadline, rows[-1].id)
+
+        with self._lock:
+            touched, self._touched = self._touched, None
+
+            self._heap = []
+            self._queued = {}
+            self._horizon = horizon
+
+            for row in rows:
+                if row.id in touched:
+                    continue
+
+                self._offer(_key(row.deadline, row.id), row.owner_id, row.title, today)
+
+            self._lookups.update(touched)
+            self._needs_refill = False
+            self._refilled_at = time.monotonic()
+
+            self._reminded = {
+                todo_id: deadline for todo_id, deadline in self._reminded.items() if deadline >= today
+            }
+
+
+    def _reload_lookups(self, today: date):
+        with self._lock:
+            todo_ids, self._lookups = list(self._lookups), set()
+
+        if not todo_ids:
+            return
+
+        with self.session_factory() as db:
+            rows = TodoRepository.get_open_todos_by_ids(db, todo_ids)
+
+        with self._lock:
+            for row in rows:
+                self._offer(_key(row.deadline, row.id), row.owner_id, row.title, today)
+
+
+    def _pop_due(self, until: date) -> list[tuple]:
+        due = []
+
+        with self._lock:
+            while self._heap and self._heap[0][0] <= until and len(due) < self.batch_size:
+                key = heapq.heappop(self._heap)
+                entry = self._queued.get(key[1])
+
+                if entry is None or entry[0] != key:
+                    continue
+
+                del self._queued[key[1]]
+                self._reminded[key[1]] = key[0]
+
+                due.append(entry)
+
+        return due
+
+
+    def _dispatch(self, today: date) -> int:
+        until = today + timedelta(days=self.lead_days)
+        sent = 0
+
+        while due := self._pop_due(until):
+            reminders = [
+                {
+                    "todo_id": todo_id,
+                    "owner_id": owner_id,
+                    "title": title,
+                    "deadline": deadline.isoformat(),
+                    "due_in_days": (deadline - today).days,
+                }
+                for (deadline, todo_id), owner_id, title in due
+            ]
+
+            try:
+                self.sink.send(reminders)
+            except Exception:
+                logger.exception("Reminder sink failed, retrying %s reminders on the next tick", len(reminders))
+
+                with self._lock:
+                    for key, owner_id, title in due:
+                        self._reminded.pop(key[1], None)
+                        self._offer(key, owner_id, title, today)
+
+                break
+
+            sent += len(reminders)
+
+        self.sent += sent
+
+        return sent
+
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Deadline scheduler tick failed")
+
+                with self._lock:
+                    self._needs_refill = True
+
+            self._stop.wait(self.interval)
+
+
+def create_deadline_scheduler(session_factory) -> DeadlineScheduler:
+    return DeadlineScheduler(
+        session_factory,
+        build_reminder_sink(settings.REMINDER_SINK, settings.REMINDER_SINK_PATH),
+        capacity=settings.REMINDER_HEAP_SIZE,
+        lead_days=settings.REMINDER_LEAD_DAYS,
+        batch_size=settings.REMINDER_BATCH_SIZE,
+        interval=settings.REMINDER_INTERVAL,
+        refresh_interval=settings.REMINDER_REFRESH_INTERVAL,
+    )
\ No newline at end of file
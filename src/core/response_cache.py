@@ -0,0 +1,259 @@
+import json
+import logging
+import queue
+import threading
+import time
+from threading import Lock
+
+from db.config import settings
+from src.core.cache import LRUCache
+
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_NAMESPACE = "*"
+
+CHANNEL = "response_cache"
+
+
+# Storage used by ResponseCache. A shared implementation (Redis, memcached, ...)
+# only needs these operations, with incr() atomic across workers.
+class CacheBackend:
+    def get(self, key: str):
+        raise NotImplementedError
+
+    def set(self, key: str, value, ttl: float | None):
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+    def version(self, key: str) -> int:
+        raise NotImplementedError
+
+    # False while the backend cannot vouch for its versions; reads then bypass
+    # the cache.
+    def available(self) -> bool:
+        return True
+
+
+class LocalCacheBackend(CacheBackend):
+    def __init__(self, maxsize: int):
+        self.values = LRUCache(maxsize=maxsize)
+
+        self._versions = {}
+        self._lock = Lock()
+
+    def get(self, key: str):
+        return self.values.get(key)
+
+    def set(self, key: str, value, ttl: float | None):
+        self.values.set(key, value, expires_at=None if ttl is None else time.time() + ttl)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._versions[key] = self._versions.get(key, 0) + 1
+
+            return self._versions[key]
+
+    def version(self, key: str) -> int:
+        return self._versions.get(key, 0)
+
+
+# Multi-worker deployments: values stay in each worker's memory, but every
+# version bump is broadcast with NOTIFY and applied by every worker's listener,
+# so a write on one worker retires the matching entries on all of them. While
+# the listener is down bumps may be missed, so the cache is bypassed until it
+# reconnects and retires everything cached before.
+#
+# Versions are not checked against a shared source on read. The writing worker
+# sees its own bump at once; other workers keep serving the old entry until
+# the NOTIFY arrives, which is normally milliseconds after the sender's commit
+# but lasts as long as the sender is reconnecting.
+class PostgresCacheBackend(LocalCacheBackend):
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+
+        self.conninfo = None
+
+        self._outbox = queue.SimpleQueue()
+        self._listening = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+
+
+    def available(self) -> bool:
+        return self._listening.is_set()
+
+
+    def incr(self, key: str) -> int:
+        version = self._bump(key)
+        self._outbox.put(key)
+
+        return version
+
+
+    def _bump(self, key: str) -> int:
+        return super().incr(key)
+
+
+    def start(self, conninfo: str):
+        self.conninfo = conninfo
+        self._stop.clear()
+
+        self._threads = [
+            threading.Thread(target=self._listen, name="response-cache-listener", daemon=True),
+            threading.Thread(target=self._send, name="response-cache-sender", daemon=True),
+        ]
+
+        for thread in self._threads:
+            thread.start()
+
+
+    def stop(self):
+        self._stop.set()
+        self._outbox.put(None)
+
+        for thread in self._threads:
+            thread.join(timeout=5)
+
+
+    def _listen(self):
+        import psycopg
+
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self.conninfo, autocommit=True) as connection:
+                    connection.execute(f"LISTEN {CHANNEL}")
+
+                    self._bump(f"version:{GLOBAL_NAMESPACE}")
+                    self._listening.set()
+
+                    while not self._stop.is_set():
+                        for notify in connection.notifies(timeout=1.0):
+                            self._bump(notify.payload)
+
+            except Exception:
+                logger.exception("Response cache listener failed, reconnecting")
+
+            self._listening.clear()
+            self._stop.wait(1.0)
+
+
+    # Bumps are sent in order from one connection; a failed send is retried
+    # on a fresh connection rather than dropped.
+    def _send(self):
+        import psycopg
+
+        key = None
+
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self.conninfo, autocommit=True) as connection:
+                    while not self._stop.is_set():
+                        if key is None:
+                            key = self._outbox.get()
+
+                        if key is not None:
+                            connection.execute("SELECT pg_notify(%s, %s)", (CHANNEL, key))
+                            key = None
+
+            except Exception:
+                logger.exception("Response cache sender failed, reconnecting")
+                self._stop.wait(1.0)
+
+
+# Local versions are invisible to other worker processes, so the local backend
+# would let them serve stale responses.
+def build_cache_backend(kind: str, maxsize: int, workers: int) -> CacheBackend:
+    if kind == "local":
+        if workers > 1:
+            raise ValueError(
+                "RESPONSE_CACHE_BACKEND=local cannot be shared between WEB_CONCURRENCY workers; use postgres"
+            )
+
+        return LocalCacheBackend(maxsize)
+
+    if kind == "postgres":
+        return PostgresCacheBackend(maxsize)
+
+    raise ValueError(f"Unknown response cache backend: {kind}")
+
+
+# Invalidation bumps a per-namespace version that is part of every key, so a
+# write never has to find the keys it affects. A reader that loaded rows before
+# a commit stores them under the old version, which nobody asks for again.
+class ResponseCache:
+    def __init__(self, backend: CacheBackend, ttl: float | None, enabled: bool = True):
+        self.backend = backend
+        self.ttl = ttl
+        self.enabled = enabled
+
+
+    def _version(self, namespace: str) -> int:
+        return self.backend.version(f"version:{namespace}")
+
+
+    def _key(self, namespace: str, key_parts) -> str:
+        versions = f"{self._version(GLOBAL_NAMESPACE)}.{self._version(namespace)}"
+
+        return f"{namespace}:{versions}:{json.dumps(key_parts, default=str)}"
+
+
+    def get_or_load(self, namespace: str, key_parts, loader):
+        if not self.enabled or not self.backend.available():
+            return loader()
+
+        key = self._key(namespace, key_parts)
+        value = self.backend.get(key)
+
+        if value is None:
+            value = loader()
+
+            if value is not None:
+                self.backend.set(key, value, self.ttl)
+
+        return value
+
+
+    async def aget_or_load(self, namespace: str, key_parts, loader):
+        if not self.enabled or not self.backend.available():
+            return await loader()
+
+        key = self._key(namespace, key_parts)
+        value = self.backend.get(key)
+
+        if value is None:
+            value = await loader()
+
+            if value is not None:
+                self.backend.set(key, value, self.ttl)
+
+        return value
+
+
+    def invalidate(self, *namespaces: str):
+        for namespace in namespaces:
+            self.backend.incr(f"version:{namespace}")
+
+
+    def invalidate_all(self):
+        self.invalidate(GLOBAL_NAMESPACE)
+
+
+def todos_namespace(owner_id: int | None = None) -> str:
+    return "todos" if owner_id is None else f"todos:{owner_id}"
+
+
+def user_namespace(user_id: int | None = None) -> str:
+    return "users" if user_id is None else f"user:{user_id}"
+
+
+response_cache = ResponseCache(
+    build_cache_backend(
+        settings.RESPONSE_CACHE_BACKEND, settings.RESPONSE_CACHE_SIZE,
+        settings.WEB_CONCURRENCY if settings.RESPONSE_CACHE_ENABLED else 1
+    ),
+    ttl=settings.RESPONSE_CACHE_TTL,
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+)
\ No newline at end of file
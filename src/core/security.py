@@ -4,19 +4,44 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 
+import hashlib
 from typing import Annotated
 
 from db.config import settings
+from src.core.cache import LRUCache
+from src.core.hashing import PasswordHasher
+from src.core.rate_limit import LocalRateLimitBackend, LoginRateLimiter
 
 
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl='/auth/token')
 
-bcrypt_context = CryptContext(schemes=['bcrypt'], deprecated="auto")
+bcrypt_context = CryptContext(schemes=['bcrypt'], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+password_hasher = PasswordHasher(bcrypt_context, settings.HASH_WORKERS, settings.HASH_QUEUE_LIMIT)
+
+jwt_claims_cache = LRUCache(maxsize=settings.JWT_CACHE_SIZE)
+
+login_rate_limiter = LoginRateLimiter(
+    LocalRateLimitBackend(maxsize=settings.LOGIN_RATE_LIMIT_KEYS),
+    ip_burst=settings.LOGIN_IP_BURST,
+    ip_per_minute=settings.LOGIN_IP_PER_MINUTE,
+    username_burst=settings.LOGIN_USERNAME_BURST,
+    username_per_minute=settings.LOGIN_USERNAME_PER_MINUTE,
+    enabled=settings.LOGIN_RATE_LIMIT_ENABLED,
+    trusted_proxy_hops=settings.LOGIN_TRUSTED_PROXY_HOPS,
+    forwarded_header=settings.LOGIN_FORWARDED_HEADER,
+)
 
 MESSAGE_401 = "Could not validate user"
 
 
-def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]):
+async def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]):
+    token_digest = hashlib.sha256(token.encode()).digest()
+    claims = jwt_claims_cache.get(token_digest)
+
+    if claims is not None:
+        return dict(claims)
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         username: str = payload.get('sub')
@@ -26,7 +51,14 @@ def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]):
         if username is None or user_id is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=MESSAGE_401)
         
-        return {'username': username, 'id': user_id, 'user_role': user_role}
+        claims = {'username': username, 'id': user_id, 'user_role': user_role}
+
+        # Verified tokens are only cached until they expire, so the cache never
+        # accepts a token that jwt.decode would reject.
+        if payload.get('exp') is not None:
+            jwt_claims_cache.set(token_digest, claims, expires_at=payload['exp'])
+
+        return dict(claims)
     
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=MESSAGE_401)
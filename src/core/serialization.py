@@ -0,0 +1,59 @@
+from functools import lru_cache
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter, create_model
+
+from db.config import settings
+from src.schemas.base_schema import BaseSchema
+
+
+# With FAST_JSON_RESPONSES list rows are projected straight to dicts and the
+# list endpoints return an orjson-encoded response, skipping the per-request
+# response_model validation and the stdlib encoder.
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+# Response model for a sparse fieldset: the selected fields of `schema`, with
+# their original types and constraints. Built once per distinct selection.
+@lru_cache(maxsize=256)
+def partial_model(schema, fields: tuple[str, ...]):
+    return create_model(
+        f"{schema.__name__}Fields",
+        __base__=BaseSchema,
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields}
+    )
+
+
+def dump_rows(rows, schema) -> list[dict]:
+    if settings.FAST_JSON_RESPONSES:
+        return [row._asdict() for row in rows]
+
+    adapter = list_adapter(schema)
+
+    return adapter.dump_python(adapter.validate_python(rows, from_attributes=True))
+
+
+# Sparse responses cannot go through the endpoint's full response_model, so
+# they are always returned as a response object; without orjson that needs
+# JSON-ready values.
+def dump_fields(rows, schema, fields: tuple[str, ...]) -> list[dict]:
+    if settings.FAST_JSON_RESPONSES:
+        return [{name: getattr(row, name) for name in fields} for row in rows]
+
+    adapter = list_adapter(partial_model(schema, fields))
+
+    return adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="json")
+
+
+def fast_response(content, headers=None, fields=None):
+    if fields is None and not settings.FAST_JSON_RESPONSES:
+        return content
+
+    response_class = ORJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
+
+    return response_class(content, headers=dict(headers) if headers else None)
\ No newline at end of file
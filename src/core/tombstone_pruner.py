@@ -0,0 +1,82 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from db.config import settings
+from src.repositories.todos_repository import TodoRepository
+
+
+logger = logging.getLogger(__name__)
+
+# Watermarks are refused once they are older than the retention window; the
+# extra day covers deletes whose transaction started before the client synced.
+PRUNE_GRACE = timedelta(days=1)
+
+
+# Deletes todo tombstones that no valid sync watermark can still need, in
+# short batches so the table never grows without bound.
+class TombstonePruner:
+    def __init__(self, session_factory, retention_days: int, batch_size: int, interval: float):
+        self.session_factory = session_factory
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.interval = interval
+
+        self.pruned = 0
+
+        self._stop = threading.Event()
+        self._thread = None
+
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="tombstone-pruner", daemon=True)
+        self._thread.start()
+
+
+    def stop(self):
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+    def run_once(self, now: datetime | None = None) -> int:
+        cutoff = (now or datetime.now()) - timedelta(days=self.retention_days) - PRUNE_GRACE
+        pruned = 0
+
+        while not self._stop.is_set():
+            with self.session_factory() as db:
+                batch = TodoRepository.prune_tombstones(db, cutoff, self.batch_size)
+
+                db.commit()
+
+            pruned += batch
+
+            if batch < self.batch_size:
+                break
+
+        self.pruned += pruned
+
+        return pruned
+
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                pruned = self.run_once()
+
+                if pruned:
+                    logger.info("Pruned %s todo tombstones", pruned)
+            except Exception:
+                logger.exception("Tombstone pruning failed")
+
+            self._stop.wait(self.interval)
+
+
+def create_tombstone_pruner(session_factory) -> TombstonePruner:
+    return TombstonePruner(
+        session_factory,
+        retention_days=settings.SYNC_TOMBSTONE_RETENTION_DAYS,
+        batch_size=settings.TOMBSTONE_PRUNE_BATCH_SIZE,
+        interval=settings.TOMBSTONE_PRUNE_INTERVAL,
+    )
\ No newline at end of file
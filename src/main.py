@@ -1,11 +1,105 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 from src.routers import todos, user_routers
 
 import src.models as models
-from src.routers import auth_routers
+from src.routers import auth_routers, system_routers, metrics_routers, change_feed_routers
+from src.routers import async_todos, async_auth_routers, async_user_routers
+from src.core.security import password_hasher
+from src.core.change_feed import change_broker, PostgresChangeBridge
+from src.core.response_cache import response_cache, PostgresCacheBackend
+from src.core.reminders import create_deadline_scheduler
+from src.core.archiver import create_todo_archiver
+from src.core.tombstone_pruner import create_tombstone_pruner
+from src.core.serialization import DEFAULT_RESPONSE_CLASS
+from src.core.middleware import QueryStatsMiddleware, MetricsMiddleware
+from db.config import settings
+from db.database import sync_engine, SessionLocal
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.HASH_BENCHMARK_ON_STARTUP:
+        await run_in_threadpool(password_hasher.benchmark)
+
+    conninfo = sync_engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+    cache_backend = None
+
+    if settings.RESPONSE_CACHE_ENABLED and isinstance(response_cache.backend, PostgresCacheBackend):
+        cache_backend = response_cache.backend
+        cache_backend.start(conninfo)
+
+    bridge = None
+
+    if settings.CHANGE_FEED_BRIDGE and (settings.CHANGE_FEED_ENABLED or settings.REMINDERS_ENABLED):
+        bridge = PostgresChangeBridge(change_broker, conninfo)
+        bridge.start()
+
+    scheduler = None
+
+    if settings.REMINDERS_ENABLED:
+        scheduler = create_deadline_scheduler(SessionLocal)
+        scheduler.start()
+
+    archiver = None
+
+    if settings.ARCHIVE_ENABLED:
+        archiver = create_todo_archiver(SessionLocal)
+        archiver.start()
+
+    pruner = None
+
+    if settings.TOMBSTONE_PRUNE_ENABLED:
+        pruner = create_tombstone_pruner(SessionLocal)
+        pruner.start()
+
+    yield
+
+    if pruner is not None:
+        pruner.stop()
+
+    if archiver is not None:
+        archiver.stop()
+
+    if scheduler is not None:
+        scheduler.stop()
+
+    if bridge is not None:
+        bridge.stop()
+
+    if cache_backend is not None:
+        cache_backend.stop()
+
+    password_hasher.shutdown()
+
+
+app = FastAPI(title="To-Do List Program", lifespan=lifespan, default_response_class=DEFAULT_RESPONSE_CLASS)
+
+if settings.SQL_INSTRUMENTATION:
+    app.add_middleware(QueryStatsMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Only one stack serves requests, so sync and async runs can be compared on the
+# same endpoints. Routes the async routers do not implement are not served in
+# async mode; the README lists them.
+if settings.DB_ASYNC:
+    app.include_router(async_todos.router)
+    app.include_router(async_auth_routers.router)
+    app.include_router(async_user_routers.router)
+else:
+    app.include_router(todos.router)
+    app.include_router(auth_routers.router)
+    app.include_router(user_routers.router)
+
+app.include_router(system_routers.router)
 
-app = FastAPI(title="To-Do List Program")
+if settings.CHANGE_FEED_ENABLED:
+    app.include_router(change_feed_routers.router)
 
-app.include_router(todos.router)
-app.include_router(auth_routers.router)
-app.include_router(user_routers.router)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_routers.router)
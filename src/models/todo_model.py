@@ -1,4 +1,4 @@
-from sqlalchemy import UniqueConstraint, ForeignKey, String, func
+from sqlalchemy import UniqueConstraint, ForeignKey, Index, String, BigInteger, Text, cast, false, func
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -9,6 +9,13 @@ from db.database import Base
 from src.utils.models_constants import int_pk
 
 
+# The id of the writing transaction (xid8, as a bigint). Every transaction
+# with an id below pg_snapshot_xmin() of a snapshot has finished, so delta sync
+# can order changes by it without skipping writes that commit late.
+def current_xid():
+    return cast(cast(func.pg_current_xact_id(), Text), BigInteger)
+
+
 class TodoPriority(str, Enum):
     very_high = "very high"
     high = "high"
@@ -31,9 +38,94 @@ class Todos(Base):
 
     created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now(), nullable=False)
+    change_xid: Mapped[int] = mapped_column(BigInteger, server_default=current_xid(), onupdate=current_xid(), nullable=False)
 
     user = relationship("Users", back_populates="todos")
 
     __table_args__ = (
         UniqueConstraint('title', 'deadline', name="uix_title_deadline"),
-    )
\ No newline at end of file
+        Index("ix_todos_owner_deadline", "owner_id", "deadline", "id"),
+        Index("ix_todos_owner_completed", "owner_id", "is_completed"),
+        Index("ix_todos_owner_change", "owner_id", "change_xid", "id"),
+    )
+
+
+# Completed todos whose deadline is long past, moved out of `todos` by the
+# archiver so they stop weighing on its indexes. Same columns, same ids.
+class TodosArchive(Base):
+    __tablename__ = "todos_archive"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+
+    title: Mapped[str] = mapped_column(String(50), nullable=False)
+    deadline: Mapped[date] = mapped_column(nullable=False)
+    description: Mapped[str] = mapped_column(String(100))
+
+    priority: Mapped[TodoPriority] = mapped_column(SQLEnum(TodoPriority), nullable=False)
+    is_completed: Mapped[bool] = mapped_column(nullable=False)
+
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(nullable=False)
+    change_xid: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_todos_archive_owner_deadline", "owner_id", "deadline", "id"),
+    )
+
+
+# One row per deleted or archived todo, so delta sync can tell clients what to
+# drop and why. No foreign key: tombstones outlive the owner when a user is
+# deleted.
+class TodoTombstones(Base):
+    __tablename__ = "todo_tombstones"
+
+    id: Mapped[int_pk]
+
+    todo_id: Mapped[int] = mapped_column(nullable=False)
+    owner_id: Mapped[int] = mapped_column(nullable=False)
+    # Moved to todos_archive rather than deleted; still readable with include_archived.
+    is_archived: Mapped[bool] = mapped_column(server_default=false(), nullable=False)
+
+    deleted_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
+    change_xid: Mapped[int] = mapped_column(BigInteger, server_default=current_xid(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_todo_tombstones_owner_change", "owner_id", "change_xid", "id"),
+        Index("ix_todo_tombstones_deleted", "deleted_at", "id"),
+    )
+
+
+# Trigram GIN indexes serve the case-insensitive substring filters in TodoRepository.search_todo.
+Index(
+    "ix_todos_title_trgm",
+    func.lower(Todos.title).label("title_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"title_lower": "gin_trgm_ops"}
+)
+
+Index(
+    "ix_todos_description_trgm",
+    func.lower(Todos.description).label("description_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"description_lower": "gin_trgm_ops"}
+)
+
+
+# Only open todos can be due; the deadline scheduler refills its queue from here.
+Index(
+    "ix_todos_open_deadline",
+    Todos.deadline,
+    Todos.id,
+    postgresql_where=~Todos.is_completed
+)
+
+# The archiver's candidates, read in batches.
+Index(
+    "ix_todos_completed_deadline",
+    Todos.deadline,
+    Todos.id,
+    postgresql_where=Todos.is_completed
+)
\ No newline at end of file
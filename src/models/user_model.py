@@ -35,4 +35,4 @@ class Users(Base):
     created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    todos = relationship("Todo", back_populates="user")
\ No newline at end of file
+    todos = relationship("Todos", back_populates="user")
\ No newline at end of file
@@ -0,0 +1,75 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+
+from src.models.user_model import Users
+from src.repositories.auth_repository import USER_ORDER, USER_RESPONSE_COLUMNS
+from src.utils.helpers import keyset_paginate, keyset_page, projection
+
+
+class AsyncUserRepository:
+    @staticmethod
+    async def get_all_users(db: AsyncSession, limit: int, cursor: str | None = None, columns=USER_RESPONSE_COLUMNS):
+        query = keyset_paginate(select(*projection(columns, USER_ORDER)), USER_ORDER, limit, cursor)
+
+        result = await db.execute(query)
+
+        return keyset_page(result, USER_ORDER, limit)
+    
+
+    @staticmethod
+    async def get_user_by_id(db: AsyncSession, user_id: int):
+        query = (
+            select(Users)
+            .filter(Users.id == user_id)
+        )
+
+        result = await db.execute(query)
+
+        return result.scalars().first()
+    
+
+    @staticmethod
+    async def get_user_fields(db: AsyncSession, user_id: int, columns):
+        query = (
+            select(*columns)
+            .filter(Users.id == user_id)
+        )
+
+        result = await db.execute(query)
+
+        return result.first()
+    
+
+    @staticmethod
+    async def get_user_updated_at(db: AsyncSession, user_id: int):
+        query = (
+            select(Users.updated_at)
+            .filter(Users.id == user_id)
+        )
+
+        result = await db.execute(query)
+
+        return result.scalars().first()
+
+    @staticmethod
+    async def delete_user_by_id(db: AsyncSession, user_model):
+        await db.delete(user_model)
+
+
+    @staticmethod
+    def add_user(db: AsyncSession, new_user):
+        db.add(new_user)
+
+        return new_user
+    
+    
+    @staticmethod
+    async def get_user_by_username(db: AsyncSession, username: str):
+        query = (
+            select(Users)
+            .filter(Users.username == username)
+        )
+
+        result = await db.execute(query)
+
+        return result.scalars().first()
@@ -0,0 +1,176 @@
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete
+
+from src.models.todo_model import Todos
+from src.repositories.todos_repository import (
+    TODO_RESPONSE_COLUMNS, all_todos_query, user_todos_query, search_todos_query, todo_list_version_query, todo_version_query, todo_stats_query,
+    sync_horizon_query, todo_changes_query, tombstones_query, tombstones_insert
+)
+from src.utils.helpers import keyset_page
+
+
+class AsyncTodoRepository:
+    @staticmethod
+    async def get_all_todos(db: AsyncSession, limit: int, cursor: str | None = None, include_archived: bool = False, columns=TODO_RESPONSE_COLUMNS):
+        query, order = all_todos_query(limit, cursor, include_archived, columns)
+
+        result = await db.execute(query)
+
+        return keyset_page(result, order, limit)
+    
+
+    @staticmethod
+    async def get_todo_by_user_id(db: AsyncSession, user_id: int, limit: int, cursor: str | None = None, is_completed: bool | None = None, include_archived: bool = False, columns=TODO_RESPONSE_COLUMNS):
+        query, order = user_todos_query(user_id, limit, cursor, is_completed, include_archived, columns)
+
+        result = await db.execute(query)
+
+        return keyset_page(result, order, limit)
+    
+
+    @staticmethod
+    async def get_todo_by_id(db: AsyncSession, todo_id: int):
+        query = (
+            select(Todos)
+            .filter(Todos.id == todo_id)
+        )
+
+        result = await db.execute(query)
+
+        return result.scalars().first()
+    
+
+    @staticmethod
+    async def get_todo_list_version(db: AsyncSession, user_id: int, is_completed: bool | None = None, include_archived: bool = False):
+        result = await db.execute(todo_list_version_query(user_id, is_completed, include_archived))
+
+        return result.one()
+
+
+    @staticmethod
+    async def get_todo_version(db: AsyncSession, todo_id: int, include_archived: bool = False):
+        result = await db.execute(todo_version_query(todo_id, include_archived))
+
+        return result.first()
+
+    @staticmethod
+    async def get_sync_horizon(db: AsyncSession) -> int:
+        result = await db.execute(sync_horizon_query())
+
+        return result.scalar_one()
+
+
+    @staticmethod
+    async def get_todo_changes(db: AsyncSession, owner_id: int, position: list | None, limit: int, horizon: int):
+        result = await db.execute(todo_changes_query(owner_id, position, limit, horizon))
+
+        return result.all()
+
+
+    @staticmethod
+    async def get_tombstones(db: AsyncSession, owner_id: int, position: list | None, limit: int, horizon: int):
+        result = await db.execute(tombstones_query(owner_id, position, limit, horizon))
+
+        return result.all()
+
+
+    @staticmethod
+    async def add_tombstones(db: AsyncSession, deleted):
+        if deleted:
+            await db.execute(tombstones_insert(deleted))
+
+
+    @staticmethod
+    async def get_todo_stats(db: AsyncSession, today: date, owner_id: int | None = None):
+        result = await db.execute(todo_stats_query(today, owner_id))
+
+        return result.all()
+
+
+    @staticmethod
+    def add_todo(db: AsyncSession, new_todo):
+        db.add(new_todo)
+
+        return new_todo
+    
+    
+    @staticmethod
+    async def delete_todo(db: AsyncSession, todo_model):
+        await db.delete(todo_model)
+
+        await AsyncTodoRepository.add_tombstones(db, [todo_model])
+
+
+    # Ownership is part of the WHERE clause, so the common case is a single
+    # round-trip; callers tell 403 from 404 only when nothing matched.
+    @staticmethod
+    async def delete_todo_by_id(db: AsyncSession, todo_id: int, owner_id: int | None = None):
+        query = (
+            delete(Todos.__table__)
+            .where(Todos.id == todo_id)
+            .returning(Todos.id, Todos.owner_id)
+        )
+
+        if owner_id is not None:
+            query = query.where(Todos.owner_id == owner_id)
+
+        deleted = (await db.execute(query)).first()
+
+        if deleted is not None:
+            await AsyncTodoRepository.add_tombstones(db, [deleted])
+
+        return deleted
+
+
+    @staticmethod
+    async def delete_todos_by_owner(db: AsyncSession, owner_id: int):
+        query = (
+            delete(Todos.__table__)
+            .where(Todos.owner_id == owner_id)
+            .returning(Todos.id, Todos.owner_id)
+        )
+
+        deleted = (await db.execute(query)).all()
+
+        await AsyncTodoRepository.add_tombstones(db, deleted)
+
+        return deleted
+
+
+    @staticmethod
+    async def update_todo_by_id(db: AsyncSession, todo_id: int, changes: dict, owner_id: int | None = None):
+        query = (
+            update(Todos.__table__)
+            .where(Todos.id == todo_id)
+            .values(**changes)
+            .returning(*Todos.__table__.c)
+        )
+
+        if owner_id is not None:
+            query = query.where(Todos.owner_id == owner_id)
+
+        result = await db.execute(query)
+
+        return result.first()
+
+    @staticmethod
+    async def search_todo(db: AsyncSession, todo, limit: int, cursor: str | None = None, include_archived: bool = False, columns=TODO_RESPONSE_COLUMNS):
+        query, order = search_todos_query(todo, limit, cursor, include_archived, columns)
+
+        result = await db.execute(query)
+
+        return keyset_page(result, order, limit)
+    
+
+    @staticmethod
+    async def get_user_id_by_todo_id(db: AsyncSession, todo_id):
+        query = (
+            select(Todos.owner_id)
+            .filter(Todos.id == todo_id)
+        )
+
+        result = await db.execute(query)
+
+        return result.scalars().first()
\ No newline at end of file
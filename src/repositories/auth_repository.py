@@ -2,16 +2,33 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from src.models.user_model import Users
+from src.utils.helpers import keyset_paginate, keyset_page, projection
+
+
+USER_ORDER = (Users.id,)
+
+USER_RESPONSE_COLUMNS = (
+    Users.id, Users.username, Users.first_name, Users.last_name, Users.date_of_birth,
+    Users.email_address, Users.role, Users.is_active, Users.created_at, Users.updated_at,
+)
+
+
+# Sparse fieldsets: UserResponseAdmin field names are Users column names.
+def user_columns(fields: tuple[str, ...] | None) -> tuple:
+    if fields is None:
+        return USER_RESPONSE_COLUMNS
+
+    return tuple(getattr(Users, name) for name in fields)
 
 
 class UserRepository:
     @staticmethod
-    def get_all_users(db: Session):
-        query = select(Users)
+    def get_all_users(db: Session, limit: int, cursor: str | None = None, columns=USER_RESPONSE_COLUMNS):
+        query = keyset_paginate(select(*projection(columns, USER_ORDER)), USER_ORDER, limit, cursor)
 
         result = db.execute(query)
 
-        return result.scalars().all()
+        return keyset_page(result, USER_ORDER, limit)
     
 
     @staticmethod
@@ -26,6 +43,29 @@ class UserRepository:
         return result.scalars().first()
     
 
+    @staticmethod
+    def get_user_fields(db: Session, user_id: int, columns):
+        query = (
+            select(*columns)
+            .filter(Users.id == user_id)
+        )
+
+        result = db.execute(query)
+
+        return result.first()
+    
+
+    @staticmethod
+    def get_user_updated_at(db: Session, user_id: int):
+        query = (
+            select(Users.updated_at)
+            .filter(Users.id == user_id)
+        )
+
+        result = db.execute(query)
+
+        return result.scalars().first()
+
     @staticmethod
     def delete_user_by_id(db: Session, user_model):
         db.delete(user_model)
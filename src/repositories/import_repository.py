@@ -0,0 +1,122 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+from typing import NamedTuple
+
+
+TODO_IMPORT_COLUMNS = ("title", "deadline", "description", "priority", "is_completed", "owner_id")
+USER_IMPORT_COLUMNS = (
+    "username", "first_name", "last_name", "date_of_birth",
+    "email_address", "password_hash", "role", "is_active",
+)
+
+CREATE_TODOS_STAGING = """
+    CREATE TEMP TABLE IF NOT EXISTS todos_staging (
+        line_no integer NOT NULL,
+        title varchar(50) NOT NULL,
+        deadline date NOT NULL,
+        description varchar(100) NOT NULL,
+        priority todopriority NOT NULL,
+        is_completed boolean NOT NULL,
+        owner_id integer NOT NULL
+    ) ON COMMIT DROP
+"""
+
+CREATE_USERS_STAGING = """
+    CREATE TEMP TABLE IF NOT EXISTS users_staging (
+        line_no integer NOT NULL,
+        username varchar(20) NOT NULL,
+        first_name varchar(30) NOT NULL,
+        last_name varchar(30) NOT NULL,
+        date_of_birth date NOT NULL,
+        email_address varchar(50) NOT NULL,
+        password_hash varchar NOT NULL,
+        role userrole NOT NULL,
+        is_active boolean NOT NULL
+    ) ON COMMIT DROP
+"""
+
+# The data-modifying CTE inserts what it can and the outer query returns the
+# staged lines that did not make it, with a reason, so one statement both
+# merges and reports. The todos merge also returns the inserted lines, with a
+# NULL reason and the new id, so the import can record them as changes.
+MERGE_TODOS = """
+    WITH inserted AS (
+        INSERT INTO todos (title, deadline, description, priority, is_completed, owner_id)
+        SELECT s.title, s.deadline, s.description, s.priority, s.is_completed, s.owner_id
+        FROM todos_staging s
+        WHERE EXISTS (SELECT 1 FROM users u WHERE u.id = s.owner_id)
+        ORDER BY s.line_no
+        ON CONFLICT ON CONSTRAINT uix_title_deadline DO NOTHING
+        RETURNING id, owner_id, title, deadline
+    )
+    SELECT
+        s.line_no,
+        CASE
+            WHEN i.id IS NOT NULL THEN NULL
+            WHEN NOT EXISTS (SELECT 1 FROM users u WHERE u.id = s.owner_id) THEN 'unknown owner_id'
+            ELSE 'duplicate title and deadline'
+        END AS reason,
+        i.id AS todo_id,
+        i.owner_id
+    FROM todos_staging s
+    LEFT JOIN inserted i ON i.title = s.title AND i.deadline = s.deadline
+    ORDER BY s.line_no
+"""
+
+MERGE_USERS = """
+    WITH inserted AS (
+        INSERT INTO users (username, first_name, last_name, date_of_birth, email_address, password_hash, role, is_active)
+        SELECT s.username, s.first_name, s.last_name, s.date_of_birth, s.email_address, s.password_hash, s.role, s.is_active
+        FROM users_staging s
+        ORDER BY s.line_no
+        ON CONFLICT DO NOTHING
+        RETURNING username
+    )
+    SELECT s.line_no, 'duplicate username or email_address' AS reason
+    FROM users_staging s
+    LEFT JOIN inserted i ON i.username = s.username
+    WHERE i.username IS NULL
+    ORDER BY s.line_no
+"""
+
+
+class Staging(NamedTuple):
+    table: str
+    create: str
+    columns: tuple
+    merge: str
+
+
+TODOS_STAGING = Staging("todos_staging", CREATE_TODOS_STAGING, TODO_IMPORT_COLUMNS, MERGE_TODOS)
+USERS_STAGING = Staging("users_staging", CREATE_USERS_STAGING, USER_IMPORT_COLUMNS, MERGE_USERS)
+
+
+class ImportRepository:
+    @staticmethod
+    def create_staging(db: Session, staging: Staging):
+        db.execute(text(staging.create))
+        db.execute(text(f"TRUNCATE {staging.table}"))
+
+
+    # COPY goes straight through the psycopg connection that backs the
+    # session, so it runs inside the session's transaction.
+    @staticmethod
+    def copy_rows(db: Session, staging: Staging, rows):
+        driver_connection = db.connection().connection.driver_connection
+        columns = ", ".join(("line_no",) + staging.columns)
+
+        with driver_connection.cursor() as cursor:
+            with cursor.copy(f"COPY {staging.table} ({columns}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+
+
+    @staticmethod
+    def merge_staging(db: Session, staging: Staging):
+        result = db.execute(text(staging.merge))
+        merged = result.all()
+
+        db.execute(text(f"TRUNCATE {staging.table}"))
+
+        return merged
\ No newline at end of file
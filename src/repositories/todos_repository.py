@@ -1,29 +1,245 @@
+from datetime import date, datetime, timedelta
+
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, insert, update, delete, union_all, func, and_, any_, bindparam, case, tuple_, cast, Integer, BigInteger, Text
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+
+from src.models.todo_model import Todos, TodosArchive, TodoTombstones
+from src.models.user_model import Users
+from src.utils.helpers import keyset_paginate, keyset_page, like_contains, projection
+
+
+TODO_ORDER = (Todos.id,)
+TODO_ORDER_BY_DEADLINE = (Todos.deadline, Todos.id)
+
+# The TodoResponse fields. List reads select these columns instead of whole
+# entities, so no ORM identity-map work is done for rows that are only serialized.
+TODO_RESPONSE_COLUMNS = (
+    Todos.id, Todos.title, Todos.deadline, Todos.description,
+    Todos.priority, Todos.is_completed, Todos.owner_id,
+)
+
+TODO_EXPORT_COLUMNS = TODO_RESPONSE_COLUMNS
+
+
+# Sparse fieldsets: TodoResponse field names are Todos column names.
+def todo_columns(fields: tuple[str, ...] | None) -> tuple:
+    if fields is None:
+        return TODO_RESPONSE_COLUMNS
+
+    return tuple(getattr(Todos, name) for name in fields)
+
+# Delta sync reads each stream in writing-transaction order, with id breaking
+# ties between rows written by the same transaction.
+TODO_CHANGE_ORDER = (Todos.change_xid, Todos.id)
+TOMBSTONE_ORDER = (TodoTombstones.change_xid, TodoTombstones.id)
+
+# What a deadline reminder needs, in the order of ix_todos_open_deadline.
+REMINDER_ORDER = (Todos.deadline, Todos.id)
+REMINDER_COLUMNS = (*REMINDER_ORDER, Todos.owner_id, Todos.title)
+
+
+# Reads that may include archived todos select from a UNION ALL of both
+# tables. Postgres pushes the filters and the keyset condition into each
+# branch, so both tables are still read through their own indexes.
+def todo_source(include_archived: bool = False):
+    if not include_archived:
+        return Todos.__table__
+
+    names = [column.name for column in Todos.__table__.c]
+
+    return union_all(
+        select(*(Todos.__table__.c[name] for name in names)),
+        select(*(TodosArchive.__table__.c[name] for name in names)),
+    ).subquery("todos")
+
+
+def source_columns(source, columns) -> tuple:
+    return tuple(source.c[column.key] for column in columns)
+
+
+def search_todo_query(todo, source=Todos.__table__):
+    columns = source.c
+    query = select(source)
+
+    # A single bound LIKE pattern against lower(column) is what the trigram
+    # indexes on lower(title) and lower(description) are built for.
+    if todo.title:
+        query = query.filter(func.lower(columns.title).like(like_contains(todo.title.lower()), escape="\\"))
+
+    if todo.deadline:
+        query = query.filter(columns.deadline == todo.deadline)
+
+    if todo.description:
+        query = query.filter(func.lower(columns.description).like(like_contains(todo.description.lower()), escape="\\"))
+
+    if todo.priority:
+        query = query.filter(columns.priority == todo.priority)
+
+    if todo.is_completed is not None:
+        query = query.filter(columns.is_completed == todo.is_completed)
+
+    return query
+
+
+def all_todos_query(limit: int, cursor: str | None, include_archived: bool, columns=TODO_RESPONSE_COLUMNS):
+    source = todo_source(include_archived)
+    order = source_columns(source, TODO_ORDER)
+
+    query = select(*source_columns(source, projection(columns, TODO_ORDER)))
+
+    return keyset_paginate(query, order, limit, cursor), order
+
+
+def user_todos_query(user_id: int, limit: int, cursor: str | None, is_completed: bool | None, include_archived: bool, columns=TODO_RESPONSE_COLUMNS):
+    source = todo_source(include_archived)
+    order = source_columns(source, TODO_ORDER_BY_DEADLINE)
+
+    query = (
+        select(*source_columns(source, projection(columns, TODO_ORDER_BY_DEADLINE)))
+        .filter(source.c.owner_id == user_id)
+    )
+
+    if is_completed is not None:
+        query = query.filter(source.c.is_completed == is_completed)
+
+    return keyset_paginate(query, order, limit, cursor), order
+
+
+def search_todos_query(todo, limit: int, cursor: str | None, include_archived: bool, columns=TODO_RESPONSE_COLUMNS):
+    source = todo_source(include_archived)
+    order = source_columns(source, TODO_ORDER)
+
+    query = search_todo_query(todo, source).with_only_columns(*source_columns(source, projection(columns, TODO_ORDER)))
+
+    return keyset_paginate(query, order, limit, cursor), order
+
+
+# Cheap validators for conditional GETs: one aggregate row, no entities.
+def todo_list_version_query(user_id: int, is_completed: bool | None, include_archived: bool):
+    source = todo_source(include_archived)
+
+    query = (
+        select(func.max(source.c.updated_at), func.count(source.c.id))
+        .filter(source.c.owner_id == user_id)
+    )
+
+    if is_completed is not None:
+        query = query.filter(source.c.is_completed == is_completed)
+
+    return query
+
+
+def todo_fields_query(todo_id: int, columns, include_archived: bool):
+    source = todo_source(include_archived)
+
+    return select(*source_columns(source, projection(columns, (Todos.owner_id,)))).filter(source.c.id == todo_id)
+
+
+def todo_version_query(todo_id: int, include_archived: bool):
+    source = todo_source(include_archived)
+
+    return select(source.c.owner_id, source.c.updated_at).filter(source.c.id == todo_id)
+
 
-from src.models.todo_model import Todos
+# Buckets are relative to `today`, so they are computed per query rather than
+# stored. Grouping over a subquery keeps the CASE (and its binds) out of the
+# GROUP BY clause.
+def todo_stats_query(today: date, owner_id: int | None = None):
+    end_of_week = today + timedelta(days=6 - today.weekday())
+
+    bucket = case(
+        (Todos.deadline < today, "overdue"),
+        (Todos.deadline == today, "today"),
+        (Todos.deadline <= end_of_week, "this_week"),
+        else_="later",
+    )
+
+    bucketed = select(Todos.priority, Todos.is_completed, bucket.label("deadline_bucket"))
+
+    if owner_id is not None:
+        bucketed = bucketed.filter(Todos.owner_id == owner_id)
+
+    bucketed = bucketed.subquery()
+    groups = (bucketed.c.priority, bucketed.c.is_completed, bucketed.c.deadline_bucket)
+
+    return select(*groups, func.count().label("count")).group_by(*groups)
+
+
+# The oldest transaction that may still be running; everything below it has
+# committed or aborted. It must be read before the changes it bounds.
+def sync_horizon_query():
+    return select(cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger))
+
+
+# Rows written by transactions at or above the horizon are held back, so the
+# watermark never moves past a write that could still commit below it.
+def changed_since_query(query, order, position: list | None, limit: int, horizon: int):
+    if position is not None:
+        query = query.filter(tuple_(*order) > tuple_(*position))
+
+    query = query.filter(order[0] < horizon)
+
+    return query.order_by(*order).limit(limit + 1)
+
+
+def todo_changes_query(owner_id: int, position: list | None, limit: int, horizon: int):
+    query = (
+        select(*TODO_RESPONSE_COLUMNS, Todos.updated_at, Todos.change_xid)
+        .filter(Todos.owner_id == owner_id)
+    )
+
+    return changed_since_query(query, TODO_CHANGE_ORDER, position, limit, horizon)
+
+
+def tombstones_query(owner_id: int, position: list | None, limit: int, horizon: int):
+    query = (
+        select(TodoTombstones.todo_id, TodoTombstones.is_archived, *TOMBSTONE_ORDER)
+        .filter(TodoTombstones.owner_id == owner_id)
+    )
+
+    return changed_since_query(query, TOMBSTONE_ORDER, position, limit, horizon)
+
+
+# Tombstones past the sync retention window, oldest first, one batch at a time.
+def prune_tombstones_query(cutoff: datetime, limit: int):
+    batch = (
+        select(TodoTombstones.id)
+        .filter(TodoTombstones.deleted_at < cutoff)
+        .order_by(TodoTombstones.deleted_at, TodoTombstones.id)
+        .limit(limit)
+    )
+
+    return delete(TodoTombstones.__table__).where(TodoTombstones.id.in_(batch.scalar_subquery()))
+
+
+def tombstones_insert(deleted, is_archived: bool = False):
+    return insert(TodoTombstones.__table__).values([
+        {"todo_id": todo.id, "owner_id": todo.owner_id, "is_archived": is_archived} for todo in deleted
+    ])
+
+
+def todo_ids_param(todo_ids):
+    return any_(bindparam("todo_ids", list(todo_ids), type_=ARRAY(Integer)))
 
 
 class TodoRepository:
     @staticmethod
-    def get_all_todos(db: Session):
-        query = select(Todos)
+    def get_all_todos(db: Session, limit: int, cursor: str | None = None, include_archived: bool = False, columns=TODO_RESPONSE_COLUMNS):
+        query, order = all_todos_query(limit, cursor, include_archived, columns)
 
         result = db.execute(query)
 
-        return result.scalars().all()
+        return keyset_page(result, order, limit)
     
 
     @staticmethod
-    def get_todo_by_user_id(db: Session, user_id: int):
-        query = (
-            select(Todos)
-            .filter(Todos.user_id == user_id)
-        )
+    def get_todo_by_user_id(db: Session, user_id: int, limit: int, cursor: str | None = None, is_completed: bool | None = None, include_archived: bool = False, columns=TODO_RESPONSE_COLUMNS):
+        query, order = user_todos_query(user_id, limit, cursor, is_completed, include_archived, columns)
 
         result = db.execute(query)
 
-        return result.scalars().all()
+        return keyset_page(result, order, limit)
     
 
     @staticmethod
@@ -36,8 +252,101 @@ class TodoRepository:
         result = db.execute(query)
 
         return result.scalars().first()
+
+
+    # Column-only read for sparse fieldsets; owner_id is always selected for
+    # the access check.
+    @staticmethod
+    def get_todo_fields(db: Session, todo_id: int, columns, include_archived: bool = False):
+        result = db.execute(todo_fields_query(todo_id, columns, include_archived))
+
+        return result.first()
+
+
+    @staticmethod
+    def get_archived_todo_by_id(db: Session, todo_id: int):
+        return db.get(TodosArchive, todo_id)
     
 
+    @staticmethod
+    def get_todo_list_version(db: Session, user_id: int, is_completed: bool | None = None, include_archived: bool = False):
+        result = db.execute(todo_list_version_query(user_id, is_completed, include_archived))
+
+        return result.one()
+
+
+    @staticmethod
+    def get_todo_version(db: Session, todo_id: int, include_archived: bool = False):
+        result = db.execute(todo_version_query(todo_id, include_archived))
+
+        return result.first()
+
+    @staticmethod
+    def get_sync_horizon(db: Session) -> int:
+        return db.execute(sync_horizon_query()).scalar_one()
+
+
+    @staticmethod
+    def get_todo_changes(db: Session, owner_id: int, position: list | None, limit: int, horizon: int):
+        result = db.execute(todo_changes_query(owner_id, position, limit, horizon))
+
+        return result.all()
+
+
+    @staticmethod
+    def get_tombstones(db: Session, owner_id: int, position: list | None, limit: int, horizon: int):
+        result = db.execute(tombstones_query(owner_id, position, limit, horizon))
+
+        return result.all()
+
+
+    @staticmethod
+    def prune_tombstones(db: Session, cutoff: datetime, limit: int) -> int:
+        return db.execute(prune_tombstones_query(cutoff, limit)).rowcount
+
+
+    # Every delete path goes through here so delta sync sees the removal.
+    @staticmethod
+    def add_tombstones(db: Session, deleted, is_archived: bool = False):
+        if deleted:
+            db.execute(tombstones_insert(deleted, is_archived))
+
+
+    # `NOT is_completed` has to match the partial index predicate verbatim.
+    @staticmethod
+    def get_open_todos_due(db: Session, min_deadline: date, position: tuple | None, limit: int):
+        query = (
+            select(*REMINDER_COLUMNS)
+            .filter(~Todos.is_completed, Todos.deadline >= min_deadline)
+        )
+
+        if position is not None:
+            query = query.filter(tuple_(*REMINDER_ORDER) > tuple_(*position))
+
+        result = db.execute(query.order_by(*REMINDER_ORDER).limit(limit))
+
+        return result.all()
+
+
+    @staticmethod
+    def get_open_todos_by_ids(db: Session, todo_ids: list[int]):
+        query = (
+            select(*REMINDER_COLUMNS)
+            .filter(Todos.id == todo_ids_param(todo_ids), ~Todos.is_completed)
+        )
+
+        result = db.execute(query)
+
+        return result.all()
+
+
+    @staticmethod
+    def get_todo_stats(db: Session, today: date, owner_id: int | None = None):
+        result = db.execute(todo_stats_query(today, owner_id))
+
+        return result.all()
+
+
     @staticmethod
     def add_todo(db: Session, new_todo):
         db.add(new_todo)
@@ -49,38 +358,207 @@ class TodoRepository:
     def delete_todo(db: Session, todo_model):
         db.delete(todo_model)
 
+        TodoRepository.add_tombstones(db, [todo_model])
 
+
+    # Ownership is part of the WHERE clause, so the common case is a single
+    # round-trip; callers tell 403 from 404 only when nothing matched.
     @staticmethod
-    def search_todo(db: Session, todo):
-        query = select(Todos)
+    def delete_todo_by_id(db: Session, todo_id: int, owner_id: int | None = None):
+        query = (
+            delete(Todos.__table__)
+            .where(Todos.id == todo_id)
+            .returning(Todos.id, Todos.owner_id)
+        )
 
-        if todo.title:
-            query = query.filter(func.lower(Todos.title).contains(todo.title.lower()))
+        if owner_id is not None:
+            query = query.where(Todos.owner_id == owner_id)
 
-        if todo.deadline:
-            query = query.filter(Todos.deadline == todo.deadline)
+        deleted = db.execute(query).first()
 
-        if todo.description:
-            query = query.filter(func.lower(Todos.description).contains(todo.description.lower()))
+        if deleted is not None:
+            TodoRepository.add_tombstones(db, [deleted])
 
-        if todo.priority:
-            query = query.filter(Todos.priority == todo.priority)
+        return deleted
 
-        if todo.is_completed is not None:
-            query = query.filter(Todos.is_completed == todo.is_completed)
+
+    @staticmethod
+    def update_todo_by_id(db: Session, todo_id: int, changes: dict, owner_id: int | None = None):
+        query = (
+            update(Todos.__table__)
+            .where(Todos.id == todo_id)
+            .values(**changes)
+            .returning(*Todos.__table__.c)
+        )
+
+        if owner_id is not None:
+            query = query.where(Todos.owner_id == owner_id)
 
         result = db.execute(query)
 
-        return result.scalars().all()
+        return result.first()
+
+    @staticmethod
+    def search_todo(db: Session, todo, limit: int, cursor: str | None = None, include_archived: bool = False, columns=TODO_RESPONSE_COLUMNS):
+        query, order = search_todos_query(todo, limit, cursor, include_archived, columns)
+
+        result = db.execute(query)
+
+        return keyset_page(result, order, limit)
     
 
     @staticmethod
     def get_user_id_by_todo_id(db: Session, todo_id):
         query = (
-            select(Todos.user_id)
+            select(Todos.owner_id)
             .filter(Todos.id == todo_id)
         )
 
         result = db.execute(query)
 
-        return result.scalars().first()
\ No newline at end of file
+        return result.scalars().first()
+
+
+    # Bulk writes go through the Core table so the returned rows are plain
+    # tuples, not session-tracked entities that commit() would expire.
+    #
+    # Items the table would refuse for any reason other than uix_title_deadline
+    # (a missing description, an unknown owner) are rejected before the insert,
+    # like imported lines, so one bad item does not fail the whole batch.
+    @staticmethod
+    def bulk_add_todos(db: Session, rows: list[dict]):
+        owner_ids = list({row["owner_id"] for row in rows})
+        known_owners = set(db.execute(
+            select(Users.id).filter(Users.id == any_(bindparam("owner_ids", owner_ids, type_=ARRAY(Integer))))
+        ).scalars())
+
+        rejected = []
+        first_index = {}
+
+        for index, row in enumerate(rows):
+            if row["description"] is None:
+                rejected.append({"index": index, "reason": "description: Field required"})
+            elif row["owner_id"] not in known_owners:
+                rejected.append({"index": index, "reason": "unknown owner_id"})
+            else:
+                first_index.setdefault((row["title"], row["deadline"]), index)
+
+        created = []
+
+        if first_index:
+            query = (
+                pg_insert(Todos.__table__)
+                .on_conflict_do_nothing(constraint="uix_title_deadline")
+                .returning(*Todos.__table__.c)
+            )
+
+            created = db.execute(query, [rows[index] for index in first_index.values()]).all()
+
+        created_keys = {(todo.title, todo.deadline) for todo in created}
+        rejected_indexes = {item["index"] for item in rejected}
+
+        conflicts = [
+            {"index": index, "title": row["title"], "deadline": row["deadline"]}
+            for index, row in enumerate(rows)
+            if index not in rejected_indexes
+            and (first_index[(row["title"], row["deadline"])] != index or (row["title"], row["deadline"]) not in created_keys)
+        ]
+
+        return {"created": created, "conflicts": conflicts, "rejected": rejected}
+
+
+    @staticmethod
+    def bulk_update_todos(db: Session, todo_ids: list[int], changes: dict, owner_id: int | None = None):
+        query = (
+            update(Todos.__table__)
+            .where(Todos.id == todo_ids_param(todo_ids))
+            .values(**changes)
+            .returning(Todos.id, Todos.owner_id)
+        )
+
+        if owner_id is not None:
+            query = query.where(Todos.owner_id == owner_id)
+
+        result = db.execute(query)
+
+        return result.all()
+
+
+    @staticmethod
+    def bulk_delete_todos(db: Session, todo_ids: list[int], owner_id: int | None = None):
+        query = (
+            delete(Todos.__table__)
+            .where(Todos.id == todo_ids_param(todo_ids))
+            .returning(Todos.id, Todos.owner_id)
+        )
+
+        if owner_id is not None:
+            query = query.where(Todos.owner_id == owner_id)
+
+        deleted = db.execute(query).all()
+
+        TodoRepository.add_tombstones(db, deleted)
+
+        return deleted
+
+
+    @staticmethod
+    def delete_todos_by_owner(db: Session, owner_id: int):
+        query = (
+            delete(Todos.__table__)
+            .where(Todos.owner_id == owner_id)
+            .returning(Todos.id, Todos.owner_id)
+        )
+
+        deleted = db.execute(query).all()
+
+        TodoRepository.add_tombstones(db, deleted)
+
+        return deleted
+
+
+    # Moves one batch of old completed todos into todos_archive. SKIP LOCKED
+    # leaves rows a user is editing for a later batch instead of waiting on them.
+    @staticmethod
+    def archive_completed_todos(db: Session, cutoff: date, limit: int):
+        batch = (
+            select(Todos.id)
+            .filter(Todos.is_completed, Todos.deadline < cutoff)
+            .order_by(Todos.deadline, Todos.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        query = (
+            delete(Todos.__table__)
+            .where(Todos.id.in_(batch.scalar_subquery()))
+            .returning(*Todos.__table__.c)
+        )
+
+        archived = db.execute(query).all()
+
+        if archived:
+            db.execute(insert(TodosArchive.__table__), [todo._asdict() for todo in archived])
+
+        # Archived todos leave the live list, so delta sync has to drop them;
+        # the tombstone says they were archived, not deleted.
+        TodoRepository.add_tombstones(db, archived, is_archived=True)
+
+        return archived
+
+
+    # yield_per makes the driver use a server-side cursor, so only one
+    # partition of plain column tuples is held in memory at a time.
+    @staticmethod
+    def stream_todos(db: Session, todo, chunk_size: int):
+        query = (
+            search_todo_query(todo)
+            .with_only_columns(*TODO_EXPORT_COLUMNS)
+            .order_by(Todos.id)
+            .execution_options(yield_per=chunk_size)
+        )
+
+        result = db.execute(query)
+
+        for partition in result.mappings().partitions():
+            yield partition
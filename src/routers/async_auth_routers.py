@@ -0,0 +1,86 @@
+from fastapi import APIRouter, Depends, Path, HTTPException, Header, Request, Response
+from fastapi.security import OAuth2PasswordRequestForm
+
+from starlette import status
+from typing import Annotated, Optional
+from datetime import timedelta
+
+from db.database import async_db_dependency
+from src.core.security import user_dependency, password_hasher, login_rate_limiter
+from src.services.async_auth_services import AsyncAuthService
+from src.utils.helpers import etag_matches, not_modified
+from src.services.token_services import create_access_token
+from src.schemas.user_schemas import UserResponsePublic, UserUpdate, UserUpdatePassword, UserCreatePublic
+from src.schemas.token_schemas import Token
+
+
+router = APIRouter(
+    prefix="/auth",
+    tags=["Auth"]
+)
+
+MESSAGE_401 = "Could not validate user"
+
+
+@router.get("/{user_id}", response_model=UserResponsePublic, status_code=status.HTTP_200_OK)
+async def get_users_by_id(
+        db: async_db_dependency,
+        user: user_dependency,
+        user_id: Annotated[int, Path(ge=1)],
+        response: Response,
+        if_none_match: Annotated[Optional[str], Header()] = None):
+    
+    etag = await AsyncAuthService.get_user_etag(db, user, user_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
+
+    return await AsyncAuthService.get_user_by_id(db, user, user_id)
+
+
+@router.post("/user_registration", response_model=UserResponsePublic, status_code=status.HTTP_201_CREATED)
+async def add_users(
+        db: async_db_dependency, 
+        user_request: UserCreatePublic):
+    return await AsyncAuthService.register_user(db, user_request, password_hasher)
+
+
+@router.put("/{user_id}", response_model=UserResponsePublic, status_code=status.HTTP_200_OK)
+async def update_user_by_id(
+        db: async_db_dependency,
+        user: user_dependency, 
+        user_request: UserUpdate, 
+        user_id: Annotated[int, Path(ge=1)]):
+    
+    return await AsyncAuthService.update_user_by_id(db, user, user_request, user_id)
+
+
+@router.put("/{user_id}/password_updating", status_code=status.HTTP_204_NO_CONTENT)
+async def update_user_password(
+        db: async_db_dependency,
+        user: user_dependency, 
+        user_request: UserUpdatePassword, 
+        user_id: Annotated[int, Path(ge=1)]):
+
+    await AsyncAuthService.update_user_password(db, user, user_request, user_id, password_hasher)
+
+
+@router.post("/token", response_model=Token)
+async def login_for_access_token(
+        form_data: Annotated[OAuth2PasswordRequestForm, Depends()], 
+        db: async_db_dependency,
+        request: Request):
+    
+    login_rate_limiter.check(form_data.username, login_rate_limiter.client_ip(request))
+
+    user = await AsyncAuthService.authenticate_user(form_data.username, form_data.password, db, password_hasher)
+
+    if not user:
+        login_rate_limiter.record_failure(form_data.username)
+
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=MESSAGE_401)
+    
+    token = create_access_token(user.username, user.id, user.role, timedelta(minutes=20))
+
+    return {'access_token': token, 'token_type': 'bearer'}
\ No newline at end of file
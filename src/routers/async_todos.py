@@ -0,0 +1,92 @@
+from fastapi import APIRouter, Depends, Path, Query, Header, Response
+
+from typing import Annotated, Optional
+
+from starlette import status
+
+from db.database import async_db_dependency
+from src.core.security import user_dependency
+from src.schemas.todos_schemas import TodoCreatePublic, TodoResponse, TodoUpdatePublic, TodoStats, TodoChanges
+from src.schemas.pagination_schemas import Page, PaginationParams
+from src.services.async_todo_services import AsyncTodoService
+from src.utils.helpers import etag_matches, not_modified
+from src.core.serialization import fast_response
+
+
+router = APIRouter(
+    prefix="/todos",
+    tags=["Todos"]
+)
+    
+
+@router.get("/users/{user_id}/todos", response_model=Page[TodoResponse], status_code=status.HTTP_200_OK)
+async def get_todos_by_user_id(
+        db: async_db_dependency,
+        user: user_dependency, 
+        user_id: Annotated[int, Path(ge=1)],
+        pagination: Annotated[PaginationParams, Depends()],
+        response: Response,
+        is_completed: Annotated[Optional[bool], Query()] = None,
+        include_archived: Annotated[bool, Query()] = False,
+        fields: Annotated[Optional[str], Query(max_length=300)] = None,
+        if_none_match: Annotated[Optional[str], Header()] = None):
+    
+    etag = await AsyncTodoService.get_todos_etag(db, user, user_id, pagination, is_completed, include_archived, fields)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
+
+    return fast_response(
+        await AsyncTodoService.get_todos_by_user_id(db, user, user_id, pagination, is_completed, include_archived, fields),
+        response.headers,
+        fields
+    )
+
+
+
+@router.get("/users/{user_id}/todos/stats", response_model=TodoStats, status_code=status.HTTP_200_OK)
+async def get_todo_stats(
+        db: async_db_dependency,
+        user: user_dependency,
+        user_id: Annotated[int, Path(ge=1)]):
+
+    return await AsyncTodoService.get_todo_stats(db, user, user_id)
+
+
+@router.get("/changes", response_model=TodoChanges, status_code=status.HTTP_200_OK)
+async def get_todo_changes(
+        db: async_db_dependency,
+        user: user_dependency,
+        since: Annotated[Optional[str], Query(max_length=300)] = None,
+        limit: Annotated[int, Query(ge=1, le=1000)] = 500):
+
+    return fast_response(await AsyncTodoService.get_todo_changes(db, user, since, limit))
+
+
+@router.post("", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
+async def add_todos(
+        db: async_db_dependency,
+        user: user_dependency,
+        todo_request: TodoCreatePublic):
+    
+    return await AsyncTodoService.add_todo(db, user, todo_request)
+    
+
+@router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_todo_by_id(
+    db: async_db_dependency,
+    user: user_dependency, 
+    todo_id: Annotated[int, Path(ge=1)]):
+
+    await AsyncTodoService.delete_todo_by_id(db, user, todo_id)
+
+
+@router.put("/{todo_id}", response_model=TodoResponse, status_code=status.HTTP_200_OK)
+async def update_todo_by_id(
+    db: async_db_dependency,
+    user: user_dependency, 
+    todo_request: TodoUpdatePublic, 
+    todo_id: Annotated[int, Path(ge=1)]):
+    
+    return await AsyncTodoService.update_todo_by_id(db, user, todo_request, todo_id)
@@ -0,0 +1,109 @@
+from fastapi import APIRouter, Depends, Path, Query, status, Header, Response
+
+from typing import Annotated, Optional
+
+from db.database import async_db_dependency
+from src.core.security import user_dependency, password_hasher
+from src.schemas.todos_schemas import TodoResponse, TodoSearch, TodoCreateAdmin, TodoStats
+from src.schemas.user_schemas import UserResponseAdmin, UserCreateAdmin
+from src.schemas.pagination_schemas import Page, PaginationParams
+from src.services.async_user_services import AsyncUserService
+from src.utils.helpers import etag_matches, not_modified
+from src.core.serialization import fast_response
+
+
+router = APIRouter(
+    prefix="/users",
+    tags=["Users"]
+)
+
+
+@router.get("/users", response_model=Page[UserResponseAdmin], status_code=status.HTTP_200_OK)
+async def get_all_users(
+        db: async_db_dependency, 
+        user: user_dependency,
+        pagination: Annotated[PaginationParams, Depends()],
+        fields: Annotated[Optional[str], Query(max_length=300)] = None):
+       
+    return fast_response(await AsyncUserService.get_all_users(db, user, pagination, fields), fields=fields)
+
+
+@router.get("/users/{user_id}", response_model=UserResponseAdmin, status_code=status.HTTP_200_OK)
+async def get_user_by_id(
+        db: async_db_dependency, 
+        user: user_dependency,
+        user_id: Annotated[int, Path(ge=1)],
+        response: Response,
+        fields: Annotated[Optional[str], Query(max_length=300)] = None,
+        if_none_match: Annotated[Optional[str], Header()] = None):
+    
+    etag = await AsyncUserService.get_user_etag(db, user, user_id, fields)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
+
+    user_model = await AsyncUserService.get_user_by_id(db, user, user_id, fields)
+
+    if fields is None:
+        return user_model
+
+    return fast_response(user_model, response.headers, fields)
+
+
+@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_user_by_id(
+        db: async_db_dependency, 
+        user: user_dependency,
+        user_id: Annotated[int, Path(ge=1)]):
+
+    await AsyncUserService.delete_user_by_id(db, user, user_id)
+
+
+@router.post("/user_registration", response_model=UserResponseAdmin, status_code=status.HTTP_201_CREATED)
+async def add_users_admin(
+        user: user_dependency,
+        db: async_db_dependency, 
+        user_request: UserCreateAdmin):
+
+    return await AsyncUserService.register_user(db, user, user_request, password_hasher)
+    
+
+@router.get("/todos", response_model=Page[TodoResponse], status_code=status.HTTP_200_OK)
+async def get_all_todos(
+        db: async_db_dependency,
+        user: user_dependency,
+        pagination: Annotated[PaginationParams, Depends()],
+        include_archived: Annotated[bool, Query()] = False,
+        fields: Annotated[Optional[str], Query(max_length=300)] = None):
+    
+    return fast_response(await AsyncUserService.get_all_todos(db, user, pagination, include_archived, fields), fields=fields)
+
+
+@router.get("/todos/stats", response_model=TodoStats, status_code=status.HTTP_200_OK)
+async def get_todo_stats(
+        db: async_db_dependency,
+        user: user_dependency):
+
+    return await AsyncUserService.get_todo_stats(db, user)
+
+
+@router.get("/todos/search", response_model=Page[TodoResponse], status_code=status.HTTP_200_OK)
+async def search_todos(
+        db: async_db_dependency, 
+        user: user_dependency,
+        search_request: Annotated[TodoSearch, Depends()],
+        pagination: Annotated[PaginationParams, Depends()],
+        include_archived: Annotated[bool, Query()] = False,
+        fields: Annotated[Optional[str], Query(max_length=300)] = None):
+    
+    return fast_response(await AsyncUserService.search_todos(db, user, search_request, pagination, include_archived, fields), fields=fields)
+
+
+@router.post("/todos", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
+async def add_todo_admin(
+        db: async_db_dependency,
+        user: user_dependency,
+        todo_request: TodoCreateAdmin):
+    
+    return await AsyncUserService.add_todo_admin(db, user, todo_request)
\ No newline at end of file
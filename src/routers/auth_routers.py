@@ -1,15 +1,17 @@
-from fastapi import APIRouter, Depends, Path, HTTPException
+from fastapi import APIRouter, Depends, Path, HTTPException, Header, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
 
 from starlette import status
-from typing import Annotated
+from typing import Annotated, Optional
 from datetime import timedelta
 
 from db.database import db_dependency
-from src.core.security import user_dependency, bcrypt_context
+from src.core.security import user_dependency, password_hasher, login_rate_limiter
 from src.services.auth_services import AuthService
 from src.services.token_services import create_access_token
-from src.schemas.user_schemas import UserResponse, UserUpdate, UserUpdatePassword, Token, UserCreatePublic
+from src.utils.helpers import etag_matches, not_modified
+from src.schemas.user_schemas import UserResponsePublic, UserUpdate, UserUpdatePassword, UserCreatePublic
+from src.schemas.token_schemas import Token
 
 from src.services.auth_services import AuthService
 
@@ -22,23 +24,31 @@ router = APIRouter(
 MESSAGE_401 = "Could not validate user"
 
 
-@router.get("/{user_id}", response_model=UserResponse, status_code=status.HTTP_200_OK)
+@router.get("/{user_id}", response_model=UserResponsePublic, status_code=status.HTTP_200_OK)
 def get_users_by_id(
         db: db_dependency,
         user: user_dependency,
-        user_id: Annotated[int, Path(ge=1)]):
+        user_id: Annotated[int, Path(ge=1)],
+        response: Response,
+        if_none_match: Annotated[Optional[str], Header()] = None):
     
+    etag = AuthService.get_user_etag(db, user, user_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
+
     return AuthService.get_user_by_id(db, user, user_id)
 
 
-@router.post("/user_registration", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/user_registration", response_model=UserResponsePublic, status_code=status.HTTP_201_CREATED)
 def add_users(
         db: db_dependency, 
         user_request: UserCreatePublic):
-    return AuthService.register_user(db, user_request, bcrypt_context)
+    return AuthService.register_user(db, user_request, password_hasher)
 
 
-@router.put("/{user_id}", response_model=UserResponse, status_code=status.HTTP_200_OK)
+@router.put("/{user_id}", response_model=UserResponsePublic, status_code=status.HTTP_200_OK)
 def update_user_by_id(
         db: db_dependency,
         user: user_dependency, 
@@ -55,17 +65,22 @@ def update_user_password(
         user_request: UserUpdatePassword, 
         user_id: Annotated[int, Path(ge=1)]):
 
-    AuthService.update_user_password(db, user, user_request, user_id, bcrypt_context)
+    AuthService.update_user_password(db, user, user_request, user_id, password_hasher)
 
 
 @router.post("/token", response_model=Token)
 def login_for_access_token(
         form_data: Annotated[OAuth2PasswordRequestForm, Depends()], 
-        db: db_dependency):
+        db: db_dependency,
+        request: Request):
     
-    user = AuthService.authenticate_user(form_data.username, form_data.password, db, bcrypt_context)
+    login_rate_limiter.check(form_data.username, login_rate_limiter.client_ip(request))
+
+    user = AuthService.authenticate_user(form_data.username, form_data.password, db, password_hasher)
 
     if not user:
+        login_rate_limiter.record_failure(form_data.username)
+
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=MESSAGE_401)
     
     token = create_access_token(user.username, user.id, user.role, timedelta(minutes=20))
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Header, HTTPException, Path, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+
+from typing import Annotated, Optional
+
+from src.core.security import user_dependency
+from src.services.change_feed_services import ChangeFeedService
+
+
+router = APIRouter(
+    prefix="/todos",
+    tags=["Todos"]
+)
+
+
+# Server-Sent Events. EventSource resends the last received id as
+# Last-Event-ID on reconnect; `since` does the same for other clients.
+@router.get("/users/{user_id}/feed", status_code=status.HTTP_200_OK)
+async def todo_feed(
+        user: user_dependency,
+        user_id: Annotated[int, Path(ge=1)],
+        since: Annotated[Optional[int], Query(ge=0)] = None,
+        last_event_id: Annotated[Optional[int], Header()] = None):
+
+    ChangeFeedService.authorize(user, user_id)
+
+    return StreamingResponse(
+        ChangeFeedService.sse_events(user_id, since if since is not None else last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/users/{user_id}/feed/ws")
+async def todo_feed_ws(
+        websocket: WebSocket,
+        user_id: Annotated[int, Path(ge=1)],
+        since: Annotated[Optional[int], Query(ge=0)] = None):
+
+    try:
+        user = await ChangeFeedService.authenticate_websocket(websocket)
+        ChangeFeedService.authorize(user, user_id)
+    except HTTPException as error:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=error.detail)
+        return
+    except WebSocketDisconnect:
+        return
+
+    try:
+        await ChangeFeedService.websocket_events(websocket, user_id, since)
+    except WebSocketDisconnect:
+        pass
\ No newline at end of file
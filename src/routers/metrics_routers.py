@@ -0,0 +1,16 @@
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from src.core.metrics import CONTENT_TYPE
+from src.services.system_services import SystemService
+
+
+router = APIRouter(
+    tags=["System"]
+)
+
+
+# Left unauthenticated for scrapers; expose it on an internal network only.
+@router.get("/metrics", response_class=PlainTextResponse, status_code=status.HTTP_200_OK, include_in_schema=False)
+def get_metrics():
+    return PlainTextResponse(SystemService.get_metrics(), media_type=CONTENT_TYPE)
\ No newline at end of file
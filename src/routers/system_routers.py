@@ -0,0 +1,25 @@
+from fastapi import APIRouter, status
+
+from src.core.security import user_dependency
+from src.services.system_services import SystemService
+
+
+router = APIRouter(
+    prefix="/system",
+    tags=["System"]
+)
+
+
+@router.get("/db_pool", status_code=status.HTTP_200_OK)
+def get_pool_stats(user: user_dependency):
+    return SystemService.get_pool_stats(user)
+
+
+@router.get("/jwt_cache", status_code=status.HTTP_200_OK)
+def get_jwt_cache_stats(user: user_dependency):
+    return SystemService.get_jwt_cache_stats(user)
+
+
+@router.get("/queries", status_code=status.HTTP_200_OK)
+def get_query_stats(user: user_dependency):
+    return SystemService.get_query_stats(user)
\ No newline at end of file
@@ -1,15 +1,21 @@
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query, Header, Response
 
 from sqlalchemy.orm import Session
 
-from typing import Annotated
+from typing import Annotated, Optional
 
 from starlette import status
 
 from db.database import get_db
 from src.core.security import get_current_user
-from src.schemas.todos_schemas import TodoCreatePublic, TodoResponse, TodoUpdate
+from src.schemas.todos_schemas import (
+    TodoCreatePublic, TodoResponse, TodoUpdatePublic,
+    TodoBulkCreatePublic, TodoBulkCreateResponse, TodoBulkUpdate, TodoBulkDelete, TodoBulkResponse, TodoStats, TodoChanges
+)
+from src.schemas.pagination_schemas import Page, PaginationParams
 from src.services.todo_services import TodoService
+from src.utils.helpers import etag_matches, not_modified
+from src.core.serialization import fast_response
 
 
 router = APIRouter(
@@ -22,13 +28,38 @@ db_dependency = Annotated[Session, Depends(get_db)]
 user_dependency = Annotated[dict, Depends(get_current_user)]
     
 
-@router.get("/users/{user_id}/todos", response_model=list[TodoResponse], status_code=status.HTTP_200_OK)
+@router.get("/users/{user_id}/todos", response_model=Page[TodoResponse], status_code=status.HTTP_200_OK)
 def get_todos_by_user_id(
         db: db_dependency,
         user: user_dependency, 
-        user_id: Annotated[int, Path(ge=1)]):
+        user_id: Annotated[int, Path(ge=1)],
+        pagination: Annotated[PaginationParams, Depends()],
+        response: Response,
+        is_completed: Annotated[Optional[bool], Query()] = None,
+        include_archived: Annotated[bool, Query()] = False,
+        fields: Annotated[Optional[str], Query(max_length=300)] = None,
+        if_none_match: Annotated[Optional[str], Header()] = None):
     
-    return TodoService.get_todos_by_user_id(db, user, user_id)
+    etag = TodoService.get_todos_etag(db, user, user_id, pagination, is_completed, include_archived, fields)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
+
+    return fast_response(
+        TodoService.get_todos_by_user_id(db, user, user_id, pagination, is_completed, include_archived, fields),
+        response.headers,
+        fields
+    )
+
+
+@router.get("/users/{user_id}/todos/stats", response_model=TodoStats, status_code=status.HTTP_200_OK)
+def get_todo_stats(
+        db: db_dependency,
+        user: user_dependency,
+        user_id: Annotated[int, Path(ge=1)]):
+
+    return TodoService.get_todo_stats(db, user, user_id)
 
 
 @router.post("", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
@@ -40,6 +71,67 @@ def add_todos(
     return TodoService.add_todo(db, user, todo_request)
     
 
+@router.post("/bulk", response_model=TodoBulkCreateResponse, status_code=status.HTTP_200_OK)
+def add_todos_bulk(
+        db: db_dependency,
+        user: user_dependency,
+        bulk_request: TodoBulkCreatePublic):
+
+    return TodoService.bulk_add_todos(db, user, bulk_request)
+
+
+@router.patch("/bulk", response_model=TodoBulkResponse, status_code=status.HTTP_200_OK)
+def update_todos_bulk(
+        db: db_dependency,
+        user: user_dependency,
+        bulk_request: TodoBulkUpdate):
+
+    return TodoService.bulk_update_todos(db, user, bulk_request)
+
+
+@router.post("/bulk/delete", response_model=TodoBulkResponse, status_code=status.HTTP_200_OK)
+def delete_todos_bulk(
+        db: db_dependency,
+        user: user_dependency,
+        bulk_request: TodoBulkDelete):
+
+    return TodoService.bulk_delete_todos(db, user, bulk_request)
+
+
+# Delta sync for the current user. Pass the previous response's watermark as
+# `since`; keep calling while has_more is true.
+@router.get("/changes", response_model=TodoChanges, status_code=status.HTTP_200_OK)
+def get_todo_changes(
+        db: db_dependency,
+        user: user_dependency,
+        since: Annotated[Optional[str], Query(max_length=300)] = None,
+        limit: Annotated[int, Query(ge=1, le=1000)] = 500):
+
+    return fast_response(TodoService.get_todo_changes(db, user, since, limit))
+
+
+@router.get("/{todo_id}", response_model=TodoResponse, status_code=status.HTTP_200_OK)
+def get_todo_by_id(
+    db: db_dependency,
+    user: user_dependency,
+    todo_id: Annotated[int, Path(ge=1)],
+    response: Response,
+    include_archived: Annotated[bool, Query()] = False,
+    fields: Annotated[Optional[str], Query(max_length=300)] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None):
+
+    etag = TodoService.get_todo_etag(db, user, todo_id, include_archived, fields)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
+
+    if fields is None:
+        return TodoService.get_todo_by_id(db, user, todo_id, include_archived)
+
+    return fast_response(TodoService.get_todo_fields(db, user, todo_id, fields, include_archived), response.headers, fields)
+
+
 @router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_todo_by_id(
     db: db_dependency,
@@ -53,7 +145,7 @@ def delete_todo_by_id(
 def update_todo_by_id(
     db: db_dependency,
     user: user_dependency, 
-    todo_request: TodoUpdate, 
+    todo_request: TodoUpdatePublic, 
     todo_id: Annotated[int, Path(ge=1)]):
     
     return TodoService.update_todo_by_id(db, user, todo_request, todo_id)
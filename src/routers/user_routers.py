@@ -1,12 +1,22 @@
-from fastapi import APIRouter, Depends, Path, status
+from fastapi import APIRouter, Depends, Path, Query, UploadFile, status, Header, Response
+from fastapi.responses import StreamingResponse
 
-from typing import Annotated
+import io
+from typing import Annotated, Literal, Optional
 
 from db.database import db_dependency
-from src.core.security import user_dependency, bcrypt_context
-from src.schemas.todos_schemas import TodoResponse, TodoSearch, TodoCreateAdmin
-from src.schemas.user_schemas import UserResponse, UserCreateAdmin
-from src.services.user_services import AdminService
+from src.core.security import user_dependency, password_hasher
+from src.schemas.todos_schemas import (
+    TodoResponse, TodoSearch, TodoCreateAdmin,
+    TodoBulkCreateAdmin, TodoBulkCreateResponse, TodoBulkUpdate, TodoBulkDelete, TodoBulkResponse, TodoStats
+)
+from src.schemas.user_schemas import UserResponseAdmin, UserCreateAdmin
+from src.schemas.pagination_schemas import Page, PaginationParams
+from src.schemas.import_schemas import ImportReport
+from src.services.user_services import UserService
+from src.utils.helpers import etag_matches, not_modified
+from src.core.serialization import fast_response
+from src.services.export_services import EXPORT_MEDIA_TYPES
 
 
 router = APIRouter(
@@ -15,21 +25,37 @@ router = APIRouter(
 )
 
 
-@router.get("/users", response_model=list[UserResponse], status_code=status.HTTP_200_OK)
+@router.get("/users", response_model=Page[UserResponseAdmin], status_code=status.HTTP_200_OK)
 def get_all_users(
         db: db_dependency, 
-        user: user_dependency):
+        user: user_dependency,
+        pagination: Annotated[PaginationParams, Depends()],
+        fields: Annotated[Optional[str], Query(max_length=300)] = None):
        
-    return AdminService.get_all_users(db, user)
+    return fast_response(UserService.get_all_users(db, user, pagination, fields), fields=fields)
 
 
-@router.get("/users/{user_id}", response_model=UserResponse, status_code=status.HTTP_200_OK)
+@router.get("/users/{user_id}", response_model=UserResponseAdmin, status_code=status.HTTP_200_OK)
 def get_user_by_id(
         db: db_dependency, 
         user: user_dependency,
-        user_id: Annotated[int, Path(ge=1)]):
+        user_id: Annotated[int, Path(ge=1)],
+        response: Response,
+        fields: Annotated[Optional[str], Query(max_length=300)] = None,
+        if_none_match: Annotated[Optional[str], Header()] = None):
+    
+    etag = UserService.get_user_etag(db, user, user_id, fields)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
 
-    return AdminService.get_user_by_id(db, user, user_id)
+    user_model = UserService.get_user_by_id(db, user, user_id, fields)
+
+    if fields is None:
+        return user_model
+
+    return fast_response(user_model, response.headers, fields)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -38,33 +64,87 @@ def delete_user_by_id(
         user: user_dependency,
         user_id: Annotated[int, Path(ge=1)]):
 
-    AdminService.delete_user_by_id(db, user, user_id)
+    UserService.delete_user_by_id(db, user, user_id)
 
 
-@router.post("/user_registration", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/user_registration", response_model=UserResponseAdmin, status_code=status.HTTP_201_CREATED)
 def add_users_admin(
         user: user_dependency,
         db: db_dependency, 
         user_request: UserCreateAdmin):
 
-    return AdminService.register_user(db, user, user_request, bcrypt_context)
+    return UserService.register_user(db, user, user_request, password_hasher)
     
 
-@router.get("/todos", response_model=list[TodoResponse], status_code=status.HTTP_200_OK)
+@router.post("/users/import", response_model=ImportReport, status_code=status.HTTP_200_OK)
+def import_users(
+        db: db_dependency,
+        user: user_dependency,
+        file: UploadFile,
+        import_format: Annotated[Literal["ndjson", "csv"], Query(alias="format")] = "ndjson"):
+
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+
+    return UserService.import_users(db, user, stream, import_format, password_hasher)
+
+
+@router.get("/todos", response_model=Page[TodoResponse], status_code=status.HTTP_200_OK)
 def get_all_todos(
         db: db_dependency,
-        user: user_dependency):
+        user: user_dependency,
+        pagination: Annotated[PaginationParams, Depends()],
+        include_archived: Annotated[bool, Query()] = False,
+        fields: Annotated[Optional[str], Query(max_length=300)] = None):
     
-    return AdminService.get_all_todos(db, user)
+    return fast_response(UserService.get_all_todos(db, user, pagination, include_archived, fields), fields=fields)
+
+
+@router.get("/todos/stats", response_model=TodoStats, status_code=status.HTTP_200_OK)
+def get_todo_stats(
+        db: db_dependency,
+        user: user_dependency):
+
+    return UserService.get_todo_stats(db, user)
 
 
-@router.get("/todos/search", response_model=list[TodoResponse], status_code=status.HTTP_200_OK)
+@router.get("/todos/search", response_model=Page[TodoResponse], status_code=status.HTTP_200_OK)
 def search_todos(
         db: db_dependency, 
         user: user_dependency,
-        search_request: Annotated[TodoSearch, Depends()]):
+        search_request: Annotated[TodoSearch, Depends()],
+        pagination: Annotated[PaginationParams, Depends()],
+        include_archived: Annotated[bool, Query()] = False,
+        fields: Annotated[Optional[str], Query(max_length=300)] = None):
     
-    return AdminService.search_todos(db, user, search_request)
+    return fast_response(UserService.search_todos(db, user, search_request, pagination, include_archived, fields), fields=fields)
+
+
+@router.get("/todos/export", status_code=status.HTTP_200_OK)
+def export_todos(
+        db: db_dependency,
+        user: user_dependency,
+        search_request: Annotated[TodoSearch, Depends()],
+        export_format: Annotated[Literal["ndjson", "csv"], Query(alias="format")] = "ndjson"):
+
+    chunks = UserService.export_todos(db, user, search_request, export_format)
+
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="todos.{export_format}"'}
+    )
+
+
+@router.post("/todos/import", response_model=ImportReport, status_code=status.HTTP_200_OK)
+def import_todos(
+        db: db_dependency,
+        user: user_dependency,
+        file: UploadFile,
+        import_format: Annotated[Literal["ndjson", "csv"], Query(alias="format")] = "ndjson"):
+
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+
+    return UserService.import_todos(db, user, stream, import_format)
 
 
 @router.post("/todos", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
@@ -73,4 +153,31 @@ def add_todo_admin(
         user: user_dependency,
         todo_request: TodoCreateAdmin):
     
-    return AdminService.add_todo_admin(db, user, todo_request)
\ No newline at end of file
+    return UserService.add_todo_admin(db, user, todo_request)
+
+
+@router.post("/todos/bulk", response_model=TodoBulkCreateResponse, status_code=status.HTTP_200_OK)
+def add_todos_bulk_admin(
+        db: db_dependency,
+        user: user_dependency,
+        bulk_request: TodoBulkCreateAdmin):
+
+    return UserService.bulk_add_todos_admin(db, user, bulk_request)
+
+
+@router.patch("/todos/bulk", response_model=TodoBulkResponse, status_code=status.HTTP_200_OK)
+def update_todos_bulk_admin(
+        db: db_dependency,
+        user: user_dependency,
+        bulk_request: TodoBulkUpdate):
+
+    return UserService.bulk_update_todos_admin(db, user, bulk_request)
+
+
+@router.post("/todos/bulk/delete", response_model=TodoBulkResponse, status_code=status.HTTP_200_OK)
+def delete_todos_bulk_admin(
+        db: db_dependency,
+        user: user_dependency,
+        bulk_request: TodoBulkDelete):
+
+    return UserService.bulk_delete_todos_admin(db, user, bulk_request)
\ No newline at end of file
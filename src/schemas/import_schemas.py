@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class ImportRejection(BaseModel):
+    line: int
+    reason: str
+
+
+class ImportReport(BaseModel):
+    inserted: int
+    rejected_count: int
+    rejected: list[ImportRejection]
\ No newline at end of file
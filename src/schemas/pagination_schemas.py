@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Generic, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class PaginationParams(BaseModel):
+    limit: int = Field(50, ge=1, le=500)
+    cursor: Optional[str] = Field(None, max_length=200)
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -1,9 +1,10 @@
 from pydantic import BaseModel, Field
-from typing import Optional
-from datetime import date
+from typing import Literal, Optional
+from datetime import date, datetime
 
 from src.models.todo_model import TodoPriority
 from src.schemas.base_schema import BaseSchema
+from src.utils.constants import TODO_BULK_LIMIT
 
 
 class TodoBase(BaseModel):
@@ -29,6 +30,19 @@ class TodoResponse(TodoBase, BaseSchema):
     owner_id: int
 
 
+class TodoChangeResponse(TodoResponse):
+    updated_at: datetime
+
+
+class TodoChanges(BaseModel):
+    items: list[TodoChangeResponse]
+    deleted: list[int]
+    # Moved out of the live list by the archiver; readable with include_archived.
+    archived: list[int]
+    watermark: str
+    has_more: bool
+
+
 class TodoSearch(BaseModel):
     title: Optional[str] = Field(None, max_length=30)
     deadline: Optional[date] = Field(None)
@@ -42,4 +56,61 @@ class TodoUpdatePublic(TodoSearch):
 
 
 class TodoUpdateAdmin(TodoSearch):
-    pass
\ No newline at end of file
+    pass
+
+
+class TodoBulkCreatePublic(BaseModel):
+    items: list[TodoCreatePublic] = Field(min_length=1, max_length=TODO_BULK_LIMIT)
+
+
+class TodoBulkCreateAdmin(BaseModel):
+    items: list[TodoCreateAdmin] = Field(min_length=1, max_length=TODO_BULK_LIMIT)
+
+
+class TodoBulkUpdate(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=TODO_BULK_LIMIT)
+    changes: TodoUpdatePublic
+
+
+class TodoBulkDelete(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=TODO_BULK_LIMIT)
+
+
+class TodoBulkConflict(BaseModel):
+    index: int
+    title: str
+    deadline: date
+
+
+class TodoBulkRejection(BaseModel):
+    index: int
+    reason: str
+
+
+class TodoBulkCreateResponse(BaseModel):
+    created: list[TodoResponse]
+    conflicts: list[TodoBulkConflict]
+    rejected: list[TodoBulkRejection]
+
+
+class TodoBulkResponse(BaseModel):
+    succeeded: list[int]
+    not_found: list[int]
+
+
+DeadlineBucket = Literal["overdue", "today", "this_week", "later"]
+
+
+class TodoStatsGroup(BaseModel):
+    priority: TodoPriority
+    is_completed: bool
+    deadline_bucket: DeadlineBucket
+    count: int
+
+
+class TodoStats(BaseModel):
+    total: int
+    by_priority: dict[TodoPriority, int]
+    by_status: dict[Literal["completed", "open"], int]
+    by_deadline: dict[DeadlineBucket, int]
+    groups: list[TodoStatsGroup]
\ No newline at end of file
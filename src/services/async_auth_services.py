@@ -0,0 +1,128 @@
+from fastapi import HTTPException
+
+from sqlalchemy.exc import IntegrityError
+
+from src.repositories.async_auth_repository import AsyncUserRepository
+from src.models.user_model import Users
+from src.core.response_cache import response_cache, user_namespace
+from src.schemas.user_schemas import UserResponseAdmin
+from src.utils.helpers import dump_model, make_etag
+from src.services.auth_services import MESSAGE_403, MESSAGE_404, MESSAGE_409
+
+
+class AsyncAuthService:
+    @staticmethod
+    async def get_user_etag(db, user, user_id):
+        if user["id"] != user_id and  user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        updated_at = await AsyncUserRepository.get_user_updated_at(db, user_id)
+
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+        return make_etag("user", user_id, updated_at)
+
+
+    @staticmethod
+    async def get_user_by_id(db, user, user_id):
+        if user["id"] != user_id and  user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        async def load():
+            return dump_model(await AsyncUserRepository.get_user_by_id(db, user_id), UserResponseAdmin)
+
+        user_model = await response_cache.aget_or_load(user_namespace(user_id), [], load)
+
+        if user_model is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+        return user_model
+
+
+    @staticmethod
+    async def register_user(db, user_request, password_hasher):
+        new_user = Users(
+            username=user_request.username,
+            first_name=user_request.first_name.title(),
+            last_name=user_request.last_name.title(),
+            date_of_birth=user_request.date_of_birth,
+            email_address=user_request.email_address,
+            password_hash=await password_hasher.ahash(user_request.password),
+            role="user",
+            is_active=True
+        )
+
+        try:
+            AsyncUserRepository.add_user(db, new_user)
+
+            await db.commit()
+            await db.refresh(new_user)
+
+            response_cache.invalidate(user_namespace())
+
+            return new_user
+        
+        except IntegrityError:
+            await db.rollback()
+
+            raise HTTPException(status_code=409, detail=MESSAGE_409)
+        
+
+    @staticmethod
+    async def update_user_password(db, user, user_request, user_id, password_hasher):
+        if user["id"] != user_id and user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        user_model = await AsyncUserRepository.get_user_by_id(db, user_id)
+
+        if user_model is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+        
+        if not await password_hasher.averify(user_request.old_password, user_model.password_hash):
+            raise HTTPException(status_code=401, detail="Invalid old password")
+        
+        user_model.password_hash = await password_hasher.ahash(user_request.new_password)
+
+        await db.commit()
+
+        response_cache.invalidate(user_namespace(user_id), user_namespace())
+
+
+    @staticmethod
+    async def update_user_by_id(db, user, user_request, user_id):
+        if user["id"] != user_id and user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        user_model = await AsyncUserRepository.get_user_by_id(db, user_id)
+
+        if user_model is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+        
+        try:
+            for field, value in user_request.model_dump(exclude_unset=True).items():
+                setattr(user_model, field, value)
+
+            await db.commit()
+            await db.refresh(user_model)
+
+        except IntegrityError:
+            await db.rollback()
+            
+            raise HTTPException(status_code=409, detail=MESSAGE_409)
+
+        response_cache.invalidate(user_namespace(user_id), user_namespace())
+        
+        return user_model
+
+
+    @staticmethod
+    async def authenticate_user(username: str, password: str, db, password_hasher):
+        user = await AsyncUserRepository.get_user_by_username(db, username)
+
+        if not user:
+            return await password_hasher.adummy_verify(password)
+        if not await password_hasher.averify(password, user.password_hash):
+            return False
+        
+        return user
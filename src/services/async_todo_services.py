@@ -0,0 +1,155 @@
+from fastapi import HTTPException
+
+from datetime import date
+
+from sqlalchemy.exc import IntegrityError
+
+from db.config import settings
+from src.repositories.async_todos_repository import AsyncTodoRepository
+from src.repositories.todos_repository import TODO_CHANGE_ORDER, TOMBSTONE_ORDER, todo_columns
+from src.models.todo_model import Todos
+from src.services.todo_services import MESSAGE_403, MESSAGE_404, MESSAGE_409
+from src.core.response_cache import response_cache, todos_namespace
+from src.core.change_feed import record_change
+from src.schemas.todos_schemas import TodoResponse, TodoChangeResponse
+from src.utils.helpers import (
+    owner_scope, dump_page, make_etag, summarize_todo_stats, decode_watermark, sync_page, parse_fields
+)
+
+
+class AsyncTodoService:
+    @staticmethod
+    async def get_todos_by_user_id(db, user, user_id, pagination, is_completed=None, include_archived=False, fields=None):
+        if user["id"] != user_id and user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, TodoResponse)
+
+        async def load():
+            todo_page = await AsyncTodoRepository.get_todo_by_user_id(
+                db, user_id, pagination.limit, pagination.cursor, is_completed, include_archived, todo_columns(fields)
+            )
+
+            return dump_page(todo_page, TodoResponse, fields)
+
+        return await response_cache.aget_or_load(
+            todos_namespace(user_id), [pagination.limit, pagination.cursor, is_completed, include_archived, fields], load
+        )
+    
+
+    @staticmethod
+    async def get_todo_stats(db, user, user_id):
+        if user["id"] != user_id and user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        today = date.today()
+
+        async def load():
+            return summarize_todo_stats(await AsyncTodoRepository.get_todo_stats(db, today, user_id))
+
+        return await response_cache.aget_or_load(todos_namespace(user_id), ["stats", today], load)
+
+
+    @staticmethod
+    async def get_todo_changes(db, user, since, limit):
+        horizon = await AsyncTodoRepository.get_sync_horizon(db)
+
+        if since is None:
+            positions = [None, [horizon, 0]]
+        else:
+            positions = decode_watermark(since, (TODO_CHANGE_ORDER, TOMBSTONE_ORDER), settings.SYNC_TOMBSTONE_RETENTION_DAYS * 86400)
+
+        todos = await AsyncTodoRepository.get_todo_changes(db, user["id"], positions[0], limit, horizon)
+        tombstones = await AsyncTodoRepository.get_tombstones(db, user["id"], positions[1], limit, horizon)
+
+        return sync_page(todos, tombstones, positions, (TODO_CHANGE_ORDER, TOMBSTONE_ORDER), limit, TodoChangeResponse)
+
+
+    @staticmethod
+    async def get_todos_etag(db, user, user_id, pagination, is_completed=None, include_archived=False, fields=None):
+        if user["id"] != user_id and user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, TodoResponse)
+        last_updated, total = await AsyncTodoRepository.get_todo_list_version(db, user_id, is_completed, include_archived)
+
+        return make_etag("todos", user_id, pagination.limit, pagination.cursor, is_completed, include_archived, fields, last_updated, total)
+
+
+    @staticmethod
+    async def add_todo(db, user, todo_request):
+        todo_model = Todos(**todo_request.model_dump(), owner_id=user["id"])
+
+        try:
+            AsyncTodoRepository.add_todo(db, todo_model)
+            await db.flush()
+
+            record_change(db, "created", todo_model.owner_id, todo_model.id, todo_model)
+
+            await db.commit()
+            await db.refresh(todo_model)
+
+            response_cache.invalidate(todos_namespace(user["id"]), todos_namespace())
+
+            return todo_model
+        
+        except IntegrityError:
+            await db.rollback()
+
+            raise HTTPException(status_code=409, detail=MESSAGE_409)
+        
+
+    @staticmethod
+    async def delete_todo_by_id(db, user, todo_id):
+        deleted = await AsyncTodoRepository.delete_todo_by_id(db, todo_id, owner_scope(user))
+
+        if deleted is None:
+            await AsyncTodoService._raise_not_found_or_forbidden(db, todo_id)
+
+        record_change(db, "deleted", deleted.owner_id, deleted.id)
+
+        await db.commit()
+
+        response_cache.invalidate(todos_namespace(deleted.owner_id), todos_namespace())
+
+
+    @staticmethod
+    async def update_todo_by_id(db, user, todo_request, todo_id):
+        changes = todo_request.model_dump(exclude_unset=True)
+
+        if not changes:
+            todo_model = await AsyncTodoRepository.get_todo_by_id(db, todo_id)
+
+            if todo_model is None:
+                raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+            if user["id"] != todo_model.owner_id and user["user_role"] != "admin":
+                raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+            return todo_model
+
+        try:
+            todo_row = await AsyncTodoRepository.update_todo_by_id(db, todo_id, changes, owner_scope(user))
+
+            if todo_row is None:
+                await AsyncTodoService._raise_not_found_or_forbidden(db, todo_id)
+
+            record_change(db, "updated", todo_row.owner_id, todo_row.id, todo_row)
+
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+
+            raise HTTPException(status_code=409, detail=MESSAGE_409)
+
+        response_cache.invalidate(todos_namespace(todo_row.owner_id), todos_namespace())
+        
+        return todo_row
+
+
+    @staticmethod
+    async def _raise_not_found_or_forbidden(db, todo_id):
+        if await AsyncTodoRepository.get_user_id_by_todo_id(db, todo_id) is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+        raise HTTPException(status_code=403, detail=MESSAGE_403)
\ No newline at end of file
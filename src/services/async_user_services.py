@@ -0,0 +1,201 @@
+from fastapi import HTTPException
+
+from datetime import date
+
+from sqlalchemy.exc import IntegrityError
+
+from src.repositories.async_auth_repository import AsyncUserRepository
+from src.repositories.async_todos_repository import AsyncTodoRepository
+from src.repositories.auth_repository import user_columns
+from src.repositories.todos_repository import todo_columns
+from src.models.todo_model import Todos
+from src.models.user_model import Users
+from src.services.user_services import MESSAGE_403, MESSAGE_404, MESSAGE_409
+from src.core.response_cache import response_cache, todos_namespace, user_namespace
+from src.core.change_feed import record_change
+from src.schemas.todos_schemas import TodoResponse
+from src.schemas.user_schemas import UserResponseAdmin
+from src.core.serialization import dump_fields
+from src.utils.helpers import dump_model, dump_page, make_etag, summarize_todo_stats, parse_fields
+
+
+class AsyncUserService:
+    @staticmethod
+    async def get_user_etag(db, user, user_id, fields=None):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, UserResponseAdmin)
+        updated_at = await AsyncUserRepository.get_user_updated_at(db, user_id)
+
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+        return make_etag("user", user_id, fields, updated_at)
+
+
+    @staticmethod
+    async def get_user_by_id(db, user, user_id, fields=None):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, UserResponseAdmin)
+
+        async def load():
+            if fields is None:
+                return dump_model(await AsyncUserRepository.get_user_by_id(db, user_id), UserResponseAdmin)
+
+            user_row = await AsyncUserRepository.get_user_fields(db, user_id, user_columns(fields))
+
+            return None if user_row is None else dump_fields([user_row], UserResponseAdmin, fields)[0]
+
+        user_model = await response_cache.aget_or_load(user_namespace(user_id), [fields], load)
+
+        if user_model is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+        return user_model
+    
+
+    @staticmethod
+    async def get_all_users(db, user, pagination, fields=None):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, UserResponseAdmin)
+        
+        async def load():
+            user_page = await AsyncUserRepository.get_all_users(db, pagination.limit, pagination.cursor, user_columns(fields))
+
+            return dump_page(user_page, UserResponseAdmin, fields)
+
+        return await response_cache.aget_or_load(user_namespace(), [pagination.limit, pagination.cursor, fields], load)
+
+
+    @staticmethod
+    async def register_user(db, user, user_request, password_hasher):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+    
+        new_user = Users(
+            username=user_request.username,
+            first_name=user_request.first_name.title(),
+            last_name=user_request.last_name.title(),
+            date_of_birth=user_request.date_of_birth,
+            email_address=user_request.email_address,
+            password_hash=await password_hasher.ahash(user_request.password),
+            role=user_request.role,
+            is_active=user_request.is_active
+        )
+
+        try:
+            AsyncUserRepository.add_user(db, new_user)
+
+            await db.commit()
+            await db.refresh(new_user)
+
+            response_cache.invalidate(user_namespace())
+
+            return new_user
+        
+        except IntegrityError:
+            await db.rollback()
+
+            raise HTTPException(status_code=409, detail=MESSAGE_409)
+
+
+    @staticmethod
+    async def delete_user_by_id(db, user, user_id):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        user_model = await AsyncUserRepository.get_user_by_id(db, user_id)
+
+        if user_model is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+        
+        # The todos relationship does not cascade; deleting them here also
+        # leaves tombstones for delta sync.
+        deleted = await AsyncTodoRepository.delete_todos_by_owner(db, user_id)
+
+        for todo in deleted:
+            record_change(db, "deleted", todo.owner_id, todo.id)
+
+        await AsyncUserRepository.delete_user_by_id(db, user_model)
+
+        await db.commit()
+
+        response_cache.invalidate(user_namespace(user_id), user_namespace(), todos_namespace(user_id), todos_namespace())
+
+
+    @staticmethod
+    async def get_all_todos(db, user, pagination, include_archived=False, fields=None):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, TodoResponse)
+    
+        async def load():
+            todo_page = await AsyncTodoRepository.get_all_todos(
+                db, pagination.limit, pagination.cursor, include_archived, todo_columns(fields)
+            )
+
+            return dump_page(todo_page, TodoResponse, fields)
+
+        return await response_cache.aget_or_load(todos_namespace(), [pagination.limit, pagination.cursor, include_archived, fields], load)
+    
+
+    @staticmethod
+    async def get_todo_stats(db, user):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        today = date.today()
+
+        async def load():
+            return summarize_todo_stats(await AsyncTodoRepository.get_todo_stats(db, today))
+
+        return await response_cache.aget_or_load(todos_namespace(), ["stats", today], load)
+
+
+    @staticmethod
+    async def search_todos(db, user, search_request, pagination, include_archived=False, fields=None):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, TodoResponse)
+        
+        todo_page = await AsyncTodoRepository.search_todo(
+            db, search_request, pagination.limit, pagination.cursor, include_archived, todo_columns(fields)
+        )
+
+        if not todo_page["items"] and pagination.cursor is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+        
+        return dump_page(todo_page, TodoResponse, fields)
+    
+    
+    @staticmethod
+    async def add_todo_admin(db, user, todo_request):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+        
+        todo_model = Todos(**todo_request.model_dump())
+
+        try:
+            AsyncTodoRepository.add_todo(db, todo_model)
+            await db.flush()
+
+            record_change(db, "created", todo_model.owner_id, todo_model.id, todo_model)
+
+            await db.commit()
+            await db.refresh(todo_model)
+
+            response_cache.invalidate(todos_namespace(todo_model.owner_id), todos_namespace())
+
+            return todo_model
+        
+        except IntegrityError:
+            await db.rollback()
+
+            raise HTTPException(status_code=409, detail=MESSAGE_409)
\ No newline at end of file
@@ -4,6 +4,9 @@ from sqlalchemy.exc import IntegrityError
 
 from src.repositories.auth_repository import UserRepository
 from src.models.user_model import Users
+from src.core.response_cache import response_cache, user_namespace
+from src.schemas.user_schemas import UserResponseAdmin
+from src.utils.helpers import dump_model, make_etag
 
 
 MESSAGE_409 = "Duplicate values are not accepted"
@@ -12,12 +15,29 @@ MESSAGE_404 = "User(s) not found"
 
 
 class AuthService:
+    @staticmethod
+    def get_user_etag(db, user, user_id):
+        if user["id"] != user_id and  user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        updated_at = UserRepository.get_user_updated_at(db, user_id)
+
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+        return make_etag("user", user_id, updated_at)
+
+
     @staticmethod
     def get_user_by_id(db, user, user_id):
         if user["id"] != user_id and  user["user_role"] != "admin":
             raise HTTPException(status_code=403, detail=MESSAGE_403)
 
-        user_model = UserRepository.get_user_by_id(db, user_id)
+        user_model = response_cache.get_or_load(
+            user_namespace(user_id),
+            [],
+            lambda: dump_model(UserRepository.get_user_by_id(db, user_id), UserResponseAdmin)
+        )
 
         if user_model is None:
             raise HTTPException(status_code=404, detail=MESSAGE_404)
@@ -26,14 +46,14 @@ class AuthService:
 
 
     @staticmethod
-    def register_user(db, user_request, bcrypt_context):
+    def register_user(db, user_request, password_hasher):
         new_user = Users(\
             username=user_request.username,
             first_name=user_request.first_name.title(),
             last_name=user_request.last_name.title(),
             date_of_birth=user_request.date_of_birth,
             email_address=user_request.email_address,
-            hash_password=bcrypt_context.hash(user_request.password),
+            password_hash=password_hasher.hash(user_request.password),
             role="user",
             is_active=True
         )
@@ -44,6 +64,8 @@ class AuthService:
             db.commit()
             db.refresh(new_user)
 
+            response_cache.invalidate(user_namespace())
+
             return new_user
         
         except IntegrityError:
@@ -53,7 +75,7 @@ class AuthService:
         
 
     @staticmethod
-    def update_user_password(db, user, user_request, user_id, bcrypt_context):
+    def update_user_password(db, user, user_request, user_id, password_hasher):
         if user["id"] != user_id and user["user_role"] != "admin":
             raise HTTPException(status_code=403, detail=MESSAGE_403)
 
@@ -62,13 +84,15 @@ class AuthService:
         if user_model is None:
             raise HTTPException(status_code=404, detail=MESSAGE_404)
         
-        if not bcrypt_context.verify(user_request.old_password, user_model.hash_password):
+        if not password_hasher.verify(user_request.old_password, user_model.password_hash):
             raise HTTPException(status_code=401, detail="Invalid old password")
         
-        user_model.hash_password = bcrypt_context.hash(user_request.new_password)
+        user_model.password_hash = password_hasher.hash(user_request.new_password)
 
         db.commit()
 
+        response_cache.invalidate(user_namespace(user_id), user_namespace())
+
 
     @staticmethod
     def update_user_by_id(db, user, user_request, user_id):
@@ -90,17 +114,19 @@ class AuthService:
             db.rollback()
             
             raise HTTPException(status_code=409, detail=MESSAGE_409)
+
+        response_cache.invalidate(user_namespace(user_id), user_namespace())
         
         return user_model
 
 
     @staticmethod
-    def authenticate_user(username: str, password: str, db, bcrypt_context):
+    def authenticate_user(username: str, password: str, db, password_hasher):
         user = UserRepository.get_user_by_username(db, username)
 
         if not user:
-            return False
-        if not bcrypt_context.verify(password, user.hash_password):
+            return password_hasher.dummy_verify(password)
+        if not password_hasher.verify(password, user.password_hash):
             return False
         
         return user
\ No newline at end of file
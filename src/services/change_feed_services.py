@@ -0,0 +1,90 @@
+import asyncio
+import json
+
+from fastapi import HTTPException
+
+from db.config import settings
+from src.core.change_feed import change_broker, RESET
+from src.core.security import get_current_user, MESSAGE_401
+
+
+MESSAGE_403 = "Access denied"
+
+# Offered as the first Sec-WebSocket-Protocol, followed by the token.
+BEARER_PROTOCOL = "bearer"
+
+
+def format_sse(change: dict) -> str:
+    lines = [] if change is RESET else [f"id: {change['seq']}"]
+    lines.append(f"event: {change['op']}")
+    lines.append(f"data: {json.dumps(change)}")
+
+    return "\n".join(lines) + "\n\n"
+
+
+class ChangeFeedService:
+    @staticmethod
+    def authorize(user, user_id):
+        if user["id"] != user_id and user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+
+    # Browsers cannot set headers on a WebSocket handshake, and query strings
+    # end up in access logs, so the token is either offered as a subprotocol
+    # ("bearer", <token>) or sent as the first message, {"token": <token>}.
+    @staticmethod
+    async def authenticate_websocket(websocket):
+        protocols = [
+            protocol.strip() for protocol in websocket.headers.get("sec-websocket-protocol", "").split(",")
+        ]
+
+        if len(protocols) == 2 and protocols[0] == BEARER_PROTOCOL:
+            await websocket.accept(subprotocol=BEARER_PROTOCOL)
+
+            return await get_current_user(protocols[1])
+
+        await websocket.accept()
+
+        try:
+            message = await asyncio.wait_for(websocket.receive_json(), settings.CHANGE_FEED_AUTH_TIMEOUT)
+        except (asyncio.TimeoutError, ValueError):
+            raise HTTPException(status_code=401, detail=MESSAGE_401)
+
+        token = message.get("token") if isinstance(message, dict) else None
+
+        if not isinstance(token, str):
+            raise HTTPException(status_code=401, detail=MESSAGE_401)
+
+        return await get_current_user(token)
+
+
+    # The generators subscribe when they start running, inside the try, so a
+    # stream that is never iterated (or is torn down) cannot leave one behind.
+    @staticmethod
+    async def sse_events(user_id, last_seq=None):
+        subscription = change_broker.subscribe(user_id, last_seq)
+
+        try:
+            while True:
+                change = await subscription.get(settings.CHANGE_FEED_HEARTBEAT)
+
+                # A comment line keeps proxies from closing an idle stream.
+                yield ": keepalive\n\n" if change is None else format_sse(change)
+        finally:
+            subscription.close()
+
+
+    @staticmethod
+    async def websocket_events(websocket, user_id, last_seq=None):
+        subscription = change_broker.subscribe(user_id, last_seq)
+
+        try:
+            while True:
+                change = await subscription.get(settings.CHANGE_FEED_HEARTBEAT)
+
+                if change is None:
+                    await websocket.send_json({"op": "keepalive"})
+                else:
+                    await websocket.send_json(change)
+        finally:
+            subscription.close()
\ No newline at end of file
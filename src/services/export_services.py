@@ -0,0 +1,40 @@
+import csv
+import io
+import json
+
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+class ExportService:
+    @staticmethod
+    def encode(partitions, columns, export_format):
+        if export_format == "csv":
+            return ExportService.csv_chunks(partitions, columns)
+
+        return ExportService.ndjson_chunks(partitions)
+
+
+    @staticmethod
+    def ndjson_chunks(partitions):
+        for rows in partitions:
+            yield "".join(json.dumps(dict(row), default=str) + "\n" for row in rows)
+
+
+    @staticmethod
+    def csv_chunks(partitions, columns):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        writer.writerow(columns)
+        yield buffer.getvalue()
+
+        for rows in partitions:
+            buffer.seek(0)
+            buffer.truncate()
+
+            writer.writerows([row[column] for column in columns] for row in rows)
+            yield buffer.getvalue()
\ No newline at end of file
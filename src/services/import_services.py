@@ -0,0 +1,180 @@
+import csv
+import json
+from itertools import islice
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from src.core.change_feed import record_change
+from src.repositories.import_repository import ImportRepository, TODOS_STAGING, USERS_STAGING
+from src.schemas.todos_schemas import TodoCreateAdmin
+from src.schemas.user_schemas import UserCreateAdmin
+from src.utils.constants import IMPORT_CHUNK_SIZE, IMPORT_MAX_REPORTED_REJECTIONS, MESSAGE_413_IMPORT
+
+
+def read_records(stream, import_format):
+    if import_format == "csv":
+        reader = csv.DictReader(stream)
+
+        for record in reader:
+            yield reader.line_num, record
+
+        return
+
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError:
+            yield line_no, None
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def validation_reason(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+class ImportService:
+    @staticmethod
+    def import_todos(db, stream, import_format):
+        seen = set()
+
+        def validate(record):
+            todo = TodoCreateAdmin.model_validate(record)
+
+            # Optional in the API schema, but todos.description is NOT NULL.
+            if todo.description is None:
+                raise ValueError("description: Field required")
+
+            if (todo.title, todo.deadline) in seen:
+                raise ValueError("duplicate title and deadline in file")
+
+            seen.add((todo.title, todo.deadline))
+
+            return todo
+
+        def prepare(valid):
+            return [
+                (line_no, todo.title, todo.deadline, todo.description, todo.priority.name, todo.is_completed, todo.owner_id)
+                for line_no, todo in valid
+            ]
+
+        # Imported todos reach the change feed and the deadline scheduler like
+        # any other write.
+        def on_inserted(inserted):
+            for row in inserted:
+                record_change(db, "created", row.owner_id, row.todo_id)
+
+        return ImportService._load(
+            db, read_records(stream, import_format), TODOS_STAGING, validate, prepare, on_inserted=on_inserted
+        )
+
+
+    @staticmethod
+    def import_users(db, stream, import_format, hash_passwords, max_rows=None):
+        seen = set()
+
+        def validate(record):
+            new_user = UserCreateAdmin.model_validate(record)
+
+            if new_user.username in seen or new_user.email_address in seen:
+                raise ValueError("duplicate username or email_address in file")
+
+            seen.update((new_user.username, new_user.email_address))
+
+            return new_user
+
+        def prepare(valid):
+            password_hashes = hash_passwords([new_user.password for _, new_user in valid])
+
+            return [
+                (
+                    line_no, new_user.username, new_user.first_name.title(), new_user.last_name.title(),
+                    new_user.date_of_birth, new_user.email_address, password_hash,
+                    new_user.role.name, new_user.is_active
+                )
+                for (line_no, new_user), password_hash in zip(valid, password_hashes)
+            ]
+
+        return ImportService._load(db, read_records(stream, import_format), USERS_STAGING, validate, prepare, max_rows)
+
+
+    # Rows are validated and COPY'd one chunk at a time, so memory stays
+    # bounded by the chunk size; the whole import commits as one transaction.
+    # The staging table is only created once the first chunk is prepared, so
+    # an import that fits in one chunk hashes its passwords before the
+    # transaction begins.
+    @staticmethod
+    def _load(db, records, staging, validate, prepare, max_rows=None, on_inserted=None):
+        report = {"inserted": 0, "rejected_count": 0, "rejected": []}
+        staged = False
+        rows_read = 0
+
+        # A chunk's rejections come from validation and from the merge; they
+        # are reported together in line order.
+        def report_rejections(rejections):
+            report["rejected_count"] += len(rejections)
+
+            for line_no, reason in sorted(rejections)[:IMPORT_MAX_REPORTED_REJECTIONS - len(report["rejected"])]:
+                report["rejected"].append({"line": line_no, "reason": reason})
+
+        try:
+            for chunk in chunked(records, IMPORT_CHUNK_SIZE):
+                rows_read += len(chunk)
+
+                if max_rows is not None and rows_read > max_rows:
+                    raise HTTPException(status_code=413, detail=MESSAGE_413_IMPORT)
+
+                valid = []
+                rejections = []
+
+                for line_no, record in chunk:
+                    if record is None:
+                        rejections.append((line_no, "invalid JSON"))
+                        continue
+
+                    try:
+                        valid.append((line_no, validate(record)))
+                    except ValidationError as error:
+                        rejections.append((line_no, validation_reason(error)))
+                    except ValueError as error:
+                        rejections.append((line_no, str(error)))
+
+                if not valid:
+                    report_rejections(rejections)
+                    continue
+
+                rows = prepare(valid)
+
+                if not staged:
+                    ImportRepository.create_staging(db, staging)
+                    staged = True
+
+                ImportRepository.copy_rows(db, staging, rows)
+                merged = ImportRepository.merge_staging(db, staging)
+                rejected = [row for row in merged if row.reason is not None]
+
+                report["inserted"] += len(valid) - len(rejected)
+                report_rejections(rejections + [(row.line_no, row.reason) for row in rejected])
+
+                if on_inserted is not None:
+                    on_inserted([row for row in merged if row.reason is None])
+
+            db.commit()
+
+        except Exception:
+            db.rollback()
+            raise
+
+        return report
\ No newline at end of file
@@ -0,0 +1,94 @@
+from fastapi import HTTPException
+
+from db.database import sync_engine, async_engine
+from db.query_stats import route_query_stats
+from src.core.security import jwt_claims_cache, password_hasher, login_rate_limiter
+from src.core.metrics import MetricsWriter, request_metrics
+
+
+MESSAGE_403 = "Access denied"
+
+
+def engine_pools() -> dict:
+    engines = {"sync": sync_engine, "async": async_engine}
+
+    return {name: engine.pool.metrics.snapshot(engine.pool) for name, engine in engines.items() if engine is not None}
+
+
+class SystemService:
+    @staticmethod
+    def get_pool_stats(user):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        return engine_pools()
+
+
+    @staticmethod
+    def get_jwt_cache_stats(user):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        return jwt_claims_cache.stats()
+
+
+    @staticmethod
+    def get_query_stats(user):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        return route_query_stats.snapshot()
+
+
+    @staticmethod
+    def get_metrics() -> str:
+        writer = MetricsWriter()
+
+        request_metrics.collect(writer)
+
+        pools = [({"engine": name}, stats) for name, stats in engine_pools().items()]
+
+        for name, key, help_text in (
+            ("db_pool_size", "size", "Configured number of pooled connections."),
+            ("db_pool_checked_out", "checked_out", "Connections currently checked out."),
+            ("db_pool_overflow", "overflow", "Overflow connections currently open."),
+        ):
+            writer.add(name, "gauge", help_text, [("", labels, stats[key]) for labels, stats in pools])
+
+        writer.add(
+            "db_pool_checkouts_total", "counter", "Connection checkouts.",
+            [("", labels, stats["checkouts"]) for labels, stats in pools]
+        )
+        writer.add(
+            "db_pool_timeouts_total", "counter", "Checkouts that timed out waiting for a connection.",
+            [("", labels, stats["timeouts"]) for labels, stats in pools]
+        )
+        writer.histogram(
+            "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection.",
+            [
+                (
+                    labels,
+                    [(float(bound), count) for bound, count in stats["checkout_latency_histogram"].items()],
+                    stats["wait_seconds_total"],
+                    stats["checkouts"],
+                )
+                for labels, stats in pools
+            ]
+        )
+
+        writer.add("password_hash_workers", "gauge", "bcrypt worker threads.", [("", {}, password_hasher.workers)])
+        writer.add("password_hash_in_flight", "gauge", "bcrypt jobs running or queued.", [("", {}, password_hasher.in_flight)])
+        writer.add("password_hash_queue_depth", "gauge", "bcrypt jobs waiting for a worker.", [("", {}, password_hasher.queue_depth)])
+        writer.add("password_hash_rejected_total", "counter", "bcrypt jobs rejected with 503.", [("", {}, password_hasher.rejected)])
+
+        writer.add("login_rate_limited_total", "counter", "Login attempts rejected with 429.", [("", {}, login_rate_limiter.rejected)])
+
+        jwt_stats = jwt_claims_cache.stats()
+
+        writer.add("jwt_cache_size", "gauge", "Cached JWT claim sets.", [("", {}, jwt_stats["size"])])
+        writer.add("jwt_cache_hits_total", "counter", "JWT claim cache hits.", [("", {}, jwt_stats["hits"])])
+        writer.add("jwt_cache_misses_total", "counter", "JWT claim cache misses.", [("", {}, jwt_stats["misses"])])
+        writer.add("jwt_cache_evictions_total", "counter", "JWT claim cache evictions.", [("", {}, jwt_stats["evictions"])])
+        writer.add("jwt_cache_hit_ratio", "gauge", "JWT claim cache hit ratio since start.", [("", {}, jwt_stats["hit_rate"])])
+
+        return writer.render()
\ No newline at end of file
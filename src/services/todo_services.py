@@ -1,9 +1,21 @@
 from fastapi import HTTPException
 
+from datetime import date
+
 from sqlalchemy.exc import IntegrityError
 
-from src.repositories.todos_repository import TodoRepository
+from db.config import settings
+from src.repositories.todos_repository import TodoRepository, TODO_CHANGE_ORDER, TOMBSTONE_ORDER, todo_columns
 from src.models.todo_model import Todos
+from src.utils.constants import MESSAGE_400_NO_CHANGES
+from src.core.response_cache import response_cache, todos_namespace
+from src.core.change_feed import record_change
+from src.schemas.todos_schemas import TodoResponse, TodoChangeResponse
+from src.core.serialization import dump_fields
+from src.utils.helpers import (
+    bulk_result, owner_scope, dump_page, make_etag, summarize_todo_stats, decode_watermark, sync_page,
+    parse_fields
+)
 
 
 MESSAGE_404 = "Todo(s) not found"
@@ -13,28 +25,126 @@ MESSAGE_409 = "Duplicate values are not accepted"
 
 class TodoService:
     @staticmethod
-    def get_todos_by_user_id(db, user, user_id):        
-        todo_model = TodoRepository.get_todo_by_user_id(db, user_id)
+    def get_todos_by_user_id(db, user, user_id, pagination, is_completed=None, include_archived=False, fields=None):
+        if user["id"] != user_id and user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, TodoResponse)
+
+        return response_cache.get_or_load(
+            todos_namespace(user_id),
+            [pagination.limit, pagination.cursor, is_completed, include_archived, fields],
+            lambda: dump_page(
+                TodoRepository.get_todo_by_user_id(
+                    db, user_id, pagination.limit, pagination.cursor, is_completed, include_archived, todo_columns(fields)
+                ),
+                TodoResponse,
+                fields
+            )
+        )
+    
+
+    @staticmethod
+    def get_todo_stats(db, user, user_id):
+        if user["id"] != user_id and user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        today = date.today()
+
+        return response_cache.get_or_load(
+            todos_namespace(user_id),
+            ["stats", today],
+            lambda: summarize_todo_stats(TodoRepository.get_todo_stats(db, today, user_id))
+        )
+
+
+    # A first sync (no watermark) returns every todo and starts the tombstone
+    # stream at the horizon, since the client has nothing to remove yet.
+    @staticmethod
+    def get_todo_changes(db, user, since, limit):
+        horizon = TodoRepository.get_sync_horizon(db)
+
+        if since is None:
+            positions = [None, [horizon, 0]]
+        else:
+            positions = decode_watermark(since, (TODO_CHANGE_ORDER, TOMBSTONE_ORDER), settings.SYNC_TOMBSTONE_RETENTION_DAYS * 86400)
+
+        todos = TodoRepository.get_todo_changes(db, user["id"], positions[0], limit, horizon)
+        tombstones = TodoRepository.get_tombstones(db, user["id"], positions[1], limit, horizon)
+
+        return sync_page(todos, tombstones, positions, (TODO_CHANGE_ORDER, TOMBSTONE_ORDER), limit, TodoChangeResponse)
+
+
+    @staticmethod
+    def get_todos_etag(db, user, user_id, pagination, is_completed=None, include_archived=False, fields=None):
+        if user["id"] != user_id and user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, TodoResponse)
+        last_updated, total = TodoRepository.get_todo_list_version(db, user_id, is_completed, include_archived)
+
+        return make_etag("todos", user_id, pagination.limit, pagination.cursor, is_completed, include_archived, fields, last_updated, total)
+
+
+    @staticmethod
+    def get_todo_etag(db, user, todo_id, include_archived=False, fields=None):
+        fields = parse_fields(fields, TodoResponse)
+        version = TodoRepository.get_todo_version(db, todo_id, include_archived)
+
+        if version is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+        if user["id"] != version.owner_id and user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        return make_etag("todo", todo_id, fields, version.updated_at)
+
+
+    @staticmethod
+    def get_todo_fields(db, user, todo_id, fields, include_archived=False):
+        fields = parse_fields(fields, TodoResponse)
+        todo_row = TodoRepository.get_todo_fields(db, todo_id, todo_columns(fields), include_archived)
+
+        if todo_row is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+        if user["id"] != todo_row.owner_id and user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        return dump_fields([todo_row], TodoResponse, fields)[0]
+
+
+    @staticmethod
+    def get_todo_by_id(db, user, todo_id, include_archived=False):
+        todo_model = TodoRepository.get_todo_by_id(db, todo_id)
+
+        if todo_model is None and include_archived:
+            todo_model = TodoRepository.get_archived_todo_by_id(db, todo_id)
 
         if todo_model is None:
             raise HTTPException(status_code=404, detail=MESSAGE_404)
-        
-        if user["id"] != user_id and user["user_role"] != "admin":
+
+        if user["id"] != todo_model.owner_id and user["user_role"] != "admin":
             raise HTTPException(status_code=403, detail=MESSAGE_403)
-        
+
         return todo_model
-    
+
 
     @staticmethod
     def add_todo(db, user, todo_request):        
-        todo_model = Todos(**todo_request.model_dump(), user_id = user["id"])
+        todo_model = Todos(**todo_request.model_dump(), owner_id=user["id"])
 
         try:
             TodoRepository.add_todo(db, todo_model)
+            db.flush()
+
+            record_change(db, "created", todo_model.owner_id, todo_model.id, todo_model)
 
             db.commit()
             db.refresh(todo_model)
 
+            response_cache.invalidate(todos_namespace(user["id"]), todos_namespace())
+
             return todo_model
         
         except IntegrityError:
@@ -45,37 +155,116 @@ class TodoService:
 
     @staticmethod
     def delete_todo_by_id(db, user, todo_id):
-        if user["id"] != TodoRepository.get_user_id_by_todo_id(db, todo_id) and user["user_role"] != "admin":
-            raise HTTPException(status_code=403, detail=MESSAGE_403)
-        
-        todo_model = TodoRepository.get_todo_by_id(db, todo_id)
+        deleted = TodoRepository.delete_todo_by_id(db, todo_id, owner_scope(user))
 
-        if todo_model is None:
-            raise HTTPException(status_code=404, detail=MESSAGE_404)
-        
-        TodoRepository.delete_todo(db, todo_model)
+        if deleted is None:
+            TodoService._raise_not_found_or_forbidden(db, todo_id)
+
+        record_change(db, "deleted", deleted.owner_id, deleted.id)
 
         db.commit()
 
+        response_cache.invalidate(todos_namespace(deleted.owner_id), todos_namespace())
+
 
     @staticmethod
     def update_todo_by_id(db, user, todo_request, todo_id):
-        todo_model = TodoRepository.get_todo_by_id(db, todo_id)
+        changes = todo_request.model_dump(exclude_unset=True)
 
-        if user["id"] !=  todo_model.user_id and user["user_role"] != "admin":
-            raise HTTPException(status_code=403, detail=MESSAGE_403)
+        if not changes:
+            todo_model = TodoRepository.get_todo_by_id(db, todo_id)
+
+            if todo_model is None:
+                raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+            if user["id"] != todo_model.owner_id and user["user_role"] != "admin":
+                raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+            return todo_model
 
-        if todo_model is None:
-            raise HTTPException(status_code=404, detail=MESSAGE_404)
-        
         try:
-            for field, value in todo_request.model_dump(exclude_unset=True).items():
-                setattr(todo_model, field, value)
+            todo_row = TodoRepository.update_todo_by_id(db, todo_id, changes, owner_scope(user))
+
+            if todo_row is None:
+                TodoService._raise_not_found_or_forbidden(db, todo_id)
+
+            record_change(db, "updated", todo_row.owner_id, todo_row.id, todo_row)
 
             db.commit()
         except IntegrityError:
             db.rollback()
 
             raise HTTPException(status_code=409, detail=MESSAGE_409)
+
+        response_cache.invalidate(todos_namespace(todo_row.owner_id), todos_namespace())
         
-        return todo_model
+        return todo_row
+
+
+    @staticmethod
+    def _raise_not_found_or_forbidden(db, todo_id):
+        if TodoRepository.get_user_id_by_todo_id(db, todo_id) is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+        raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+
+    @staticmethod
+    def bulk_add_todos(db, user, bulk_request):
+        rows = [dict(item.model_dump(), owner_id=user["id"]) for item in bulk_request.items]
+
+        try:
+            result = TodoRepository.bulk_add_todos(db, rows)
+
+            for todo in result["created"]:
+                record_change(db, "created", todo.owner_id, todo.id, todo)
+
+            db.commit()
+
+            response_cache.invalidate(todos_namespace(user["id"]), todos_namespace())
+
+            return result
+
+        except IntegrityError:
+            db.rollback()
+
+            raise HTTPException(status_code=409, detail=MESSAGE_409)
+
+
+    @staticmethod
+    def bulk_update_todos(db, user, bulk_request):
+        changes = bulk_request.changes.model_dump(exclude_unset=True)
+
+        if not changes:
+            raise HTTPException(status_code=400, detail=MESSAGE_400_NO_CHANGES)
+
+        try:
+            updated = TodoRepository.bulk_update_todos(db, bulk_request.ids, changes, owner_id=user["id"])
+
+            for todo in updated:
+                record_change(db, "updated", todo.owner_id, todo.id)
+
+            db.commit()
+
+        except IntegrityError:
+            db.rollback()
+
+            raise HTTPException(status_code=409, detail=MESSAGE_409)
+
+        response_cache.invalidate(todos_namespace(user["id"]), todos_namespace())
+
+        return bulk_result(bulk_request.ids, [todo.id for todo in updated])
+
+
+    @staticmethod
+    def bulk_delete_todos(db, user, bulk_request):
+        deleted = TodoRepository.bulk_delete_todos(db, bulk_request.ids, owner_id=user["id"])
+
+        for todo in deleted:
+            record_change(db, "deleted", todo.owner_id, todo.id)
+
+        db.commit()
+
+        response_cache.invalidate(todos_namespace(user["id"]), todos_namespace())
+
+        return bulk_result(bulk_request.ids, [todo.id for todo in deleted])
@@ -1,20 +1,60 @@
 from fastapi import HTTPException
 
+from datetime import date
+
 from sqlalchemy.exc import IntegrityError
 
-from src.repositories.auth_repository import UserRepository
-from src.repositories.todos_repository import TodoRepository
+from src.repositories.auth_repository import UserRepository, user_columns
+from src.repositories.todos_repository import TodoRepository, TODO_EXPORT_COLUMNS, todo_columns
+from src.services.export_services import ExportService
+from src.services.import_services import ImportService
 from src.models.todo_model import Todos
 from src.models.user_model import Users
+from src.utils.constants import MESSAGE_400_NO_CHANGES, EXPORT_CHUNK_SIZE, IMPORT_USERS_MAX_ROWS
+from src.core.response_cache import response_cache, todos_namespace, user_namespace
+from src.core.change_feed import record_change
+from src.schemas.todos_schemas import TodoResponse
+from src.schemas.user_schemas import UserResponseAdmin
+from src.core.serialization import dump_fields
+from src.utils.helpers import bulk_result, dump_model, dump_page, make_etag, summarize_todo_stats, parse_fields
+
+
+MESSAGE_404 = "User(s) or todo(s) not found"
+MESSAGE_403 = "Access denied"
+MESSAGE_409 = "Duplicate values are not accepted"
 
 
 class UserService:
     @staticmethod
-    def get_user_by_id(db, user, user_id):
+    def get_user_etag(db, user, user_id, fields=None):
         if user["user_role"] != "admin":
             raise HTTPException(status_code=403, detail=MESSAGE_403)
 
-        user_model = UserRepository.get_user_by_id(db, user_id)
+        fields = parse_fields(fields, UserResponseAdmin)
+        updated_at = UserRepository.get_user_updated_at(db, user_id)
+
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail=MESSAGE_404)
+
+        return make_etag("user", user_id, fields, updated_at)
+
+
+    @staticmethod
+    def get_user_by_id(db, user, user_id, fields=None):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, UserResponseAdmin)
+
+        def load():
+            if fields is None:
+                return dump_model(UserRepository.get_user_by_id(db, user_id), UserResponseAdmin)
+
+            user_row = UserRepository.get_user_fields(db, user_id, user_columns(fields))
+
+            return None if user_row is None else dump_fields([user_row], UserResponseAdmin, fields)[0]
+
+        user_model = response_cache.get_or_load(user_namespace(user_id), [fields], load)
 
         if user_model is None:
             raise HTTPException(status_code=404, detail=MESSAGE_404)
@@ -23,15 +63,25 @@ class UserService:
     
 
     @staticmethod
-    def get_all_users(db, user):
+    def get_all_users(db, user, pagination, fields=None):
         if user["user_role"] != "admin":
             raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, UserResponseAdmin)
         
-        return UserRepository.get_all_users(db)
+        return response_cache.get_or_load(
+            user_namespace(),
+            [pagination.limit, pagination.cursor, fields],
+            lambda: dump_page(
+                UserRepository.get_all_users(db, pagination.limit, pagination.cursor, user_columns(fields)),
+                UserResponseAdmin,
+                fields
+            )
+        )
 
 
     @staticmethod
-    def register_user(db, user, user_request, bcrypt_context):
+    def register_user(db, user, user_request, password_hasher):
         if user["user_role"] != "admin":
             raise HTTPException(status_code=403, detail=MESSAGE_403)
     
@@ -41,7 +91,7 @@ class UserService:
             last_name=user_request.last_name.title(),
             date_of_birth=user_request.date_of_birth,
             email_address=user_request.email_address,
-            hash_password=bcrypt_context.hash(user_request.password),
+            password_hash=password_hasher.hash(user_request.password),
             role=user_request.role,
             is_active=user_request.is_active
         )
@@ -52,6 +102,8 @@ class UserService:
             db.commit()
             db.refresh(new_user)
 
+            response_cache.invalidate(user_namespace())
+
             return new_user
         
         except IntegrityError:
@@ -70,30 +122,106 @@ class UserService:
         if user_model is None:
             raise HTTPException(status_code=404, detail=MESSAGE_404)
         
+        # The todos relationship does not cascade; deleting them here also
+        # leaves tombstones for delta sync.
+        deleted = TodoRepository.delete_todos_by_owner(db, user_id)
+
+        for todo in deleted:
+            record_change(db, "deleted", todo.owner_id, todo.id)
+
         UserRepository.delete_user_by_id(db, user_model)
 
         db.commit()
 
+        response_cache.invalidate(user_namespace(user_id), user_namespace(), todos_namespace(user_id), todos_namespace())
+
 
     @staticmethod
-    def get_all_todos(db, user):
+    def get_all_todos(db, user, pagination, include_archived=False, fields=None):
         if user["user_role"] != "admin":
             raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, TodoResponse)
     
-        return TodoRepository.get_all_todos(db)
+        return response_cache.get_or_load(
+            todos_namespace(),
+            [pagination.limit, pagination.cursor, include_archived, fields],
+            lambda: dump_page(
+                TodoRepository.get_all_todos(db, pagination.limit, pagination.cursor, include_archived, todo_columns(fields)),
+                TodoResponse,
+                fields
+            )
+        )
     
 
     @staticmethod
-    def search_todos(db, user, search_request):
+    def get_todo_stats(db, user):
         if user["user_role"] != "admin":
             raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        today = date.today()
+
+        return response_cache.get_or_load(
+            todos_namespace(),
+            ["stats", today],
+            lambda: summarize_todo_stats(TodoRepository.get_todo_stats(db, today))
+        )
+
+
+    @staticmethod
+    def search_todos(db, user, search_request, pagination, include_archived=False, fields=None):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        fields = parse_fields(fields, TodoResponse)
         
-        todo_model = TodoRepository.search_todo(db, search_request)
+        todo_page = TodoRepository.search_todo(
+            db, search_request, pagination.limit, pagination.cursor, include_archived, todo_columns(fields)
+        )
 
-        if not todo_model:
+        if not todo_page["items"] and pagination.cursor is None:
             raise HTTPException(status_code=404, detail=MESSAGE_404)
         
-        return todo_model
+        return dump_page(todo_page, TodoResponse, fields)
+    
+    
+    @staticmethod
+    def export_todos(db, user, search_request, export_format):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        partitions = TodoRepository.stream_todos(db, search_request, EXPORT_CHUNK_SIZE)
+        columns = [column.key for column in TODO_EXPORT_COLUMNS]
+
+        return ExportService.encode(partitions, columns, export_format)
+    
+    
+    @staticmethod
+    def import_todos(db, user, stream, import_format):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        report = ImportService.import_todos(db, stream, import_format)
+
+        response_cache.invalidate_all()
+
+        return report
+
+
+    @staticmethod
+    def import_users(db, user, stream, import_format, password_hasher):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        # Hashing shares the bounded pool with logins, so only part of it is
+        # used and uploads are capped; large files go through the CLI.
+        report = ImportService.import_users(
+            db, stream, import_format, password_hasher.hash_many, max_rows=IMPORT_USERS_MAX_ROWS
+        )
+
+        response_cache.invalidate(user_namespace())
+
+        return report
     
     
     @staticmethod
@@ -105,13 +233,87 @@ class UserService:
 
         try:
             TodoRepository.add_todo(db, todo_model)
-            
+            db.flush()
+
+            record_change(db, "created", todo_model.owner_id, todo_model.id, todo_model)
+
             db.commit()
             db.refresh(todo_model)
 
+            response_cache.invalidate(todos_namespace(todo_model.owner_id), todos_namespace())
+
             return todo_model
         
         except IntegrityError:
             db.rollback()
 
-            raise HTTPException(status_code=409, detail=MESSAGE_409)
\ No newline at end of file
+            raise HTTPException(status_code=409, detail=MESSAGE_409)
+
+
+    @staticmethod
+    def bulk_add_todos_admin(db, user, bulk_request):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        try:
+            result = TodoRepository.bulk_add_todos(db, [item.model_dump() for item in bulk_request.items])
+
+            for todo in result["created"]:
+                record_change(db, "created", todo.owner_id, todo.id, todo)
+
+            db.commit()
+
+            owner_ids = {todo.owner_id for todo in result["created"]}
+            response_cache.invalidate(*(todos_namespace(owner_id) for owner_id in owner_ids), todos_namespace())
+
+            return result
+
+        except IntegrityError:
+            db.rollback()
+
+            raise HTTPException(status_code=409, detail=MESSAGE_409)
+
+
+    @staticmethod
+    def bulk_update_todos_admin(db, user, bulk_request):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        changes = bulk_request.changes.model_dump(exclude_unset=True)
+
+        if not changes:
+            raise HTTPException(status_code=400, detail=MESSAGE_400_NO_CHANGES)
+
+        try:
+            updated = TodoRepository.bulk_update_todos(db, bulk_request.ids, changes)
+
+            for todo in updated:
+                record_change(db, "updated", todo.owner_id, todo.id)
+
+            db.commit()
+
+        except IntegrityError:
+            db.rollback()
+
+            raise HTTPException(status_code=409, detail=MESSAGE_409)
+
+        response_cache.invalidate_all()
+
+        return bulk_result(bulk_request.ids, [todo.id for todo in updated])
+
+
+    @staticmethod
+    def bulk_delete_todos_admin(db, user, bulk_request):
+        if user["user_role"] != "admin":
+            raise HTTPException(status_code=403, detail=MESSAGE_403)
+
+        deleted = TodoRepository.bulk_delete_todos(db, bulk_request.ids)
+
+        for todo in deleted:
+            record_change(db, "deleted", todo.owner_id, todo.id)
+
+        db.commit()
+
+        response_cache.invalidate_all()
+
+        return bulk_result(bulk_request.ids, [todo.id for todo in deleted])
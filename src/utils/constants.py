@@ -1,3 +1,20 @@
 MESSAGE_409 = "Duplicate values are not accepted"
 MESSAGE_403 = "Accessing denied"
-MESSAGE_404 = "User(s) not found"
\ No newline at end of file
+MESSAGE_404 = "User(s) not found"
+MESSAGE_400_CURSOR = "Invalid pagination cursor"
+MESSAGE_400_WATERMARK = "Invalid sync watermark"
+MESSAGE_410_WATERMARK = "Sync watermark expired, resync required"
+MESSAGE_400_FIELDS = "Unknown or empty field selection"
+MESSAGE_400_NO_CHANGES = "No fields to update"
+MESSAGE_413_IMPORT = "Too many rows for an HTTP users import; load large files with python -m src.cli.import_data"
+
+TODO_BULK_LIMIT = 500
+
+EXPORT_CHUNK_SIZE = 1000
+
+IMPORT_CHUNK_SIZE = 5000
+IMPORT_MAX_REPORTED_REJECTIONS = 1000
+# Every row costs a bcrypt hash, so HTTP users imports are kept short.
+IMPORT_USERS_MAX_ROWS = 1000
+
+DEADLINE_BUCKETS = ("overdue", "today", "this_week", "later")
\ No newline at end of file
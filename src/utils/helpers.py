@@ -0,0 +1,228 @@
+import base64
+import hashlib
+import json
+import time
+from datetime import date, datetime
+
+from fastapi import HTTPException, Response
+from sqlalchemy import tuple_
+
+from src.utils.constants import MESSAGE_400_CURSOR, MESSAGE_400_WATERMARK, MESSAGE_410_WATERMARK, MESSAGE_400_FIELDS, DEADLINE_BUCKETS
+from src.core.serialization import dump_rows, dump_fields
+from src.models.todo_model import TodoPriority
+
+
+def encode_cursor(values: list) -> str:
+    payload = json.dumps(values, default=str, separators=(",", ":"))
+
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns) -> list:
+    try:
+        return _coerce_position(_load_cursor(cursor), columns)
+
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail=MESSAGE_400_CURSOR)
+
+
+# A sync watermark holds the time it was issued and one keyset position per
+# change stream; None means the stream has not been read yet.
+def encode_watermark(*positions) -> str:
+    return encode_cursor([int(time.time()), *(None if position is None else list(position) for position in positions)])
+
+
+# Tombstones are only kept for `max_age` seconds, so an older watermark may
+# have missed deletes and the client has to start over.
+def decode_watermark(watermark: str, orders, max_age: float) -> list:
+    try:
+        issued_at, *positions = _load_cursor(watermark)
+
+        if not isinstance(issued_at, int) or len(positions) != len(orders):
+            raise ValueError(watermark)
+
+        positions = [
+            None if position is None else _coerce_position(position, columns)
+            for position, columns in zip(positions, orders)
+        ]
+
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail=MESSAGE_400_WATERMARK)
+
+    if time.time() - issued_at > max_age:
+        raise HTTPException(status_code=410, detail=MESSAGE_410_WATERMARK)
+
+    return positions
+
+
+def row_position(row, columns) -> list:
+    return [getattr(row, column.key) for column in columns]
+
+
+def _load_cursor(cursor: str):
+    return json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+
+
+def _coerce_position(values, columns) -> list:
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError(values)
+
+    return [_coerce_cursor_value(column, value) for column, value in zip(columns, values)]
+
+
+def _coerce_cursor_value(column, value):
+    python_type = column.type.python_type
+
+    if python_type is date:
+        return date.fromisoformat(value)
+
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+
+    return python_type(value)
+
+
+# Keyset pagination: filter on the sort key instead of OFFSET, so the cost of a
+# page does not depend on how deep it is. One extra row tells us whether there
+# is a next page.
+def keyset_paginate(query, columns, limit: int, cursor: str | None):
+    if cursor is not None:
+        query = query.filter(tuple_(*columns) > tuple_(*decode_cursor(cursor, columns)))
+
+    return query.order_by(*columns).limit(limit + 1)
+
+
+def keyset_page(rows, columns, limit: int) -> dict:
+    rows = list(rows)
+    next_cursor = None
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(row_position(rows[-1], columns))
+
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+# One delta sync response: up to `limit` rows from each stream. The watermark
+# only advances a stream past rows that were actually returned. Items are
+# dumped by field name so the ordering columns stay out of the response.
+def sync_page(todos, tombstones, positions: list, orders, limit: int, schema) -> dict:
+    has_more = len(todos) > limit or len(tombstones) > limit
+    todos, tombstones = todos[:limit], tombstones[:limit]
+    todo_position, tombstone_position = positions
+
+    if todos:
+        todo_position = row_position(todos[-1], orders[0])
+
+    if tombstones:
+        tombstone_position = row_position(tombstones[-1], orders[1])
+
+    return {
+        "items": dump_fields(todos, schema, tuple(schema.model_fields)),
+        "deleted": [tombstone.todo_id for tombstone in tombstones if not tombstone.is_archived],
+        "archived": [tombstone.todo_id for tombstone in tombstones if tombstone.is_archived],
+        "watermark": encode_watermark(todo_position, tombstone_position),
+        "has_more": has_more,
+    }
+
+
+def like_contains(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    return f"%{escaped}%"
+
+
+def bulk_result(requested_ids: list[int], succeeded_ids: list[int]) -> dict:
+    succeeded = set(succeeded_ids)
+
+    return {
+        "succeeded": sorted(succeeded),
+        "not_found": sorted(set(requested_ids) - succeeded),
+    }
+
+
+def owner_scope(user: dict) -> int | None:
+    return None if user["user_role"] == "admin" else user["id"]
+
+
+# Cached responses must not hold session-bound ORM objects, so reads are
+# dumped to plain dicts through their response schema before caching.
+def dump_model(model, schema) -> dict | None:
+    if model is None:
+        return None
+
+    return schema.model_validate(model).model_dump()
+
+
+def dump_page(page: dict, schema, fields: tuple[str, ...] | None = None) -> dict:
+    return {
+        "items": dump_rows(page["items"], schema) if fields is None else dump_fields(page["items"], schema, fields),
+        "next_cursor": page["next_cursor"],
+    }
+
+
+# `fields=a,b` query parameter -> the selected schema fields in schema order,
+# so equivalent selections share cache entries and ETags.
+def parse_fields(fields: str | None, schema) -> tuple[str, ...] | None:
+    if fields is None:
+        return None
+
+    selected = {name.strip() for name in fields.split(",")} - {""}
+
+    if not selected or not selected <= schema.model_fields.keys():
+        raise HTTPException(status_code=400, detail=MESSAGE_400_FIELDS)
+
+    return tuple(name for name in schema.model_fields if name in selected)
+
+
+# The selected columns plus whatever the keyset order needs to build a cursor.
+def projection(columns, order) -> tuple:
+    keys = {column.key for column in columns}
+
+    return (*columns, *(column for column in order if column.key not in keys))
+
+
+# Folds the (priority, is_completed, deadline_bucket, count) groups of one
+# aggregate query into per-dimension totals, with zeros for empty groups.
+def summarize_todo_stats(rows) -> dict:
+    stats = {
+        "total": 0,
+        "by_priority": {priority: 0 for priority in TodoPriority},
+        "by_status": {"completed": 0, "open": 0},
+        "by_deadline": {bucket: 0 for bucket in DEADLINE_BUCKETS},
+        "groups": [],
+    }
+
+    for priority, is_completed, deadline_bucket, count in rows:
+        stats["total"] += count
+        stats["by_priority"][priority] += count
+        stats["by_status"]["completed" if is_completed else "open"] += count
+        stats["by_deadline"][deadline_bucket] += count
+        stats["groups"].append({
+            "priority": priority,
+            "is_completed": is_completed,
+            "deadline_bucket": deadline_bucket,
+            "count": count,
+        })
+
+    return stats
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b(json.dumps(parts, default=str).encode(), digest_size=12).hexdigest()
+
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return etag.removeprefix("W/") in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
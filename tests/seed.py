@@ -0,0 +1,29 @@
+# Set-based seeding shared by the EXPLAIN tests and the benchmarks. Everything
+# runs inside a transaction that the caller rolls back, so no data is left behind.
+SEED_USERS = """
+    INSERT INTO users (username, first_name, last_name, date_of_birth, email_address, password_hash, role, is_active)
+    SELECT 'bench_' || g, 'Bench', 'User', DATE '1990-01-01', 'bench_' || g || '@example.com', 'x', 'user', true
+    FROM generate_series(1, :users) AS g
+    RETURNING id
+"""
+
+SEED_TODOS = """
+    INSERT INTO todos (title, deadline, description, priority, is_completed, owner_id)
+    SELECT
+        'task ' || md5(g::text),
+        DATE '2026-01-01' + (g % 730),
+        'note ' || md5((g * 7)::text),
+        (ARRAY['very_high', 'high', 'medium', 'low'])[1 + g % 4]::todopriority,
+        g % 3 = 0,
+        :first_user + g % :users
+    FROM generate_series(:start, :stop) AS g
+"""
+
+
+# Compiled against the session's connection rather than a module-level engine:
+# only a dialect that has connected knows the server's string escaping rules.
+def explain(db, query) -> list[str]:
+    connection = db.connection()
+    compiled = query.compile(connection)
+
+    return connection.exec_driver_sql(f"EXPLAIN {compiled}", compiled.params).scalars().all()
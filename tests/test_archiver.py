@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+
+import pytest
+
+from src.core.archiver import TodoArchiver
+from src.core.change_feed import change_broker
+from src.models.todo_model import TodoTombstones
+from tests.conftest import add_todos, auth_headers
+
+
+@pytest.fixture
+def archiver(session_factory):
+    return TodoArchiver(session_factory, archive_after_days=90, batch_size=2, batch_pause=0, interval=3600)
+
+
+def test_only_old_completed_todos_are_archived(archiver, db, alice):
+    today = date.today()
+    old_done = add_todos(db, alice, 3, is_completed=True, deadline=today - timedelta(days=200))
+    add_todos(db, alice, 1, deadline=today - timedelta(days=300))
+    add_todos(db, alice, 1, is_completed=True, deadline=today - timedelta(days=10))
+
+    assert archiver.run_once(today) == len(old_done)
+    assert archiver.run_once(today) == 0
+
+
+def test_archived_todos_are_readable_on_request(client, archiver, db, alice):
+    todo = add_todos(db, alice, 1, is_completed=True, deadline=date.today() - timedelta(days=200))[0]
+    todo_id, title = todo.id, todo.title
+    headers = auth_headers(alice)
+
+    archiver.run_once()
+
+    assert client.get(f"/todos/{todo_id}", headers=headers).status_code == 404
+    assert client.get(f"/todos/{todo_id}", headers=headers, params={"include_archived": "true"}).json()["title"] == title
+
+    listed = client.get(f"/todos/users/{alice.id}/todos", headers=headers, params={"include_archived": "true"}).json()
+    assert [item["id"] for item in listed["items"]] == [todo_id]
+    assert client.get(f"/todos/users/{alice.id}/todos", headers=headers).json()["items"] == []
+
+
+
+def test_archived_todos_leave_tombstones_and_change_events(archiver, db, alice):
+    old_done = add_todos(db, alice, 3, is_completed=True, deadline=date.today() - timedelta(days=200))
+    todo_ids = sorted(todo.id for todo in old_done)
+    published = []
+
+    change_broker.add_listener(published.append)
+
+    try:
+        archiver.run_once()
+    finally:
+        change_broker.remove_listener(published.append)
+
+    assert sorted(tombstone.todo_id for tombstone in db.query(TodoTombstones).filter(TodoTombstones.is_archived)) == todo_ids
+    assert sorted(change["todo_id"] for change in published if change["op"] == "archived") == todo_ids
+
+
+def test_delta_sync_reports_archived_todos_apart_from_deleted(client, archiver, db, alice):
+    old_done = add_todos(db, alice, 1, is_completed=True, deadline=date.today() - timedelta(days=200))[0]
+    removed = add_todos(db, alice, 1)[0]
+    archived_id, removed_id = old_done.id, removed.id
+    headers = auth_headers(alice)
+
+    watermark = client.get("/todos/changes", headers=headers).json()["watermark"]
+
+    archiver.run_once()
+    client.delete(f"/todos/{removed_id}", headers=headers)
+
+    delta = client.get("/todos/changes", headers=headers, params={"since": watermark}).json()
+
+    assert delta["archived"] == [archived_id]
+    assert delta["deleted"] == [removed_id]
@@ -0,0 +1,150 @@
+import asyncio
+import time
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from src.core.change_feed import ChangeBroker, RESET, change_broker, record_change
+from src.services.change_feed_services import ChangeFeedService
+from tests.conftest import add_todos, auth_headers
+
+
+@pytest.fixture
+def published():
+    changes = []
+    change_broker.add_listener(changes.append)
+
+    yield changes
+
+    change_broker.remove_listener(changes.append)
+
+
+def test_committed_writes_are_published(client, db, alice, published):
+    todo = add_todos(db, alice, 1)[0]
+    headers = auth_headers(alice)
+
+    client.put(f"/todos/{todo.id}", headers=headers, json={"is_completed": True})
+    client.delete(f"/todos/{todo.id}", headers=headers)
+
+    assert [(change["op"], change["todo_id"]) for change in published] == [("updated", todo.id), ("deleted", todo.id)]
+    assert published[0]["owner_id"] == alice.id
+
+
+def test_rolled_back_changes_are_dropped(db, alice, published):
+    todo = add_todos(db, alice, 1)[0]
+
+    record_change(db, "deleted", alice.id, todo.id)
+    db.rollback()
+
+    assert published == []
+
+
+def test_reconnecting_subscriber_gets_missed_events():
+    broker = ChangeBroker(buffer_size=10, queue_size=10)
+
+    async def replay(last_seq):
+        broker.publish([
+            {"op": "created", "owner_id": 1, "todo_id": 1, "todo": None},
+            {"op": "created", "owner_id": 2, "todo_id": 2, "todo": None},
+            {"op": "deleted", "owner_id": 1, "todo_id": 1, "todo": None},
+        ])
+
+        subscription = broker.subscribe(1, last_seq)
+
+        try:
+            return [await subscription.get(0.1) for _ in range(2)]
+        finally:
+            subscription.close()
+
+    missed = asyncio.run(replay(1))
+
+    assert [change["op"] if change else None for change in missed] == ["deleted", None]
+
+
+def test_unknown_position_asks_the_client_to_reload():
+    broker = ChangeBroker(buffer_size=10, queue_size=10)
+
+    async def replay():
+        subscription = broker.subscribe(1, 42)
+
+        try:
+            return await subscription.get(0.1)
+        finally:
+            subscription.close()
+
+    broker.publish([{"op": "created", "owner_id": 1, "todo_id": 1, "todo": None}])
+
+    assert asyncio.run(replay()) is RESET
+
+
+def test_sse_stream_subscribes_only_while_it_runs():
+    async def stream():
+        events = ChangeFeedService.sse_events(1)
+
+        assert change_broker._subscribers == {}
+
+        change_broker.publish([{"op": "created", "owner_id": 1, "todo_id": 1, "todo": None}])
+        first = asyncio.ensure_future(events.__anext__())
+        await asyncio.sleep(0)
+
+        assert set(change_broker._subscribers) == {1}
+
+        change_broker.publish([{"op": "deleted", "owner_id": 1, "todo_id": 1, "todo": None}])
+        event = await first
+        await events.aclose()
+
+        return event
+
+    assert stream_event_op(asyncio.run(stream())) == "deleted"
+    assert change_broker._subscribers == {}
+
+
+def stream_event_op(event: str) -> str:
+    return next(line.split(": ", 1)[1] for line in event.splitlines() if line.startswith("event:"))
+
+
+def test_sse_feed_of_another_user_is_forbidden(client, alice, bob):
+    assert client.get(f"/todos/users/{bob.id}/feed", headers=auth_headers(alice)).status_code == 403
+
+
+def wait_for_subscriber(owner_id: int):
+    deadline = time.monotonic() + 5
+
+    while owner_id not in change_broker._subscribers and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_websocket_token_as_subprotocol(client, alice):
+    token = auth_headers(alice)["Authorization"].split()[1]
+
+    with client.websocket_connect(f"/todos/users/{alice.id}/feed/ws", subprotocols=["bearer", token]) as websocket:
+        assert websocket.accepted_subprotocol == "bearer"
+
+        wait_for_subscriber(alice.id)
+        change_broker.publish([{"op": "created", "owner_id": alice.id, "todo_id": 7, "todo": None}])
+
+        assert websocket.receive_json()["todo_id"] == 7
+
+
+def test_websocket_token_as_first_message(client, alice):
+    token = auth_headers(alice)["Authorization"].split()[1]
+
+    with client.websocket_connect(f"/todos/users/{alice.id}/feed/ws") as websocket:
+        websocket.send_json({"token": token})
+
+        wait_for_subscriber(alice.id)
+        change_broker.publish([{"op": "created", "owner_id": alice.id, "todo_id": 8, "todo": None}])
+
+        assert websocket.receive_json()["todo_id"] == 8
+
+
+@pytest.mark.parametrize("message", [{"token": "not a jwt"}, {"nothing": True}])
+def test_websocket_without_a_valid_token_is_closed(client, alice, message):
+    with client.websocket_connect(f"/todos/users/{alice.id}/feed/ws") as websocket:
+        websocket.send_json(message)
+
+        with pytest.raises(WebSocketDisconnect) as closed:
+            websocket.receive_json()
+
+    assert closed.value.code == 1008
+    assert change_broker._subscribers == {}
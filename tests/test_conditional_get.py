@@ -0,0 +1,44 @@
+from tests.conftest import add_todos, auth_headers
+
+
+def test_unchanged_list_is_not_modified(client, db, alice):
+    add_todos(db, alice, 2)
+    url = f"/todos/users/{alice.id}/todos"
+    headers = auth_headers(alice)
+
+    etag = client.get(url, headers=headers).headers["etag"]
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_list_etag_changes_after_a_write(client, db, alice):
+    todo = add_todos(db, alice, 2)[0]
+    url = f"/todos/users/{alice.id}/todos"
+    headers = auth_headers(alice)
+
+    etag = client.get(url, headers=headers).headers["etag"]
+    client.put(f"/todos/{todo.id}", headers=headers, json={"is_completed": True})
+
+    assert client.get(url, headers={**headers, "If-None-Match": etag}).status_code == 200
+
+
+def test_detail_etag_follows_updates(client, db, alice):
+    todo = add_todos(db, alice, 1)[0]
+    headers = auth_headers(alice)
+
+    etag = client.get(f"/todos/{todo.id}", headers=headers).headers["etag"]
+    assert client.get(f"/todos/{todo.id}", headers={**headers, "If-None-Match": etag}).status_code == 304
+
+    client.put(f"/todos/{todo.id}", headers=headers, json={"title": "renamed todo"})
+    response = client.get(f"/todos/{todo.id}", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "renamed todo"
+
+
+def test_conditional_get_still_checks_access(client, db, alice, bob):
+    todo = add_todos(db, alice, 1)[0]
+
+    assert client.get(f"/todos/{todo.id}", headers={**auth_headers(bob), "If-None-Match": "*"}).status_code == 403
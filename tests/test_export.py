@@ -0,0 +1,31 @@
+import csv
+import io
+import json
+from datetime import date
+
+from tests.conftest import add_todos, auth_headers
+
+
+def test_ndjson_export_streams_every_todo(client, db, admin, alice):
+    todos = add_todos(db, alice, 3)
+
+    response = client.get("/users/todos/export", headers=auth_headers(admin))
+    rows = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [row["title"] for row in rows] == [todo.title for todo in todos]
+
+
+def test_csv_export_applies_search_filters(client, db, admin, alice):
+    add_todos(db, alice, 2)
+    add_todos(db, alice, 1, is_completed=True, deadline=date(2031, 1, 1))
+
+    response = client.get("/users/todos/export", headers=auth_headers(admin), params={"format": "csv", "is_completed": "true"})
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+
+    assert len(rows) == 1
+    assert rows[0]["is_completed"] == "True"
+
+
+def test_export_is_admin_only(client, alice):
+    assert client.get("/users/todos/export", headers=auth_headers(alice)).status_code == 403
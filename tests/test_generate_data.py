@@ -0,0 +1,14 @@
+import random
+from datetime import date
+
+from src.cli.generate_data import todo_row, TODO_COLUMNS
+from src.models.todo_model import TodoPriority
+
+
+def test_generated_todos_always_have_a_description():
+    rng = random.Random(1)
+    priorities = list(TodoPriority)
+
+    rows = [todo_row(rng, 1, sequence, date(2030, 1, 1), priorities, [1] * len(priorities)) for sequence in range(500)]
+
+    assert all(row[TODO_COLUMNS.index("description")] for row in rows)
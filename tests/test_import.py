@@ -0,0 +1,127 @@
+import io
+import json
+from collections import namedtuple
+
+import pytest
+from fastapi import HTTPException
+
+from src.core.change_feed import change_broker
+from src.repositories.import_repository import ImportRepository
+from src.services.import_services import ImportService
+from tests.conftest import auth_headers
+
+
+def ndjson(*records) -> bytes:
+    return "".join(json.dumps(record) + "\n" for record in records).encode()
+
+
+def todo_record(owner_id: int, title: str, **overrides) -> dict:
+    return {
+        "title": title, "deadline": "2030-01-01", "description": "imported",
+        "priority": "low", "is_completed": False, "owner_id": owner_id, **overrides,
+    }
+
+
+def import_todos(client, admin, payload: bytes, import_format: str = "ndjson"):
+    return client.post(
+        "/users/todos/import",
+        headers=auth_headers(admin),
+        params={"format": import_format},
+        files={"file": (f"todos.{import_format}", io.BytesIO(payload))},
+    )
+
+
+def test_bad_rows_are_rejected_and_the_rest_imported(pg_client, pg_admin, pg_alice):
+    payload = ndjson(
+        todo_record(pg_alice.id, "imported one"),
+        todo_record(pg_alice.id, "no description", description=None),
+        todo_record(9_999_999, "unknown owner"),
+        todo_record(pg_alice.id, "imported one"),
+        {"title": "x"},
+    ) + b"not json\n"
+
+    response = import_todos(pg_client, pg_admin, payload)
+    report = response.json()
+
+    assert response.status_code == 200
+    assert report["inserted"] == 1
+    assert [rejection["line"] for rejection in report["rejected"]] == [2, 3, 4, 5, 6]
+    assert report["rejected"][0]["reason"] == "description: Field required"
+
+
+def test_csv_rows_without_a_description_are_rejected(pg_client, pg_admin, pg_alice):
+    payload = (
+        "title,deadline,priority,is_completed,owner_id\n"
+        f"from csv file,2030-01-01,low,false,{pg_alice.id}\n"
+    ).encode()
+
+    report = import_todos(pg_client, pg_admin, payload, "csv").json()
+
+    assert report["inserted"] == 0
+    assert report["rejected"] == [{"line": 2, "reason": "description: Field required"}]
+
+
+def test_import_is_admin_only(pg_client, pg_alice):
+    assert import_todos(pg_client, pg_alice, ndjson(todo_record(pg_alice.id, "imported one"))).status_code == 403
+
+
+# Validation runs before anything reaches the database, so it can be checked
+# without PostgreSQL by recording what would have been copied.
+def test_rows_without_a_description_never_reach_staging(monkeypatch):
+    copied = []
+
+    monkeypatch.setattr(ImportRepository, "create_staging", staticmethod(lambda db, staging: None))
+    monkeypatch.setattr(ImportRepository, "copy_rows", staticmethod(lambda db, staging, rows: copied.extend(rows)))
+    monkeypatch.setattr(ImportRepository, "merge_staging", staticmethod(lambda db, staging: []))
+
+    class Session:
+        def commit(self):
+            pass
+
+    stream = io.StringIO(ndjson(todo_record(1, "has description"), todo_record(1, "missing", description=None)).decode())
+    report = ImportService.import_todos(Session(), stream, "ndjson")
+
+    assert [row[1] for row in copied] == ["has description"]
+    assert report["rejected"] == [{"line": 2, "reason": "description: Field required"}]
+
+
+def test_http_users_import_is_capped(monkeypatch):
+    monkeypatch.setattr(ImportRepository, "create_staging", staticmethod(lambda db, staging: None))
+    monkeypatch.setattr(ImportRepository, "copy_rows", staticmethod(lambda db, staging, rows: None))
+    monkeypatch.setattr(ImportRepository, "merge_staging", staticmethod(lambda db, staging: []))
+
+    class Session:
+        def rollback(self):
+            pass
+
+    stream = io.StringIO(ndjson(*({"username": f"member{index}"} for index in range(3))).decode())
+
+    with pytest.raises(HTTPException) as error:
+        ImportService.import_users(Session(), stream, "ndjson", lambda passwords: passwords, max_rows=2)
+
+    assert error.value.status_code == 413
+
+
+
+Merged = namedtuple("Merged", "line_no reason todo_id owner_id")
+
+
+def test_imported_todos_are_recorded_as_changes(db, monkeypatch):
+    published = []
+
+    monkeypatch.setattr(ImportRepository, "create_staging", staticmethod(lambda db, staging: None))
+    monkeypatch.setattr(ImportRepository, "copy_rows", staticmethod(lambda db, staging, rows: None))
+    monkeypatch.setattr(ImportRepository, "merge_staging", staticmethod(lambda db, staging: [
+        Merged(1, None, 41, 7), Merged(2, "unknown owner_id", None, None),
+    ]))
+
+    stream = io.StringIO(ndjson(todo_record(7, "first"), todo_record(9, "second")).decode())
+    change_broker.add_listener(published.append)
+
+    try:
+        report = ImportService.import_todos(db, stream, "ndjson")
+    finally:
+        change_broker.remove_listener(published.append)
+
+    assert report["inserted"] == 1
+    assert [(change["op"], change["owner_id"], change["todo_id"]) for change in published] == [("created", 7, 41)]
@@ -0,0 +1,18 @@
+from tests.conftest import auth_headers
+
+
+def test_metrics_expose_request_counts(client, alice):
+    client.get(f"/todos/users/{alice.id}/todos", headers=auth_headers(alice))
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'route="/todos/users/{user_id}/todos"' in response.text
+
+
+def test_sync_mode_reports_only_the_sync_pool(client):
+    body = client.get("/metrics").text
+
+    assert 'db_pool_size{engine="sync"}' in body
+    assert 'engine="async"' not in body
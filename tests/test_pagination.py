@@ -0,0 +1,48 @@
+from tests.conftest import add_todos, add_user, auth_headers
+
+
+def test_user_todos_are_paged_by_cursor(client, db, alice):
+    add_todos(db, alice, 5)
+
+    seen = []
+    cursor = None
+
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        page = client.get(f"/todos/users/{alice.id}/todos", headers=auth_headers(alice), params=params).json()
+
+        assert len(page["items"]) <= 2
+        seen += [todo["id"] for todo in page["items"]]
+        cursor = page["next_cursor"]
+
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
+def test_page_order_follows_deadline(client, db, alice):
+    todos = add_todos(db, alice, 3)
+
+    page = client.get(f"/todos/users/{alice.id}/todos", headers=auth_headers(alice)).json()
+
+    assert [todo["id"] for todo in page["items"]] == [todo.id for todo in todos]
+
+
+def test_invalid_cursor_is_rejected(client, alice):
+    response = client.get(f"/todos/users/{alice.id}/todos", headers=auth_headers(alice), params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+
+def test_admin_user_list_is_paged(client, db, admin):
+    for index in range(4):
+        add_user(db, f"member{index}")
+
+    first = client.get("/users/users", headers=auth_headers(admin), params={"limit": 3}).json()
+    second = client.get("/users/users", headers=auth_headers(admin), params={"limit": 3, "cursor": first["next_cursor"]}).json()
+
+    assert len(first["items"]) == 3
+    assert len(second["items"]) == 2
+    assert second["next_cursor"] is None
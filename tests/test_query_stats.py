@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from db.query_stats import RequestQueryStats, current_query_stats, instrument_engine
+
+
+@pytest.fixture
+def stats():
+    stats = RequestQueryStats()
+    token = current_query_stats.set(stats)
+
+    yield stats
+
+    current_query_stats.reset(token)
+
+
+def test_failed_statements_leave_no_timing_state(stats):
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, slow_query_seconds=60)
+
+    with engine.connect() as connection:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing_table"))
+
+        connection.execute(text("SELECT 1"))
+
+        assert "query_started" not in connection.info
+
+    assert stats.statements == 1
+    assert stats.slowest_statement == "SELECT 1"
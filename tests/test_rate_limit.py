@@ -0,0 +1,59 @@
+import pytest
+from pydantic import ValidationError
+from starlette.requests import Request
+
+from db.config import Settings
+from src.core.security import login_rate_limiter
+from tests.conftest import PASSWORD
+
+
+def login(client, username: str, password: str, headers: dict | None = None):
+    return client.post("/auth/token", data={"username": username, "password": password}, headers=headers)
+
+
+def test_successful_logins_do_not_use_up_the_username_bucket(client, alice):
+    for _ in range(login_rate_limiter.username_limit[0] + 2):
+        assert login(client, alice.username, PASSWORD).status_code == 200
+
+
+def test_failed_logins_lock_the_username(client, alice):
+    for _ in range(login_rate_limiter.username_limit[0]):
+        assert login(client, alice.username, "wrong password").status_code == 401
+
+    response = login(client, alice.username, PASSWORD)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+def request_from(peer: str, forwarded: str | None = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+
+    return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+
+def test_client_ip_is_the_peer_without_trusted_proxies():
+    assert login_rate_limiter.client_ip(request_from("10.0.0.1", "1.2.3.4")) == "10.0.0.1"
+
+
+def test_client_ip_skips_the_trusted_proxy_hops(monkeypatch):
+    monkeypatch.setattr(login_rate_limiter, "trusted_proxy_hops", 1)
+
+    assert login_rate_limiter.client_ip(request_from("10.0.0.1", "6.6.6.6, 1.2.3.4")) == "1.2.3.4"
+    assert login_rate_limiter.client_ip(request_from("10.0.0.1")) == "10.0.0.1"
+
+
+def test_clients_behind_a_proxy_get_their_own_ip_bucket(client, alice, monkeypatch):
+    monkeypatch.setattr(login_rate_limiter, "trusted_proxy_hops", 1)
+
+    for attempt in range(login_rate_limiter.ip_limit[0]):
+        login(client, f"nobody_{attempt}", "wrong password", {"X-Forwarded-For": "1.2.3.4"})
+
+    assert login(client, "someone_else", "x", {"X-Forwarded-For": "1.2.3.4"}).status_code == 429
+    assert login(client, alice.username, PASSWORD, {"X-Forwarded-For": "5.6.7.8"}).status_code == 200
+
+
+@pytest.mark.parametrize("name", ["LOGIN_IP_PER_MINUTE", "LOGIN_USERNAME_PER_MINUTE"])
+def test_refill_rates_must_be_positive(name):
+    with pytest.raises(ValidationError):
+        Settings(**{name: 0})
@@ -0,0 +1,117 @@
+from datetime import date, timedelta
+
+import pytest
+
+from db.config import settings
+from src.core.change_feed import change_broker
+from src.core.reminders import DeadlineScheduler, ReminderSink
+from tests.conftest import add_todos, auth_headers
+
+
+class ListSink(ReminderSink):
+    def __init__(self):
+        self.sent = []
+
+
+    def send(self, reminders):
+        self.sent += reminders
+
+
+@pytest.fixture
+def sink():
+    return ListSink()
+
+
+@pytest.fixture
+def scheduler(session_factory, sink):
+    return DeadlineScheduler(
+        session_factory, sink, capacity=10, lead_days=1, batch_size=5, interval=60, refresh_interval=900
+    )
+
+
+def test_due_open_todos_are_reminded_once(scheduler, sink, db, alice):
+    today = date.today()
+    due = add_todos(db, alice, 2, deadline=today)
+    add_todos(db, alice, 1, deadline=today + timedelta(days=10))
+    add_todos(db, alice, 1, is_completed=True, deadline=today)
+
+    assert scheduler.run_once(today) == 2
+    assert scheduler.run_once(today) == 0
+    assert sorted(reminder["todo_id"] for reminder in sink.sent) == sorted(todo.id for todo in due)
+
+
+def test_refills_skip_reminded_todos_beyond_capacity(scheduler, sink, db, alice):
+    today = date.today()
+    due = [todo for _ in range(25) for todo in add_todos(db, alice, 1, deadline=today)]
+
+    while scheduler.run_once(today):
+        pass
+
+    assert sorted(reminder["todo_id"] for reminder in sink.sent) == sorted(todo.id for todo in due)
+
+
+def test_refill_finds_todos_moved_before_sent_ones(scheduler, sink, db, alice):
+    today = date.today()
+    add_todos(db, alice, 1, deadline=today + timedelta(days=1))
+    moved = add_todos(db, alice, 1, deadline=today + timedelta(days=10))[0]
+
+    assert scheduler.run_once(today) == 1
+
+    # Written without a change event, so only a refill can pick it up.
+    moved.deadline = today
+    db.commit()
+    scheduler.refresh_interval = 0
+
+    assert scheduler.run_once(today) == 1
+    assert sink.sent[-1]["todo_id"] == moved.id
+
+
+def test_heap_follows_change_events(scheduler, sink, db, alice):
+    today = date.today()
+    todo = add_todos(db, alice, 1, deadline=today + timedelta(days=10))[0]
+
+    scheduler.run_once(today)
+    scheduler.on_change({
+        "op": "updated", "owner_id": alice.id, "todo_id": todo.id,
+        "todo": {"deadline": today.isoformat(), "is_completed": False, "owner_id": alice.id, "title": todo.title},
+    })
+
+    assert scheduler.run_once(today) == 1
+    assert sink.sent[0]["due_in_days"] == 0
+
+
+def test_failed_delivery_is_retried(scheduler, db, alice):
+    today = date.today()
+    add_todos(db, alice, 1, deadline=today)
+
+    class FailingOnce(ListSink):
+        def send(self, reminders):
+            if not hasattr(self, "failed"):
+                self.failed = True
+                raise RuntimeError("sink down")
+
+            super().send(reminders)
+
+    scheduler.sink = FailingOnce()
+
+    assert scheduler.run_once(today) == 0
+    assert scheduler.run_once(today) == 1
+
+
+
+def test_scheduler_hears_writes_with_the_change_feed_off(scheduler, sink, client, db, alice, monkeypatch):
+    monkeypatch.setattr(settings, "CHANGE_FEED_ENABLED", False)
+    monkeypatch.setattr(settings, "REMINDERS_ENABLED", True)
+
+    today = date.today()
+    todo = add_todos(db, alice, 1, deadline=today + timedelta(days=10))[0]
+
+    scheduler.run_once(today)
+    change_broker.add_listener(scheduler.on_change)
+
+    try:
+        client.put(f"/todos/{todo.id}", headers=auth_headers(alice), json={"deadline": today.isoformat()})
+    finally:
+        change_broker.remove_listener(scheduler.on_change)
+
+    assert scheduler.run_once(today) == 1
@@ -0,0 +1,131 @@
+import time
+
+import pytest
+
+from db.config import settings
+from src.core.response_cache import (
+    response_cache, build_cache_backend, LocalCacheBackend, PostgresCacheBackend, ResponseCache
+)
+from tests.conftest import add_todos, auth_headers
+
+
+@pytest.fixture(autouse=True)
+def cache_enabled(monkeypatch):
+    monkeypatch.setattr(response_cache, "enabled", True)
+
+
+def cached_entries() -> int:
+    return len(response_cache.backend.values)
+
+
+def test_repeated_reads_are_served_from_the_cache(client, db, alice):
+    add_todos(db, alice, 2)
+    url = f"/todos/users/{alice.id}/todos"
+
+    first = client.get(url, headers=auth_headers(alice)).json()
+    hits = response_cache.backend.values.hits
+    second = client.get(url, headers=auth_headers(alice)).json()
+
+    assert second == first
+    assert response_cache.backend.values.hits == hits + 1
+
+
+@pytest.mark.parametrize("write", ["create", "update", "delete"])
+def test_writes_invalidate_owner_and_admin_lists(client, db, admin, alice, write):
+    todo = add_todos(db, alice, 2)[0]
+    headers = auth_headers(alice)
+    own_url = f"/todos/users/{alice.id}/todos"
+
+    client.get(own_url, headers=headers)
+    client.get("/users/todos", headers=auth_headers(admin))
+
+    if write == "create":
+        client.post("/todos", headers=headers, json={
+            "title": "fresh todo", "deadline": "2031-01-01", "description": "new",
+            "priority": "low", "is_completed": False,
+        })
+        expected = 3
+    elif write == "update":
+        client.put(f"/todos/{todo.id}", headers=headers, json={"title": "renamed todo"})
+        expected = 2
+    else:
+        client.delete(f"/todos/{todo.id}", headers=headers)
+        expected = 1
+
+    own = client.get(own_url, headers=headers).json()["items"]
+    everyone = client.get("/users/todos", headers=auth_headers(admin)).json()["items"]
+
+    assert len(own) == len(everyone) == expected
+
+    if write == "update":
+        assert {item["title"] for item in own} == {item["title"] for item in everyone} >= {"renamed todo"}
+
+
+def test_user_profile_update_invalidates_admin_reads(client, db, admin, alice):
+    client.get(f"/users/users/{alice.id}", headers=auth_headers(admin))
+    client.put(f"/auth/{alice.id}", headers=auth_headers(alice), json={"first_name": "Alicia"})
+
+    assert client.get(f"/users/users/{alice.id}", headers=auth_headers(admin)).json()["first_name"] == "Alicia"
+
+
+def test_deleting_a_user_drops_their_cached_todos(client, db, admin, alice):
+    add_todos(db, alice, 2)
+    client.get("/users/todos", headers=auth_headers(admin))
+
+    assert client.delete(f"/users/{alice.id}", headers=auth_headers(admin)).status_code == 204
+    assert client.get("/users/todos", headers=auth_headers(admin)).json()["items"] == []
+
+
+
+def test_cache_is_off_unless_configured():
+    assert settings.RESPONSE_CACHE_ENABLED is False
+
+
+def test_local_backend_is_refused_with_several_workers():
+    assert isinstance(build_cache_backend("local", 10, workers=1), LocalCacheBackend)
+    assert isinstance(build_cache_backend("postgres", 10, workers=4), PostgresCacheBackend)
+
+    with pytest.raises(ValueError):
+        build_cache_backend("local", 10, workers=4)
+
+
+def test_shared_backend_is_bypassed_until_its_listener_is_up():
+    cache = ResponseCache(PostgresCacheBackend(maxsize=10), ttl=None)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return {"rows": len(loads)}
+
+    cache.get_or_load("todos", [], loader)
+    cache.get_or_load("todos", [], loader)
+    assert len(loads) == 2
+
+    cache.backend._listening.set()
+    cache.get_or_load("todos", [], loader)
+    cache.get_or_load("todos", [], loader)
+    assert len(loads) == 3
+
+
+def test_shared_backend_broadcasts_invalidations(pg_engine):
+    conninfo = pg_engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    writer, reader = PostgresCacheBackend(maxsize=10), PostgresCacheBackend(maxsize=10)
+
+    for backend in (writer, reader):
+        backend.start(conninfo)
+
+    try:
+        deadline = time.monotonic() + 5
+
+        while not (writer.available() and reader.available()) and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        writer.incr("version:todos:1")
+
+        while reader.version("version:todos:1") == 0 and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert reader.version("version:todos:1") == 1
+    finally:
+        for backend in (writer, reader):
+            backend.stop()
@@ -0,0 +1,15 @@
+from tests.conftest import add_todos, auth_headers
+
+
+def test_search_matches_substrings_case_insensitively(client, db, admin, alice):
+    todos = add_todos(db, alice, 3)
+
+    response = client.get("/users/todos/search", headers=auth_headers(admin), params={"title": todos[1].title.upper()[-8:]})
+
+    assert [item["id"] for item in response.json()["items"]] == [todos[1].id]
+
+
+def test_search_treats_wildcards_literally(client, db, admin, alice):
+    add_todos(db, alice, 2)
+
+    assert client.get("/users/todos/search", headers=auth_headers(admin), params={"title": "%"}).status_code == 404
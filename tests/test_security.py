@@ -0,0 +1,118 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from src.core.hashing import PasswordHasher
+from src.core.security import bcrypt_context, jwt_claims_cache
+from tests.conftest import auth_headers
+
+
+def test_verified_token_claims_are_cached(client, alice):
+    headers = auth_headers(alice)
+
+    client.get(f"/todos/users/{alice.id}/todos", headers=headers)
+    hits = jwt_claims_cache.hits
+    client.get(f"/todos/users/{alice.id}/todos", headers=headers)
+
+    assert jwt_claims_cache.hits == hits + 1
+
+
+def test_invalid_token_is_rejected(client, alice):
+    assert client.get(f"/todos/users/{alice.id}/todos", headers={"Authorization": "Bearer nope"}).status_code == 401
+
+
+def test_hasher_round_trips_on_its_pool():
+    hasher = PasswordHasher(bcrypt_context, workers=2, queue_limit=2)
+
+    try:
+        hashed = hasher.hash("correct horse")
+
+        assert hasher.verify("correct horse", hashed)
+        assert not hasher.verify("wrong horse", hashed)
+        assert not hasher.dummy_verify("anything")
+    finally:
+        hasher.shutdown()
+
+
+def test_hasher_sheds_load_beyond_its_queue():
+    release = threading.Event()
+
+    class SlowContext:
+        def hash(self, secret):
+            release.wait(5)
+            return secret
+
+    hasher = PasswordHasher(SlowContext(), workers=1, queue_limit=1)
+
+    try:
+        futures = [hasher._submit(hasher.crypt_context.hash, "x") for _ in range(2)]
+
+        with pytest.raises(HTTPException) as error:
+            hasher._submit(hasher.crypt_context.hash, "x")
+
+        assert error.value.status_code == 503
+        assert hasher.rejected == 1
+    finally:
+        release.set()
+
+        for future in futures:
+            future.result()
+
+        hasher.shutdown()
+
+
+def test_hash_many_keeps_order_and_caps_jobs_in_flight():
+    lock = threading.Lock()
+    running = peak = 0
+
+    class CountingContext:
+        def hash(self, secret):
+            nonlocal running, peak
+
+            with lock:
+                running += 1
+                peak = max(peak, running)
+
+            threading.Event().wait(0.01)
+
+            with lock:
+                running -= 1
+
+            return secret.upper()
+
+        def verify(self, secret, hashed):
+            return secret == hashed
+
+    hasher = PasswordHasher(CountingContext(), workers=4, queue_limit=0)
+
+    try:
+        hasher.dummy_verify("warm up")
+        peak = 0
+
+        assert hasher.hash_many([f"p{index}" for index in range(12)]) == [f"P{index}" for index in range(12)]
+        assert peak <= 2
+    finally:
+        hasher.shutdown()
+
+
+
+def test_dummy_hash_is_computed_on_the_pool():
+    threads = []
+
+    class RecordingContext:
+        def hash(self, secret):
+            threads.append(threading.current_thread().name)
+            return secret
+
+        def verify(self, secret, hashed):
+            return secret == hashed
+
+    hasher = PasswordHasher(RecordingContext(), workers=1)
+
+    try:
+        assert asyncio.run(hasher.adummy_verify("anything")) is False
+        assert threads and all(name.startswith("bcrypt") for name in threads)
+    finally:
+        hasher.shutdown()
@@ -0,0 +1,32 @@
+import pytest
+
+from db.config import settings
+from tests.conftest import add_todos, add_user, auth_headers
+
+
+@pytest.fixture
+def fast_json(monkeypatch):
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+
+
+@pytest.mark.parametrize("path", ["/users/todos", "/users/users"])
+def test_fast_path_matches_validated_lists(client, db, admin, alice, monkeypatch, path):
+    add_todos(db, alice, 3)
+    add_user(db, "carolyn")
+
+    validated = client.get(path, headers=auth_headers(admin))
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = client.get(path, headers=auth_headers(admin))
+
+    assert fast.status_code == validated.status_code == 200
+    assert fast.json() == validated.json()
+
+
+def test_fast_path_keeps_list_headers(client, db, alice, fast_json):
+    add_todos(db, alice, 2)
+    url = f"/todos/users/{alice.id}/todos"
+
+    first = client.get(url, headers=auth_headers(alice))
+
+    assert len(first.json()["items"]) == 2
+    assert client.get(url, headers={**auth_headers(alice), "If-None-Match": first.headers["ETag"]}).status_code == 304
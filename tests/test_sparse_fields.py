@@ -0,0 +1,45 @@
+from tests.conftest import add_todos, auth_headers
+
+
+def test_list_returns_only_selected_fields(client, db, alice):
+    add_todos(db, alice, 3)
+    url = f"/todos/users/{alice.id}/todos"
+
+    first = client.get(url, headers=auth_headers(alice), params={"fields": "title,id", "limit": 2}).json()
+    second = client.get(url, headers=auth_headers(alice), params={"fields": "title,id", "limit": 2, "cursor": first["next_cursor"]}).json()
+
+    assert all(set(item) == {"id", "title"} for item in first["items"] + second["items"])
+    assert len({item["id"] for item in first["items"] + second["items"]}) == 3
+
+
+def test_unknown_or_empty_fields_are_rejected(client, alice):
+    url = f"/todos/users/{alice.id}/todos"
+
+    assert client.get(url, headers=auth_headers(alice), params={"fields": "title,password_hash"}).status_code == 400
+    assert client.get(url, headers=auth_headers(alice), params={"fields": ","}).status_code == 400
+
+
+def test_sparse_and_full_responses_do_not_share_etags(client, db, alice):
+    todo = add_todos(db, alice, 1)[0]
+    headers = auth_headers(alice)
+
+    full = client.get(f"/todos/{todo.id}", headers=headers)
+    sparse = client.get(f"/todos/{todo.id}", headers=headers, params={"fields": "deadline"})
+
+    assert sparse.json() == {"deadline": "2030-01-01"}
+    assert sparse.headers["etag"] != full.headers["etag"]
+
+
+def test_sparse_detail_keeps_the_access_check(client, db, alice, bob):
+    todo = add_todos(db, alice, 1)[0]
+
+    assert client.get(f"/todos/{todo.id}", headers=auth_headers(bob), params={"fields": "title"}).status_code == 403
+    assert client.get("/todos/9999", headers=auth_headers(bob), params={"fields": "title"}).status_code == 404
+
+
+def test_admin_user_reads_accept_fields(client, admin, alice):
+    users = client.get("/users/users", headers=auth_headers(admin), params={"fields": "username"}).json()["items"]
+    user = client.get(f"/users/users/{alice.id}", headers=auth_headers(admin), params={"fields": "email_address"}).json()
+
+    assert {item["username"] for item in users} == {"admin_user", "alice_smith"}
+    assert user == {"email_address": "alice_smith@example.com"}
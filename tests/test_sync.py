@@ -0,0 +1,65 @@
+import time
+from datetime import datetime, timedelta
+
+from src.core.tombstone_pruner import TombstonePruner
+from src.models.todo_model import TodoTombstones
+from src.repositories.todos_repository import TodoRepository
+from src.utils.helpers import encode_cursor
+from tests.conftest import add_todos, auth_headers
+
+
+def sync(client, user, since=None):
+    return client.get("/todos/changes", headers=auth_headers(user), params={} if since is None else {"since": since})
+
+
+def test_sync_returns_changes_and_deletes_since_the_watermark(client, db, alice):
+    first, second = add_todos(db, alice, 2)
+    headers = auth_headers(alice)
+
+    initial = sync(client, alice).json()
+    assert {item["id"] for item in initial["items"]} == {first.id, second.id}
+    assert initial["deleted"] == []
+
+    client.put(f"/todos/{first.id}", headers=headers, json={"is_completed": True})
+    client.delete(f"/todos/{second.id}", headers=headers)
+
+    delta = sync(client, alice, initial["watermark"]).json()
+    assert [item["id"] for item in delta["items"]] == [first.id]
+    assert "change_xid" not in delta["items"][0]
+    assert delta["deleted"] == [second.id]
+
+    assert sync(client, alice, delta["watermark"]).json()["items"] == []
+
+
+def test_writes_above_the_horizon_wait_for_the_next_sync(client, db, alice, monkeypatch):
+    todo = add_todos(db, alice, 1)[0]
+    horizon = todo.change_xid
+
+    monkeypatch.setattr(TodoRepository, "get_sync_horizon", staticmethod(lambda db: horizon))
+    held_back = sync(client, alice).json()
+    monkeypatch.undo()
+
+    assert held_back["items"] == []
+    assert [item["id"] for item in sync(client, alice, held_back["watermark"]).json()["items"]] == [todo.id]
+
+
+def test_expired_watermark_requires_a_resync(client, alice):
+    expired = encode_cursor([int(time.time()) - 31 * 86400, None, None])
+
+    assert sync(client, alice, expired).status_code == 410
+    assert sync(client, alice, "garbage").status_code == 400
+
+
+def test_pruner_drops_tombstones_past_retention(session_factory, db, alice):
+    now = datetime(2030, 6, 1)
+
+    db.add_all([
+        TodoTombstones(todo_id=1, owner_id=alice.id, deleted_at=now - timedelta(days=40)),
+        TodoTombstones(todo_id=2, owner_id=alice.id, deleted_at=now - timedelta(days=5)),
+    ])
+    db.commit()
+
+    pruner = TombstonePruner(session_factory, retention_days=30, batch_size=1, interval=3600)
+
+    assert pruner.run_once(now) == 1
+    assert [tombstone.todo_id for tombstone in db.query(TodoTombstones)] == [2]
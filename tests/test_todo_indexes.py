@@ -0,0 +1,98 @@
+"""EXPLAIN the repository's own queries against a seeded PostgreSQL database and
+check that each plan reads through the index meant for it."""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from tests.seed import SEED_USERS, SEED_TODOS, explain
+from src.repositories.todos_repository import (
+    TODO_RESPONSE_COLUMNS, user_todos_query, all_todos_query, search_todos_query, todo_columns,
+    todo_list_version_query, todo_changes_query,
+)
+from src.schemas.todos_schemas import TodoSearch
+from src.utils.helpers import encode_cursor
+
+
+USERS = 1000
+TODOS = 200_000
+
+ARCHIVE_OLD_COMPLETED = """
+    WITH moved AS (
+        DELETE FROM todos WHERE is_completed AND deadline < DATE '2026-04-01' RETURNING *
+    )
+    INSERT INTO todos_archive (id, title, deadline, description, priority, is_completed, owner_id, created_at, updated_at, change_xid)
+    SELECT id, title, deadline, description, priority, is_completed, owner_id, created_at, updated_at, change_xid FROM moved
+"""
+
+
+@pytest.fixture(scope="module")
+def seeded(pg_engine):
+    with pg_engine.connect() as connection:
+        transaction = connection.begin()
+
+        user_ids = connection.execute(text(SEED_USERS), {"users": USERS}).scalars().all()
+        connection.execute(text(SEED_TODOS), {"first_user": min(user_ids), "users": USERS, "start": 1, "stop": TODOS})
+        connection.execute(text(ARCHIVE_OLD_COMPLETED))
+        connection.execute(text("ANALYZE todos"))
+        connection.execute(text("ANALYZE todos_archive"))
+
+        with Session(bind=connection) as db:
+            yield db, user_ids[len(user_ids) // 2]
+
+        transaction.rollback()
+
+
+def assert_uses(plan: list[str], *indexes: str):
+    for index in indexes:
+        assert any(index in line and "Scan" in line for line in plan), "\n".join(plan)
+
+
+@pytest.mark.parametrize("cursor, is_completed, columns", [
+    (None, None, TODO_RESPONSE_COLUMNS),
+    (encode_cursor(["2026-06-01", 0]), None, TODO_RESPONSE_COLUMNS),
+    (None, None, todo_columns(("title",))),
+    (None, False, TODO_RESPONSE_COLUMNS),
+])
+def test_user_listing_reads_the_owner_index(seeded, cursor, is_completed, columns):
+    db, owner = seeded
+    query, _ = user_todos_query(owner, 50, cursor, is_completed, False, columns)
+
+    assert_uses(explain(db, query), "ix_todos_owner_")
+
+
+def test_archived_listing_reads_both_owner_indexes(seeded):
+    db, owner = seeded
+    query, _ = user_todos_query(owner, 50, encode_cursor(["2026-01-15", 0]), None, True)
+
+    assert_uses(explain(db, query), "ix_todos_owner_deadline", "ix_todos_archive_owner_deadline")
+
+
+def test_list_version_reads_the_owner_index(seeded):
+    db, owner = seeded
+
+    assert_uses(explain(db, todo_list_version_query(owner, None, False)), "ix_todos_owner_")
+
+
+def test_delta_sync_reads_the_change_index(seeded):
+    db, owner = seeded
+    horizon = 2 ** 62
+
+    assert_uses(explain(db, todo_changes_query(owner, [horizon - 100, 0], 500, horizon)), "ix_todos_owner_change")
+
+
+def test_admin_listing_walks_the_primary_key(seeded):
+    db, _ = seeded
+    query, _ = all_todos_query(50, encode_cursor([150_000]), False)
+
+    assert_uses(explain(db, query), "todos_pkey")
+
+
+@pytest.mark.parametrize("search, index", [
+    (TodoSearch(title="a1b2"), "ix_todos_title_trgm"),
+    (TodoSearch(description="c0de"), "ix_todos_description_trgm"),
+])
+def test_substring_search_reads_the_trigram_index(seeded, search, index):
+    db, _ = seeded
+    query, _ = search_todos_query(search, 50, None, False)
+
+    assert_uses(explain(db, query), index)
@@ -0,0 +1,26 @@
+from datetime import date, timedelta
+
+from tests.conftest import add_todos, auth_headers
+
+
+def test_stats_count_by_status_and_deadline(client, db, alice, bob):
+    today = date.today()
+    add_todos(db, alice, 2, deadline=today - timedelta(days=5))
+    add_todos(db, alice, 1, is_completed=True, deadline=today + timedelta(days=60))
+    add_todos(db, bob, 4)
+
+    stats = client.get(f"/todos/users/{alice.id}/todos/stats", headers=auth_headers(alice)).json()
+
+    assert stats["total"] == 3
+    assert stats["by_status"] == {"completed": 1, "open": 2}
+    assert stats["by_deadline"]["overdue"] == 2
+    assert stats["by_deadline"]["later"] == 1
+    assert sum(group["count"] for group in stats["groups"]) == 3
+
+
+def test_admin_stats_cover_every_user(client, db, admin, alice, bob):
+    add_todos(db, alice, 2)
+    add_todos(db, bob, 3)
+
+    assert client.get("/users/todos/stats", headers=auth_headers(admin)).json()["total"] == 5
+    assert client.get("/users/todos/stats", headers=auth_headers(alice)).status_code == 403
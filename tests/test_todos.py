@@ -0,0 +1,85 @@
+from tests.conftest import add_todos, auth_headers
+
+
+NEW_TODO = {
+    "title": "write tests",
+    "deadline": "2030-06-01",
+    "description": "cover the headline behaviour",
+    "priority": "high",
+    "is_completed": False,
+}
+
+
+def test_owner_reads_updates_and_deletes_a_todo(client, db, alice):
+    todo = add_todos(db, alice, 1)[0]
+    headers = auth_headers(alice)
+
+    assert client.get(f"/todos/{todo.id}", headers=headers).json()["title"] == todo.title
+    assert client.put(f"/todos/{todo.id}", headers=headers, json={"is_completed": True}).json()["is_completed"] is True
+    assert client.delete(f"/todos/{todo.id}", headers=headers).status_code == 204
+    assert client.get(f"/todos/{todo.id}", headers=headers).status_code == 404
+
+
+def test_other_users_todo_is_forbidden_not_missing(client, db, alice, bob):
+    todo = add_todos(db, alice, 1)[0]
+    headers = auth_headers(bob)
+
+    assert client.get(f"/todos/{todo.id}", headers=headers).status_code == 403
+    assert client.put(f"/todos/{todo.id}", headers=headers, json={"is_completed": True}).status_code == 403
+    assert client.delete(f"/todos/{todo.id}", headers=headers).status_code == 403
+
+    assert client.put("/todos/9999", headers=headers, json={"is_completed": True}).status_code == 404
+    assert client.delete("/todos/9999", headers=headers).status_code == 404
+
+
+def test_admin_can_act_on_any_todo(client, db, admin, alice):
+    todo = add_todos(db, alice, 1)[0]
+
+    assert client.put(f"/todos/{todo.id}", headers=auth_headers(admin), json={"is_completed": True}).status_code == 200
+
+
+def test_duplicate_title_and_deadline_conflicts(client, alice):
+    headers = auth_headers(alice)
+
+    assert client.post("/todos", headers=headers, json=NEW_TODO).status_code == 201
+    assert client.post("/todos", headers=headers, json=NEW_TODO).status_code == 409
+
+
+def test_bulk_endpoints_report_what_they_touched(pg_client, pg_db, pg_alice, pg_bob):
+    own = add_todos(pg_db, pg_alice, 2)
+    other = add_todos(pg_db, pg_bob, 1)[0]
+    headers = auth_headers(pg_alice)
+
+    created = pg_client.post("/todos/bulk", headers=headers, json={"items": [NEW_TODO, {**NEW_TODO, "title": "second"}]})
+    assert created.status_code == 200
+    assert len(created.json()["created"]) == 2
+
+    own_ids = sorted(todo.id for todo in own)
+    ids = own_ids + [other.id, 9999]
+
+    updated = pg_client.patch("/todos/bulk", headers=headers, json={"ids": ids, "changes": {"is_completed": True}}).json()
+    assert updated == {"succeeded": own_ids, "not_found": sorted([other.id, 9999])}
+
+    deleted = pg_client.post("/todos/bulk/delete", headers=headers, json={"ids": ids}).json()
+    assert deleted["succeeded"] == own_ids
+    assert pg_client.get(f"/todos/{other.id}", headers=auth_headers(pg_bob)).status_code == 200
+
+
+def test_bulk_create_rejects_bad_items_and_keeps_the_rest(pg_client, pg_admin, pg_alice):
+    items = [
+        {**NEW_TODO, "owner_id": pg_alice.id},
+        {**NEW_TODO, "title": "no description", "description": None, "owner_id": pg_alice.id},
+        {**NEW_TODO, "title": "unknown owner", "owner_id": 9_999_999},
+        {**NEW_TODO, "owner_id": pg_alice.id},
+    ]
+
+    response = pg_client.post("/users/todos/bulk", headers=auth_headers(pg_admin), json={"items": items})
+    body = response.json()
+
+    assert response.status_code == 200
+    assert [todo["title"] for todo in body["created"]] == [NEW_TODO["title"]]
+    assert [conflict["index"] for conflict in body["conflicts"]] == [3]
+    assert body["rejected"] == [
+        {"index": 1, "reason": "description: Field required"},
+        {"index": 2, "reason": "unknown owner_id"},
+    ]